@@ -0,0 +1,42 @@
+"""Structured key=value logging shared by the bridge, orchestrator and tracer.
+
+Each module gets its own named logger (agent.bridge, agent.orchestrator,
+agent.trace) but one line format and one `kv` renderer, so every line stays
+parseable the same way. Level from LOG_LEVEL (default INFO). Never logs
+secrets — callers pass names/presence only.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """A stdout logger in the shared `ts=… level=… logger=…` format (idempotent)."""
+    logger = logging.getLogger(name)
+    level_name = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+    logger.setLevel(getattr(logging, level_name, logging.INFO))
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("ts=%(asctime)s level=%(levelname)s logger=%(name)s %(message)s")
+        )
+        logger.addHandler(handler)
+    logger.propagate = False  # don't double-log through the root handler
+    return logger
+
+
+def kv(**fields: object) -> str:
+    """Render context fields as a `key=value` suffix. None values are dropped and
+    values with whitespace/`=`/quotes/backslashes are JSON-quoted so each line
+    stays one parseable line."""
+    parts: list[str] = []
+    for key, value in fields.items():
+        if value is None:
+            continue
+        text = str(value)
+        if text == "" or any(ch.isspace() or ch in '="\\' for ch in text):
+            text = json.dumps(text, ensure_ascii=False)
+        parts.append(f"{key}={text}")
+    return " ".join(parts)
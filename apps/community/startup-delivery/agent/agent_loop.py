@@ -23,6 +23,13 @@ can never push a bad event to the UI. Each tool call also emits a NEW, optional
 `step` event narrating the agent's live activity (e.g. "Checking 5 names on
 name.com…") for demo flair — additive, ignored by any client that doesn't listen.
 
+LATENCY: the loop overlaps what it safely can. Recon starts SPECULATIVELY while
+the first model call is in flight (the prompt always opens with
+nimble_research), and independent evidence tools requested in one turn (e.g.
+namecom_check + namecom_suggest) run concurrently, their results appended in the
+order the model asked for them. Milestones always run one at a time, in order.
+Each turn closes with a `step` event carrying its model/tool timings.
+
 SAFETY: this module never weakens the demo. It enforces a step budget and a
 wall-clock budget; on exhaustion (or any other failure) it raises, and the
 orchestrator wrapper falls back to the guaranteed deterministic pipeline. The
@@ -33,11 +40,14 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from dataclasses import dataclass, field
 from typing import Any
 
-from . import deliveries_store, orchestrator, verify
+from . import deliveries_store, orchestrator, telemetry, verify
 from .clients import _openrouter, llm, namecom, nimble
 from .landing import publish_landing_page
 from .schemas import (
@@ -56,6 +66,9 @@ MAX_STEPS = int(os.getenv("AGENT_LOOP_MAX_STEPS", "8"))          # LLM round-tri
 WALL_CLOCK_BUDGET_S = float(os.getenv("AGENT_LOOP_BUDGET_S", "40"))  # seconds
 # The configured agent model. Haiku is fast + cheap enough for an 8-step loop.
 MODEL = os.getenv("AGENT_LOOP_MODEL", "anthropic/claude-haiku-4.5")
+# Worker threads for one loop: the speculative recon plus a turn's concurrent
+# evidence tools.
+MAX_PARALLEL_TOOLS = int(os.getenv("AGENT_LOOP_PARALLEL_TOOLS", "4"))
 
 _VALID_CALLS = ("build", "pivot", "pass")
 
@@ -90,6 +103,9 @@ class _State:
     # One soft grounding-retry is offered per milestone before we accept anyway.
     gap_verify_retried: bool = False
     verdict_verify_retried: bool = False
+    # Speculative recon started before the first model turn (see run_agent_loop).
+    recon_future: Future | None = None
+    recon_lock: threading.Lock = field(default_factory=threading.Lock)
 
 
 def _emit(on_event: orchestrator.EventSink, kind: str, data: dict) -> None:
@@ -103,17 +119,21 @@ def _step(
     *,
     detail: str | None = None,
     ok: bool = True,
+    timing: dict[str, Any] | None = None,
 ) -> None:
     """Emit the NEW, optional narration event for live agent activity.
 
     Richer shape: {"label": str, "tool": str|None, "detail": str|None, "ok": bool}
-    so the UI can render a scrolling timeline of step events. Additive — clients
+    so the UI can render a scrolling timeline of step events. Per-turn summaries
+    add a `timing` dict (modelMs / toolsMs / tools / parallel). Additive — clients
     that don't listen for `step` simply never see it, so the happy-path contract
     is intact. The server forwards any SSE kind generically.
     """
     payload: dict[str, Any] = {"label": label, "tool": tool, "ok": ok}
     if detail is not None:
         payload["detail"] = detail
+    if timing is not None:
+        payload["timing"] = timing
     _emit(on_event, "step", payload)
 
 
@@ -375,9 +395,15 @@ def _coerce_candidates(rows: Any) -> list[NameCandidate]:
 
 
 def _ensure_recon(state: _State, on_event: orchestrator.EventSink) -> ReconResult:
-    if state.recon is None:
-        state.recon = nimble.research_idea(state.idea)
-    return state.recon
+    with state.recon_lock:  # concurrent tool calls share ONE recon
+        if state.recon is None and state.recon_future is not None:
+            # Adopt the speculative recon. A failed one is dropped (and re-raised,
+            # as a direct call would have), so a retried nimble_research starts fresh.
+            future, state.recon_future = state.recon_future, None
+            state.recon = future.result()
+        if state.recon is None:
+            state.recon = nimble.research_idea(state.idea)
+        return state.recon
 
 
 def _t_nimble_research(args: dict, state: _State, on_event: orchestrator.EventSink) -> dict:
@@ -599,23 +625,87 @@ _HANDLERS = {
 
 
 def _dispatch(name: str, raw_args: str, state: _State, on_event: orchestrator.EventSink) -> dict:
+    result = _call_tool(name, raw_args, state, on_event)
+    _emit_tool_step(name, result, on_event)
+    return result
+
+
+def _call_tool(name: str, raw_args: str, state: _State, on_event: orchestrator.EventSink) -> dict:
+    """Run one tool call to a result dict (errors included). Emits no `step`."""
     handler = _HANDLERS.get(name)
     if handler is None:
-        result = {"error": f"unknown tool {name!r}"}
-        _emit_tool_step(name, result, on_event)
-        return result
+        return {"error": f"unknown tool {name!r}"}
     try:
         args = json.loads(raw_args) if raw_args else {}
     except (json.JSONDecodeError, TypeError):
         args = {}
     if not isinstance(args, dict):
         args = {}
-    try:
-        result = handler(args, state, on_event)
-    except Exception as exc:  # surface to the model so it can adapt within budget
-        result = {"error": f"{name} failed: {exc}"}
-    _emit_tool_step(name, result, on_event)
-    return result
+    with telemetry.span(f"tool.{name}") as attrs:
+        try:
+            result = handler(args, state, on_event)
+        except Exception as exc:  # surface to the model so it can adapt within budget
+            result = {"error": f"{name} failed: {exc}"}
+        if isinstance(result, dict) and result.get("error"):
+            attrs["error"] = "tool_error"
+        return result
+
+
+# Evidence tools that only READ the loop state (nimble_research fills the recon
+# exactly once, via the speculative future) and emit no milestone, so calls from
+# one turn can run side by side. The naming tools need the recon, so they only
+# join a concurrent batch once it's already in hand.
+_INDEPENDENT_TOOLS = {"nimble_research", "namecom_check", "namecom_suggest"}
+_RECON_READERS = {"propose_names", "more_names"}
+
+
+def _independent(name: str, state: _State) -> bool:
+    return name in _INDEPENDENT_TOOLS or (name in _RECON_READERS and state.recon is not None)
+
+
+def _run_turn(
+    tool_calls: list[Any],
+    state: _State,
+    on_event: orchestrator.EventSink,
+    pool: ThreadPoolExecutor,
+    deadline: float,
+) -> tuple[list[dict], int]:
+    """Run one turn's tool calls; results (and `step` events) in call order.
+
+    Consecutive independent calls are batched onto the pool; anything else —
+    milestones, unknown tools — runs alone, in order, after the batch before it
+    has finished. Returns (results, largest batch size). A batch still running at
+    the wall-clock deadline raises AgentLoopError (the orchestrator falls back).
+    """
+    results: list[dict] = []
+    widest = 0
+    i = 0
+    while i < len(tool_calls):
+        j = i + 1
+        if _independent(tool_calls[i].function.name, state):
+            while j < len(tool_calls) and _independent(tool_calls[j].function.name, state):
+                j += 1
+        batch = tool_calls[i:j]
+        widest = max(widest, len(batch))
+        if len(batch) == 1:
+            tc = batch[0]
+            results.append(_dispatch(tc.function.name, tc.function.arguments or "{}", state, on_event))
+        else:
+            futures = [
+                pool.submit(
+                    telemetry.bind(_call_tool), tc.function.name, tc.function.arguments or "{}", state, on_event
+                )
+                for tc in batch
+            ]
+            for tc, future in zip(batch, futures):
+                try:
+                    result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeout:
+                    raise AgentLoopError("wall-clock budget exceeded") from None
+                _emit_tool_step(tc.function.name, result, on_event)
+                results.append(result)
+        i = j
+    return results, widest
 
 
 def _emit_tool_step(name: str, result: dict, on_event: orchestrator.EventSink) -> None:
@@ -747,10 +837,19 @@ def run_agent_loop(
     exhaustion; the orchestrator wrapper catches it and falls back to the
     deterministic pipeline, so this is never user-visible.
     """
+    tracking_id = (tracking_id or "").strip() or orchestrator._tracking_id()
+    with telemetry.trace(tracking_id), telemetry.span("agent_loop"):
+        return _run_agent_loop(
+            idea, build_landing=build_landing, on_event=on_event, tracking_id=tracking_id
+        )
+
+
+def _run_agent_loop(
+    idea: str, *, build_landing: bool, on_event: orchestrator.EventSink, tracking_id: str
+) -> DeliveryPackage:
     idea = orchestrator._normalize_idea(idea)
     deadline = time.monotonic() + WALL_CLOCK_BUDGET_S
 
-    tracking_id = (tracking_id or "").strip() or orchestrator._tracking_id()
     _emit(on_event, "start", {"idea": idea, "trackingId": tracking_id})
 
     # Cross-idea learning: same inputs the deterministic path uses, so the agent
@@ -785,11 +884,45 @@ def run_agent_loop(
     ]
     tools = _tool_specs()
 
-    for _ in range(MAX_STEPS):
+    pool = ThreadPoolExecutor(max_workers=max(1, MAX_PARALLEL_TOOLS), thread_name_prefix="agent-tool")
+    try:
+        # The prompt always opens with nimble_research, so start it now and let it
+        # overlap the first model round-trip; _ensure_recon adopts the result.
+        state.recon_future = pool.submit(telemetry.bind(nimble.research_idea), idea)
+        _drive(state, messages, tools, pool, deadline, on_event)
+    finally:
+        # Never wait on stragglers (a recon the model never asked for, a batch cut
+        # off by the budget): they finish or fail on their own.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if state.pick is None or state.recon is None:
+        raise AgentLoopError("agent loop did not secure a domain within budget")
+
+    # Guarantee a verdict rides out even if the model skipped submit_verdict.
+    if not state.verdict_emitted:
+        state.verdict = llm.assess_opportunity(state.recon, niche_intel=state.niche_intel)
+        _emit(on_event, "verdict", {"verdict": state.verdict})
+        state.verdict_emitted = True
+
+    return _finalize(state, tracking_id, build_landing, on_event)
+
+
+def _drive(
+    state: _State,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]],
+    pool: ThreadPoolExecutor,
+    deadline: float,
+    on_event: orchestrator.EventSink,
+) -> None:
+    """The model <-> tools turns, until a winner is secured or MAX_STEPS runs out."""
+    for turn in range(1, MAX_STEPS + 1):
         if time.monotonic() > deadline:
             raise AgentLoopError("wall-clock budget exceeded")
 
+        started = time.monotonic()
         msg = _openrouter.chat_with_tools(messages, tools, model=MODEL, temperature=0.3)
+        model_ms = int((time.monotonic() - started) * 1000)
         messages.append(_assistant_message_dict(msg))
 
         tool_calls = getattr(msg, "tool_calls", None) or []
@@ -806,22 +939,20 @@ def run_agent_loop(
             )
             continue
 
-        for tc in tool_calls:
-            result = _dispatch(tc.function.name, tc.function.arguments or "{}", state, on_event)
+        tools_started = time.monotonic()
+        results, widest = _run_turn(tool_calls, state, on_event, pool, deadline)
+        tools_ms = int((time.monotonic() - tools_started) * 1000)
+        for tc, result in zip(tool_calls, results):
             messages.append(
                 {"role": "tool", "tool_call_id": tc.id, "content": json.dumps(result)}
             )
+        _step(
+            on_event,
+            f"Turn {turn} done",
+            "agent",
+            detail=f"model {model_ms / 1000:.1f}s · {len(tool_calls)} tools {tools_ms / 1000:.1f}s",
+            timing={"modelMs": model_ms, "toolsMs": tools_ms, "tools": len(tool_calls), "parallel": widest},
+        )
 
         if state.pick is not None:
             break
-
-    if state.pick is None or state.recon is None:
-        raise AgentLoopError("agent loop did not secure a domain within budget")
-
-    # Guarantee a verdict rides out even if the model skipped submit_verdict.
-    if not state.verdict_emitted:
-        state.verdict = llm.assess_opportunity(state.recon, niche_intel=state.niche_intel)
-        _emit(on_event, "verdict", {"verdict": state.verdict})
-        state.verdict_emitted = True
-
-    return _finalize(state, tracking_id, build_landing, on_event)
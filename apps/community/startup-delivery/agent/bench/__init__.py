@@ -0,0 +1,5 @@
+"""Offline, deterministic performance benchmark for the delivery pipeline.
+
+Run with: `python -m agent.bench` (no network: Nimble, name.com and OpenRouter
+are served by a local stub built from `fixtures.json`). See __main__ for flags.
+"""
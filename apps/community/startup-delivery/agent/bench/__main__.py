@@ -0,0 +1,309 @@
+"""Offline benchmark for `deliver_startup` and `run_agent_loop`.
+
+The eval package checks that the pipeline is RIGHT; this measures how FAST it is,
+reproducibly and without network access, so a regression in recon fan-out, cache
+hit rate or event throughput shows up as a number that can be diffed across
+commits.
+
+How it works:
+  - a local HTTP stub (agent/bench/stub.py) stands in for Nimble, name.com and
+    OpenRouter, serving canned responses from fixtures.json with a configurable
+    per-provider latency and error-injection rate (seeded);
+  - the REAL clients are pointed at it (base URLs only), so connection pooling,
+    retries, the Nimble governor, the paid-API cache and the LLM cache are all
+    exercised exactly as in production;
+  - each pipeline runs `--warmup` untimed + `--runs` timed deliveries of the
+    same idea, each against a fresh deliveries log. `--cache cold` (default)
+    empties the paid-API cache before every run; `--cache warm` keeps it;
+  - every run records wall time, the time each milestone event (see / think /
+    verdict / secured / build) arrived, the events emitted, and the requests
+    each provider served.
+
+Output is ONE JSON document (stdout, or --out PATH): per pipeline, p50/p95 wall
+and per-stage times, requests per provider, event throughput, cache hit ratios
+over the timed runs, and the process's peak RSS. Exit status is 1 when any
+timed run failed.
+
+Usage:
+    python -m agent.bench [--runs 5] [--warmup 1] [--pipeline both]
+                          [--cache cold|warm] [--latency nimble=150,openrouter=400]
+                          [--errors nimble=0.05] [--landing] [--out bench.json]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from .stub import PROVIDERS, StubServer, load_fixtures
+
+# Milestone event -> the stage that ENDS when it arrives. The stage after the
+# last milestone (suggestions, launch kit, strategy, landing, log write) is
+# reported as "finish".
+_STAGES = {
+    "see": "recon",
+    "think": "naming",
+    "verdict": "verdict",
+    "secured": "check",
+    "build": "strategy",
+}
+
+_DEFAULT_LATENCY = "nimble=150,namecom=80,openrouter=400"
+
+
+def _parse_pairs(text: str, *, flag: str) -> dict[str, float]:
+    """"nimble=150,openrouter=400" -> {"nimble": 150.0, "openrouter": 400.0}."""
+    out: dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in (text or "").split(","))):
+        name, sep, value = part.partition("=")
+        if not sep or name.strip() not in PROVIDERS:
+            raise SystemExit(f"{flag}: expected provider=value with provider in {PROVIDERS}, got {part!r}")
+        out[name.strip()] = float(value)
+    return out
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (no interpolation, so it's an observed value)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _summary(values: list[float]) -> dict[str, Any] | None:
+    if not values:
+        return None
+    return {
+        "n": len(values),
+        "min": round(min(values), 1),
+        "p50": round(_percentile(values, 50), 1),
+        "p95": round(_percentile(values, 95), 1),
+        "max": round(max(values), 1),
+        "mean": round(sum(values) / len(values), 1),
+    }
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _delta(after: dict[str, Any], before: dict[str, Any]) -> dict[str, Any]:
+    """Counter deltas only: ratios and configured TTLs aren't additive."""
+    return {
+        k: after[k] - before.get(k, 0)
+        for k, v in after.items()
+        if isinstance(v, (int, float)) and not isinstance(v, bool)
+        and not k.endswith(("Ratio", "Seconds"))
+    }
+
+
+def _isolate(workdir: Path, stub_url: str) -> None:
+    """Point every store at `workdir` and every provider at the stub. Must run
+    BEFORE the agent modules are imported (the cache dir is fixed at import)."""
+    os.environ.update(
+        {
+            "CACHE_DIR": str(workdir / "cache"),
+            "DELIVERIES_LOG": str(workdir / "deliveries.jsonl"),
+            "OUTCOMES_LOG": str(workdir / "outcomes.jsonl"),
+            "LANDING_OUTPUT_DIR": str(workdir / "landing"),
+            "NIMBLE_API_KEY": "bench",
+            "NAMECOM_USERNAME": "bench-test",
+            "NAMECOM_API_TOKEN": "bench",
+            "NAMECOM_API_BASE": f"{stub_url}/namecom",
+            "OPENROUTER_API_KEY": "bench",
+            "AGENT_LOOP": "0",
+            "NICHE_EMBEDDINGS": "0",
+            "LOG_LEVEL": os.environ.get("LOG_LEVEL", "WARNING"),
+        }
+    )
+    from ..clients import _openrouter, nimble
+
+    nimble.SERP_URL = f"{stub_url}/nimble/serp"
+    nimble.EXTRACT_URL = f"{stub_url}/nimble/extract"
+    _openrouter.BASE_URL = f"{stub_url}/openrouter/v1"
+
+
+def _run_once(pipeline: str, idea: str, *, landing: bool) -> dict[str, Any]:
+    """One delivery; returns its wall time, milestone offsets and event count."""
+    from .. import orchestrator
+    from ..agent_loop import run_agent_loop
+
+    events: list[tuple[float, str]] = []
+    started = time.perf_counter()
+
+    def on_event(kind: str, data: dict) -> None:
+        events.append((time.perf_counter(), kind))
+
+    error: str | None = None
+    try:
+        if pipeline == "agent":
+            run_agent_loop(idea, build_landing=landing, on_event=on_event)
+        else:
+            orchestrator.deliver_startup(idea, build_landing=landing, on_event=on_event)
+    except Exception as exc:  # a failed run is reported, not fatal to the bench
+        error = repr(exc)
+    ended = time.perf_counter()
+
+    stages: dict[str, float] = {}
+    mark = started
+    for at, kind in events:
+        stage = _STAGES.get(kind)
+        if stage is not None and stage not in stages:
+            stages[stage] = (at - mark) * 1000
+            mark = at
+    if error is None:
+        stages["finish"] = (ended - mark) * 1000
+    wall_s = ended - started
+    return {
+        "error": error,
+        "wallMs": wall_s * 1000,
+        "firstEventMs": (events[0][0] - started) * 1000 if events else None,
+        "stagesMs": stages,
+        "events": len(events),
+        "eventsPerSecond": len(events) / wall_s if wall_s > 0 else 0.0,
+    }
+
+
+def _bench_pipeline(
+    pipeline: str, stub: StubServer, workdir: Path, args: argparse.Namespace, idea: str
+) -> dict[str, Any]:
+    from ..clients import _cache, _openrouter, namecom
+
+    timed: list[dict[str, Any]] = []
+    requests: dict[str, list[float]] = {p: [] for p in PROVIDERS}
+    injected = {p: 0 for p in PROVIDERS}
+    cache_before = llm_before = namecom_before = None
+    for i in range(args.warmup + args.runs):
+        if args.cache == "cold":
+            _cache.clear()
+        # A fresh deliveries log per run: cross-idea learning would otherwise
+        # steer every later run away from the names the earlier ones shipped.
+        os.environ["DELIVERIES_LOG"] = str(workdir / f"deliveries-{pipeline}-{i}.jsonl")
+        if i == args.warmup:
+            cache_before = _cache.stats()
+            llm_before = _openrouter.cache_stats()
+            namecom_before = namecom.availability_cache_stats()
+        before = stub.counters()
+        result = _run_once(pipeline, idea, landing=args.landing)
+        after = stub.counters()
+        if i < args.warmup:
+            continue
+        result["run"] = i - args.warmup
+        timed.append(result)
+        for p in PROVIDERS:
+            requests[p].append(after[p]["requests"] - before[p]["requests"])
+            injected[p] += after[p]["errors"] - before[p]["errors"]
+
+    ok = [r for r in timed if r["error"] is None]
+    cache = _delta(_cache.stats(), cache_before or {})
+    served = cache.get("memoryHits", 0) + cache.get("hits", 0)
+    lookups = served + cache.get("misses", 0)
+    stage_names = list(dict.fromkeys([s for r in ok for s in r["stagesMs"]]))
+    return {
+        "runs": len(timed),
+        "ok": len(ok),
+        "failures": [{"run": r["run"], "error": r["error"]} for r in timed if r["error"]],
+        "wallMs": _summary([r["wallMs"] for r in ok]),
+        "firstEventMs": _summary([r["firstEventMs"] for r in ok if r["firstEventMs"] is not None]),
+        "stagesMs": {s: _summary([r["stagesMs"][s] for r in ok if s in r["stagesMs"]]) for s in stage_names},
+        "requests": {
+            p: {**(_summary(requests[p]) or {}), "total": int(sum(requests[p])), "injectedErrors": injected[p]}
+            for p in PROVIDERS
+        },
+        "events": {
+            "perRun": _summary([float(r["events"]) for r in ok]),
+            "perSecond": _summary([r["eventsPerSecond"] for r in ok]),
+        },
+        "cache": {
+            "hitRatio": round(served / lookups, 4) if lookups else None,
+            "hits": served,
+            "misses": cache.get("misses", 0),
+            "coalesced": cache.get("coalesced", 0),
+        },
+        "llmCache": _delta(_openrouter.cache_stats(), llm_before or {}),
+        "namecomCache": _delta(namecom.availability_cache_stats(), namecom_before or {}),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="agent.bench",
+        description="Offline benchmark of the delivery pipeline against a local provider stub.",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="timed runs per pipeline (default 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs first (default 1)")
+    parser.add_argument("--pipeline", choices=("deterministic", "agent", "both"), default="both")
+    parser.add_argument(
+        "--cache", choices=("cold", "warm"), default="cold",
+        help="cold: empty the paid-API cache before every run; warm: keep it",
+    )
+    parser.add_argument(
+        "--latency", default=_DEFAULT_LATENCY,
+        help=f"per-provider stub latency in ms (default {_DEFAULT_LATENCY})",
+    )
+    parser.add_argument("--errors", default="", help="per-provider injected error rate, e.g. nimble=0.05")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of injected errors")
+    parser.add_argument("--seed", type=int, default=0, help="error-injection RNG seed")
+    parser.add_argument("--landing", action="store_true", help="also build the landing page")
+    parser.add_argument("--idea", default=None, help="idea to deliver (default: the fixtures' idea)")
+    parser.add_argument("--fixtures", type=Path, default=None, help="alternate fixtures.json")
+    parser.add_argument("--out", type=Path, default=None, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    fixtures = load_fixtures(args.fixtures)
+    idea = args.idea or fixtures["idea"]
+    latency = _parse_pairs(args.latency, flag="--latency")
+    errors = _parse_pairs(args.errors, flag="--errors")
+    pipelines = ("deterministic", "agent") if args.pipeline == "both" else (args.pipeline,)
+
+    with tempfile.TemporaryDirectory(prefix="agent-bench-") as tmp, StubServer(
+        fixtures, latency_ms=latency, error_rate=errors, error_status=args.error_status, seed=args.seed
+    ) as stub:
+        workdir = Path(tmp)
+        _isolate(workdir, stub.url)
+        started = time.perf_counter()
+        # The pipeline prints diagnostics; keep stdout for the report alone.
+        with contextlib.redirect_stdout(sys.stderr):
+            results = {p: _bench_pipeline(p, stub, workdir, args, idea) for p in pipelines}
+        elapsed = time.perf_counter() - started
+
+    report = {
+        "config": {
+            "idea": idea,
+            "runs": args.runs,
+            "warmup": args.warmup,
+            "cache": args.cache,
+            "latencyMs": latency,
+            "errorRate": errors,
+            "errorStatus": args.error_status,
+            "seed": args.seed,
+            "landing": args.landing,
+            "python": platform.python_version(),
+        },
+        "pipelines": results,
+        "elapsedS": round(elapsed, 2),
+        "peakRssMb": _peak_rss_mb(),
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 1 if any(r["failures"] for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
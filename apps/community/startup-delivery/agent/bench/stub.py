@@ -0,0 +1,283 @@
+"""A local HTTP stand-in for Nimble, name.com and OpenRouter, for agent.bench.
+
+The real clients talk to it over real HTTP (pooled sessions, retry adapters,
+the Nimble governor and the OpenAI client all stay in the loop); only the base
+URLs are pointed here. Every response is built from `fixtures.json`, so a run is
+fully offline and — given the same fixtures, seed and knobs — repeatable.
+
+Routes (all POST):
+  /nimble/serp, /nimble/extract
+  /namecom/core/v1/domains:checkAvailability, /namecom/v4/domains:checkAvailability
+  /namecom/v4/domains:searchStream                      (NDJSON)
+  /openrouter/v1/chat/completions, /openrouter/v1/embeddings
+
+Per provider the stub adds a fixed latency and injects errors at a given rate
+(HTTP `error_status`, default 503) from a seeded RNG, and counts requests,
+injected errors and bytes served so the bench can report them per run.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+PROVIDERS = ("nimble", "namecom", "openrouter")
+
+_FIXTURES_PATH = Path(__file__).resolve().parent / "fixtures.json"
+
+
+def load_fixtures(path: Path | None = None) -> dict[str, Any]:
+    return json.loads((path or _FIXTURES_PATH).read_text(encoding="utf-8"))
+
+
+def _h(text: str) -> int:
+    """Stable across processes (unlike hash())."""
+    return int(hashlib.md5(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+class StubServer:
+    """Threaded stub on 127.0.0.1:<ephemeral>. Use as a context manager."""
+
+    def __init__(
+        self,
+        fixtures: dict[str, Any],
+        *,
+        latency_ms: dict[str, float] | None = None,
+        error_rate: dict[str, float] | None = None,
+        error_status: int = 503,
+        seed: int = 0,
+    ) -> None:
+        self.fixtures = fixtures
+        self.latency_ms = {p: float((latency_ms or {}).get(p, 0.0)) for p in PROVIDERS}
+        self.error_rate = {p: float((error_rate or {}).get(p, 0.0)) for p in PROVIDERS}
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counters = {p: {"requests": 0, "errors": 0, "bytes": 0} for p in PROVIDERS}
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    # -- lifecycle ---------------------------------------------------------------
+    def __enter__(self) -> "StubServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real providers
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server API
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw or b"{}")
+                except json.JSONDecodeError:
+                    body = {}
+                status, payload, ctype = stub.handle(self.path, body)
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="bench-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {p: dict(c) for p, c in self._counters.items()}
+
+    # -- dispatch ----------------------------------------------------------------
+    def handle(self, path: str, body: dict[str, Any]) -> tuple[int, bytes, str]:
+        provider = path.strip("/").split("/", 1)[0]
+        if provider not in PROVIDERS:
+            return 404, b'{"error": "unknown route"}', "application/json"
+        with self._lock:
+            self._counters[provider]["requests"] += 1
+            inject = self._rng.random() < self.error_rate[provider]
+            if inject:
+                self._counters[provider]["errors"] += 1
+        if self.latency_ms[provider]:
+            time.sleep(self.latency_ms[provider] / 1000.0)
+        if inject:
+            return self.error_status, b'{"error": "injected by agent.bench"}', "application/json"
+        route = getattr(self, "_" + provider)
+        status, payload, ctype = route(path, body)
+        with self._lock:
+            self._counters[provider]["bytes"] += len(payload)
+        return status, payload, ctype
+
+    @staticmethod
+    def _json(obj: Any) -> tuple[int, bytes, str]:
+        return 200, json.dumps(obj).encode("utf-8"), "application/json"
+
+    # -- Nimble ------------------------------------------------------------------
+    def _nimble(self, path: str, body: dict[str, Any]) -> tuple[int, bytes, str]:
+        fx = self.fixtures["nimble"]
+        if path.endswith("/extract"):
+            url = str(body.get("url") or "")
+            host = url.split("//", 1)[-1].split("/", 1)[0].removeprefix("www.")
+            markdown = fx["extract"].get(host, fx["extract"]["default"])
+            return self._json({"data": {"markdown": markdown}})
+        query = str(body.get("query") or "")
+        if "complaints" in query:
+            return self._json(fx["complaints"])
+        return self._json(fx["serp"])
+
+    # -- name.com ----------------------------------------------------------------
+    def _available(self, domain: str) -> bool:
+        fx = self.fixtures["namecom"]
+        tld = domain.rsplit(".", 1)[-1]
+        if tld in fx["takenTlds"]:
+            return False
+        return _h(domain) % 100 < int(fx["availablePercent"])
+
+    def _row(self, domain: str, purchasable: bool) -> dict[str, Any]:
+        fx = self.fixtures["namecom"]
+        tld = domain.rsplit(".", 1)[-1]
+        return {
+            "domainName": domain,
+            "purchasable": purchasable,
+            "purchasePrice": fx["prices"].get(tld, 19.99),
+            "renewalPrice": fx["renewal"].get(tld, 24.99),
+            "purchaseType": "registration",
+        }
+
+    def _namecom(self, path: str, body: dict[str, Any]) -> tuple[int, bytes, str]:
+        if path.endswith(":searchStream"):
+            keyword = str(body.get("keyword") or "brand").lower()
+            lines = [
+                json.dumps(self._row(f"{keyword}.{tld}", True))
+                for tld in self.fixtures["namecom"]["suggestTlds"]
+            ]
+            return 200, ("\n".join(lines) + "\n").encode("utf-8"), "application/x-ndjson"
+        domains = [str(d).lower() for d in body.get("domainNames") or []]
+        return self._json({"results": [self._row(d, self._available(d)) for d in domains]})
+
+    # -- OpenRouter --------------------------------------------------------------
+    def _openrouter(self, path: str, body: dict[str, Any]) -> tuple[int, bytes, str]:
+        fx = self.fixtures["openrouter"]
+        if path.endswith("/embeddings"):
+            dim = int(fx["embeddingDim"])
+            inputs = body.get("input") or []
+            inputs = [inputs] if isinstance(inputs, str) else inputs
+            data = []
+            for i, text in enumerate(inputs):
+                rng = random.Random(_h(str(text)))
+                data.append({"object": "embedding", "index": i, "embedding": [rng.uniform(-1, 1) for _ in range(dim)]})
+            return self._json({"object": "list", "data": data, "model": body.get("model"), "usage": {"prompt_tokens": 8, "total_tokens": 8}})
+        messages = body.get("messages") or []
+        if body.get("tools"):
+            message = _agent_turn(messages, self.fixtures)
+        else:
+            message = {"role": "assistant", "content": _completion(messages, fx)}
+        finish = "tool_calls" if message.get("tool_calls") else "stop"
+        return self._json(
+            {
+                "id": "bench-" + hashlib.md5(json.dumps(messages).encode()).hexdigest()[:12],
+                "object": "chat.completion",
+                "created": 0,
+                "model": body.get("model") or "bench",
+                "choices": [{"index": 0, "message": message, "finish_reason": finish}],
+                "usage": {"prompt_tokens": 400, "completion_tokens": 120, "total_tokens": 520},
+            }
+        )
+
+
+# System-prompt markers -> fixture key. First match wins.
+_SITES = (
+    ("Classify each listed company by TYPE", "classify"),
+    ("RECURRING complaints", "complaints"),
+    ("You are a pricing analyst", "pricing"),
+    ("You are a market analyst", "summary"),
+    ("Generate a FRESH batch", "moreNames"),
+    ("startup brand strategist", "names"),
+    ("ADJACENT variants", "angles"),
+    ("honest startup analyst", "verdict"),
+    ("You are a domain strategist", "thesis"),
+    ("conversion copywriter", "landing"),
+)
+
+
+def _completion(messages: list[dict[str, Any]], fx: dict[str, Any]) -> str:
+    system = next((str(m.get("content") or "") for m in messages if m.get("role") == "system"), "")
+    site = next((key for marker, key in _SITES if marker in system), "fallback")
+    if site == "classify":
+        user = next((str(m.get("content") or "") for m in messages if m.get("role") == "user"), "")
+        count = len([line for line in user.splitlines() if line.strip()])
+        return json.dumps({"kinds": [fx["classifyKind"]] * count})
+    value = fx[site]
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _agent_turn(messages: list[dict[str, Any]], fixtures: dict[str, Any]) -> dict[str, Any]:
+    """A scripted agent-loop model: research -> reveal + name -> probe domains
+    (two independent tools, exercising the concurrent path) -> commit gap +
+    verdict -> secure. Re-issues a turn whose results came back as error/retry."""
+    fx = fixtures["openrouter"]
+    turns = [m for m in messages if m.get("role") == "assistant" and m.get("tool_calls")]
+    results = {
+        m.get("tool_call_id"): m.get("content")
+        for m in messages
+        if m.get("role") == "tool"
+    }
+    step = len(turns)
+    if turns:
+        last = turns[-1]["tool_calls"]
+        failed = any(
+            '"error"' in str(results.get(tc["id"]) or "") or '"retry": true' in str(results.get(tc["id"]) or "")
+            for tc in last
+        )
+        if failed and step < 6:
+            step -= 1
+    names = fx["names"]["names"][:5]
+    if step == 0:
+        calls = [("nimble_research", {})]
+    elif step == 1:
+        calls = [("submit_recon", {}), ("propose_names", {})]
+    elif step == 2:
+        calls = [
+            ("namecom_check", {"domains": [n["domain"].rsplit(".", 1)[0] + ".delivery" for n in names]}),
+            ("namecom_suggest", {"keyword": names[0]["name"].lower()}),
+        ]
+    elif step == 3:
+        verdict = fx["verdict"]
+        calls = [
+            ("submit_gap_and_names", {"positioning_gap": fx["names"]["positioning_gap"], "candidates": names}),
+            ("submit_verdict", {k: verdict[k] for k in ("call", "score", "headline", "risks", "next_steps")}),
+        ]
+    elif step in (4, 5):
+        calls = [("submit_winner", {})]
+    else:
+        return {"role": "assistant", "content": "Delivered."}
+    return {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {
+                "id": f"call_{len(turns)}_{i}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(args)},
+            }
+            for i, (name, args) in enumerate(calls)
+        ],
+    }
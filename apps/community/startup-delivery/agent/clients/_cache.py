@@ -1,15 +1,36 @@
-"""Disk cache for paid API responses (Nimble, name.com)."""
+"""Disk cache for paid API responses (Nimble, name.com).
+
+Layout: one compact JSON envelope per key, sharded into 256 hashed
+subdirectories (``<CACHE_DIR>/<2 hex>/<digest>.json``) so no single directory
+grows to tens of thousands of entries on the persistent volume. Files written by
+the old flat layout (``<CACHE_DIR>/<digest>.json``) are still read and are moved
+into their shard on first touch.
+
+The store is BOUNDED: a byte budget (CACHE_MAX_BYTES) and an entry budget
+(CACHE_MAX_ENTRIES) are enforced after each write by evicting entries in LRU
+order (default) or oldest-write order (CACHE_EVICTION=age). Recency lives in an
+in-process index that is rebuilt from file mtimes on the first cache access, so
+a restart degrades LRU to write-order until the index warms up again.
+
+In front of the disk sits a small in-process LRU (CACHE_MEMORY_ENTRIES) and a
+per-key single-flight, so parallel runs for the same idea share one fetch.
+"""
 from __future__ import annotations
 
 import hashlib
 import json
 import os
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Generic, TypeVar
 
+from .._env import env_int
+
 
 def _default_cache_dir() -> Path:
     """Where to keep the paid-API cache.
@@ -36,10 +57,188 @@ CACHE_DIR = _default_cache_dir()
 T = TypeVar("T")
 
 
+# Budgets. The defaults sit comfortably inside a small Fly volume while still
+# holding weeks of recon; both are overridable without a redeploy of code.
+_MAX_BYTES = env_int("CACHE_MAX_BYTES", 512 * 1024 * 1024)
+_MAX_ENTRIES = env_int("CACHE_MAX_ENTRIES", 20_000)
+# Evict down to this fraction of each budget once one is exceeded, so a full
+# cache pays for one eviction sweep per ~10% of churn instead of one per write.
+_LOW_WATER = 0.9
+
+
+def _eviction_policy() -> str:
+    """"lru" (default) evicts the least recently READ entry; "age" evicts the
+    oldest WRITE. Read at call time so it's togglable per-process."""
+    policy = os.getenv("CACHE_EVICTION", "lru").strip().lower()
+    return policy if policy in {"lru", "age"} else "lru"
+
+
+def _digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def _legacy_path(key: str) -> Path:
+    """Where the pre-sharding flat layout kept this key."""
+    return CACHE_DIR / f"{_digest(key)}.json"
+
+
 def _path(key: str) -> Path:
-    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    return CACHE_DIR / f"{digest}.json"
+    digest = _digest(key)
+    shard = CACHE_DIR / digest[:2]
+    shard.mkdir(parents=True, exist_ok=True)
+    return shard / f"{digest}.json"
+
+
+# --------------------------------------------------------------------------- #
+# Index + counters                                                            #
+# --------------------------------------------------------------------------- #
+# path -> size in bytes, ordered oldest -> newest (by last use under "lru", by
+# write time under "age"). Guarded by _LOCK together with the counters.
+_LOCK = threading.Lock()
+_INDEX: OrderedDict[Path, int] = OrderedDict()
+_INDEX_ROOT: Path | None = None
+_TOTAL_BYTES = 0
+_COUNTERS = {
+    "memoryHits": 0,
+    "hits": 0,
+    "misses": 0,
+    "stale": 0,
+    "coalesced": 0,
+    "writes": 0,
+    "evictions": 0,
+}
+
+
+def _scan(root: Path) -> list[tuple[float, Path, int]]:
+    """(mtime, path, size) for every cache file under root: the shards AND any
+    leftover flat-layout files. Temp files from interrupted writes are skipped."""
+    found: list[tuple[float, Path, int]] = []
+    try:
+        top = list(os.scandir(root))
+    except OSError:
+        return found
+    for entry in top:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                with os.scandir(entry.path) as shard:
+                    for child in shard:
+                        if child.name.endswith(".json") and child.is_file(follow_symlinks=False):
+                            st = child.stat()
+                            found.append((st.st_mtime, Path(child.path), st.st_size))
+            elif entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                st = entry.stat()
+                found.append((st.st_mtime, Path(entry.path), st.st_size))
+        except OSError:
+            continue
+    return found
+
+
+def _ensure_index() -> None:
+    """Build the in-process index on first use (or after CACHE_DIR moved).
+    Caller holds _LOCK."""
+    global _INDEX_ROOT, _TOTAL_BYTES
+    if _INDEX_ROOT == CACHE_DIR:
+        return
+    _INDEX.clear()
+    _TOTAL_BYTES = 0
+    for _mtime, path, size in sorted(_scan(CACHE_DIR), key=lambda row: row[0]):
+        _INDEX[path] = size
+        _TOTAL_BYTES += size
+    _INDEX_ROOT = CACHE_DIR
+
+
+def _index_put(path: Path, size: int) -> None:
+    """Record a (re)written entry as the newest. Caller holds _LOCK."""
+    global _TOTAL_BYTES
+    _TOTAL_BYTES -= _INDEX.pop(path, 0)
+    _INDEX[path] = size
+    _TOTAL_BYTES += size
+
+
+def _index_drop(path: Path) -> None:
+    """Forget an entry that no longer exists on disk. Caller holds _LOCK."""
+    global _TOTAL_BYTES
+    _TOTAL_BYTES -= _INDEX.pop(path, 0)
+
+
+def _index_touch(path: Path) -> None:
+    """Mark an entry as just used (LRU only; "age" keeps write order)."""
+    with _LOCK:
+        _ensure_index()
+        if _eviction_policy() == "lru" and path in _INDEX:
+            _INDEX.move_to_end(path)
+
+
+def _evict_over_budget() -> None:
+    """Delete the coldest entries until both budgets are back under the low-water
+    mark. Caller holds _LOCK. Best-effort: an entry that vanished underneath us
+    (another process, a manual wipe) is simply dropped from the index."""
+    if _TOTAL_BYTES <= _MAX_BYTES and len(_INDEX) <= _MAX_ENTRIES:
+        return
+    byte_target = int(_MAX_BYTES * _LOW_WATER)
+    entry_target = int(_MAX_ENTRIES * _LOW_WATER)
+    while _INDEX and (_TOTAL_BYTES > byte_target or len(_INDEX) > entry_target):
+        path = next(iter(_INDEX))
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Can't delete it (permissions, busy volume): stop rather than spin.
+            break
+        _index_drop(path)
+        _COUNTERS["evictions"] += 1
+
+
+def _count(name: str) -> None:
+    with _LOCK:
+        _COUNTERS[name] += 1
+
+
+def stats() -> dict[str, Any]:
+    """Cache counters + occupancy for /debug and metrics. Pure in-memory read
+    (the first call builds the index with one directory scan)."""
+    with _LOCK:
+        _ensure_index()
+        served = _COUNTERS["memoryHits"] + _COUNTERS["hits"]
+        lookups = served + _COUNTERS["misses"]
+        return {
+            **_COUNTERS,
+            # Every memory hit, disk hit, and coalesced wait is a paid call NOT made.
+            "callsSaved": served + _COUNTERS["coalesced"],
+            "hitRatio": round(served / lookups, 4) if lookups else None,
+            "memoryEntries": len(_MEMORY),
+            "memoryMaxEntries": _MEMORY_MAX_ENTRIES,
+            "entries": len(_INDEX),
+            "bytes": _TOTAL_BYTES,
+            "maxEntries": _MAX_ENTRIES,
+            "maxBytes": _MAX_BYTES,
+            "eviction": _eviction_policy(),
+        }
+
+
+def _locate(key: str) -> Path | None:
+    """The on-disk file for key, migrating a flat-layout file into its shard.
+
+    Returns None when neither layout has it. The move keeps the file's mtime, so a
+    legacy bare value still ages by its original write time after migration.
+    """
+    path = _path(key)
+    if path.exists():
+        return path
+    legacy = _legacy_path(key)
+    if not legacy.exists():
+        return None
+    try:
+        os.replace(legacy, path)
+    except OSError:
+        return legacy  # can't move it; still serve it in place
+    with _LOCK:
+        _ensure_index()
+        size = _INDEX.pop(legacy, None)
+        if size is not None:
+            _INDEX[path] = size
+    return path
 
 
 # Envelope marker. Fresh writes wrap the payload as
@@ -86,18 +285,103 @@ def _read_entry(path: Path) -> tuple[Any, float | None]:
 
 
 def _write_entry(path: Path, data: Any, fetched_at: float) -> None:
-    """Atomically write the enveloped payload (temp file + os.replace)."""
+    """Atomically write the enveloped payload (temp file + os.replace), then
+    account for it in the index and evict if a budget is now exceeded.
+
+    Compact separators: the envelope is machine-read only, and indentation was
+    ~25% of the bytes on large SERP payloads.
+    """
     envelope = {_ENVELOPE_MARK: 1, "fetched_at": fetched_at, "value": data}
+    encoded = json.dumps(envelope, separators=(",", ":"))
     # Write atomically so an interrupted write never leaves a half-written file.
     fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
     try:
         with os.fdopen(fd, "w") as fh:
-            fh.write(json.dumps(envelope, indent=2))
+            fh.write(encoded)
         os.replace(tmp, path)
     except BaseException:
         if os.path.exists(tmp):
             os.remove(tmp)
         raise
+    with _LOCK:
+        _ensure_index()
+        _index_put(path, len(encoded.encode()))
+        _COUNTERS["writes"] += 1
+        _evict_over_budget()
+
+
+def _is_stale(fetched_at: float | None, max_age_seconds: float | None) -> bool:
+    if max_age_seconds is None or fetched_at is None:
+        # No TTL requested (unchanged behavior), or we can't date the entry
+        # -> serve it. (An undatable entry is rare: only a legacy bare file
+        # whose mtime is unreadable; re-fetching it on every call would be
+        # the worse failure mode for a quota-sensitive API.)
+        return False
+    return (time.time() - fetched_at) > max_age_seconds
+
+
+# --------------------------------------------------------------------------- #
+# Memory tier + single-flight                                                 #
+# --------------------------------------------------------------------------- #
+# A bounded in-process LRU above the disk store: a warm hit costs a dict lookup
+# instead of a file read + JSON parse. Values are SHARED between callers, so they
+# must be treated as read-only (every call site today only reads them).
+_MEMORY_MAX_ENTRIES = env_int("CACHE_MEMORY_ENTRIES", 256)
+_MEMORY: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+
+# key -> the Future the first caller on a miss is filling. Concurrent callers for
+# the same key wait on it instead of firing a duplicate paid request. Keyed with
+# `force` so a live re-check never piggybacks on a read that may come from disk.
+_INFLIGHT: dict[tuple[str, bool], Future] = {}
+
+
+def _memory_get(key: str, max_age_seconds: float | None) -> CacheResult[Any] | None:
+    with _LOCK:
+        entry = _MEMORY.get(key)
+        if entry is None:
+            return None
+        value, fetched_at = entry
+        if _is_stale(fetched_at, max_age_seconds):
+            del _MEMORY[key]
+            return None
+        _MEMORY.move_to_end(key)
+        _COUNTERS["memoryHits"] += 1
+    return CacheResult(value=value, from_cache=True, fetched_at=fetched_at)
+
+
+def _memory_put(key: str, value: Any, fetched_at: float | None) -> None:
+    if _MEMORY_MAX_ENTRIES <= 0:
+        return
+    with _LOCK:
+        _MEMORY[key] = (value, fetched_at)
+        _MEMORY.move_to_end(key)
+        while len(_MEMORY) > _MEMORY_MAX_ENTRIES:
+            _MEMORY.popitem(last=False)
+
+
+def _load_or_fetch(
+    key: str, fetch: Callable[[], T], force: bool, max_age_seconds: float | None
+) -> CacheResult[T]:
+    """The disk path: serve a valid entry, else fetch + write through."""
+    path = _path(key)
+    found = None if force else _locate(key)
+    if found is not None:
+        try:
+            value, fetched_at = _read_entry(found)
+        except (json.JSONDecodeError, OSError):
+            pass  # truncated/corrupt cache -> treat as a miss and recompute
+        else:
+            if not _is_stale(fetched_at, max_age_seconds):
+                _count("hits")
+                _index_touch(found)
+                return CacheResult(value=value, from_cache=True, fetched_at=fetched_at)
+            _count("stale")
+
+    _count("misses")
+    now = time.time()
+    data = fetch()
+    _write_entry(path, data, now)
+    return CacheResult(value=data, from_cache=False, fetched_at=now)
 
 
 def cached_json_meta(
@@ -118,31 +402,101 @@ def cached_json_meta(
     Default (``max_age_seconds=None``) preserves the original behavior exactly:
     any readable file is a hit regardless of age. The atomic temp-file + os.replace
     write, the /data-volume cache dir, and the corrupt-file-as-miss path are intact.
+    An entry evicted by the size budget is simply a miss.
+
+    Reads go memory tier -> disk -> ``fetch()``. Only ONE caller per key runs the
+    disk/fetch path at a time; concurrent callers wait for its result (or its
+    exception) rather than spending a second paid call. The memory tier applies
+    the same TTL against the original ``fetched_at``, so provenance is unchanged.
     """
-    path = _path(key)
-    if path.exists() and not force:
-        try:
-            value, fetched_at = _read_entry(path)
-        except (json.JSONDecodeError, OSError):
-            value = None
-            fetched_at = None
-            stale = True  # truncated/corrupt cache -> treat as a miss and recompute
+    if not force:
+        hit = _memory_get(key, max_age_seconds)
+        if hit is not None:
+            return hit
+
+    flight = (key, force)
+    with _LOCK:
+        pending = _INFLIGHT.get(flight)
+        if pending is None:
+            pending = Future()
+            _INFLIGHT[flight] = pending
+            leader = True
         else:
-            if max_age_seconds is None or fetched_at is None:
-                # No TTL requested (unchanged behavior), or we can't date the entry
-                # -> serve it. (An undatable entry is rare: only a legacy bare file
-                # whose mtime is unreadable; re-fetching it on every call would be
-                # the worse failure mode for a quota-sensitive API.)
-                stale = False
-            else:
-                stale = (time.time() - fetched_at) > max_age_seconds
-            if not stale:
-                return CacheResult(value=value, from_cache=True, fetched_at=fetched_at)
+            _COUNTERS["coalesced"] += 1
+            leader = False
+    if not leader:
+        return pending.result()
 
+    try:
+        result = _load_or_fetch(key, fetch, force, max_age_seconds)
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    else:
+        _memory_put(key, result.value, result.fetched_at)
+        pending.set_result(result)
+        return result
+    finally:
+        with _LOCK:
+            _INFLIGHT.pop(flight, None)
+
+
+def peek(
+    key: str, *, max_age_seconds: float | None = None, memory: bool = True
+) -> CacheResult[Any] | None:
+    """A still-valid cached value for key (memory tier, then disk), or None.
+
+    Never fetches and never writes — for callers that must decide what to do on
+    a miss before paying for it (e.g. the LLM cache's near-duplicate lookup).
+    ``memory=False`` reads disk only, for entries another process may rewrite.
+    """
+    if memory:
+        hit = _memory_get(key, max_age_seconds)
+        if hit is not None:
+            return hit
+    found = _locate(key)
+    if found is None:
+        return None
+    try:
+        value, fetched_at = _read_entry(found)
+    except (json.JSONDecodeError, OSError):
+        return None
+    if _is_stale(fetched_at, max_age_seconds):
+        return None
+    _count("hits")
+    _index_touch(found)
+    _memory_put(key, value, fetched_at)
+    return CacheResult(value=value, from_cache=True, fetched_at=fetched_at)
+
+
+def clear() -> int:
+    """Drop every entry — memory tier and disk (both layouts). Returns how many
+    files were removed. For cold-cache runs (agent.bench), not request paths."""
+    global _INDEX_ROOT, _TOTAL_BYTES
+    removed = 0
+    with _LOCK:
+        _MEMORY.clear()
+        for _mtime, path, _size in _scan(CACHE_DIR):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        _INDEX.clear()
+        _TOTAL_BYTES = 0
+        _INDEX_ROOT = CACHE_DIR
+    return removed
+
+
+def put(key: str, value: Any) -> None:
+    """Store value for key now (memory tier + disk), without a fetch.
+
+    For callers that fetch many keys in one upstream call and cache the results
+    per key (e.g. name.com availability batched over only the missed domains).
+    """
     now = time.time()
-    data = fetch()
-    _write_entry(path, data, now)
-    return CacheResult(value=data, from_cache=False, fetched_at=now)
+    _write_entry(_path(key), value, now)
+    _memory_put(key, value, now)
 
 
 def cached_json(
@@ -0,0 +1,161 @@
+"""Process-wide request governor for a rate-limited provider (Nimble).
+
+Every bridge worker (``/deliver``, ``/deliver/stream``, ``/jobs``) fans recon out
+over its own thread pools, so without a shared gate N concurrent deliveries turn
+into N x (SERPs + extracts) simultaneous requests — the provider answers with
+429s and per-call retries pile onto the same overloaded window. One governor per
+provider caps that at the process level:
+
+  - a token bucket bounds the request RATE (``rate_per_s`` with ``burst``),
+  - a semaphore bounds requests IN FLIGHT,
+  - a 429 halves the effective rate and pauses every caller until the
+    provider's Retry-After (or a jittered backoff) passes; each success then
+    recovers the rate additively toward the configured ceiling (AIMD).
+
+Callers block in ``slot()`` rather than failing, so a burst queues and drains
+at the rate the provider tolerates. ``stats()`` is a pure in-memory read for
+/debug. stdlib-only; thread-safe (one Condition guards all state).
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# Never throttle below this fraction of the configured rate, so a long 429 spell
+# still lets a trickle through to discover that the provider has recovered.
+_MIN_RATE_FRACTION = 0.1
+# Additive recovery per successful request, as a fraction of the ceiling.
+_RECOVERY_STEP = 0.05
+# Cap on the self-imposed pause when the provider gives no Retry-After.
+_MAX_COOLDOWN_S = 30.0
+
+
+class RateGovernor:
+    """Token bucket + in-flight cap + adaptive 429 backoff, shared by threads."""
+
+    def __init__(self, name: str, *, rate_per_s: float, burst: int, max_in_flight: int) -> None:
+        self.name = name
+        self._ceiling = max(0.1, float(rate_per_s))
+        self._rate = self._ceiling
+        self._burst = max(1, int(burst))
+        self._tokens = float(self._burst)
+        self._refilled_at = time.monotonic()
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._throttle_streak = 0
+        self._cond = threading.Condition()
+        # Counters (read by stats()).
+        self._waiting = 0
+        self._peak_waiting = 0
+        self._admitted = 0
+        self._throttled = 0
+        self._wait_s_total = 0.0
+        self._wait_s_max = 0.0
+
+    # -- internals (caller holds self._cond) ---------------------------------
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+            self._refilled_at = now
+
+    def _delay(self, now: float) -> float | None:
+        """Seconds until this caller may go, or None if it may go now."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= self._max_in_flight:
+            return 0.25  # woken early by notify() when a slot frees
+        self._refill(now)
+        if self._tokens >= 1.0:
+            return None
+        return (1.0 - self._tokens) / self._rate
+
+    # -- public API ----------------------------------------------------------
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Block until a token AND an in-flight slot are free, then hold the slot."""
+        started = time.monotonic()
+        with self._cond:
+            self._waiting += 1
+            self._peak_waiting = max(self._peak_waiting, self._waiting)
+            try:
+                while True:
+                    delay = self._delay(time.monotonic())
+                    if delay is None:
+                        break
+                    self._cond.wait(timeout=delay)
+            finally:
+                self._waiting -= 1
+            self._tokens -= 1.0
+            self._in_flight += 1
+            self._admitted += 1
+            waited = time.monotonic() - started
+            self._wait_s_total += waited
+            self._wait_s_max = max(self._wait_s_max, waited)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """The provider said 429: slow everyone down (multiplicative decrease)
+        and pause admissions for Retry-After, or a jittered streak backoff."""
+        with self._cond:
+            self._throttled += 1
+            self._throttle_streak += 1
+            self._rate = max(self._ceiling * _MIN_RATE_FRACTION, self._rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after is None or retry_after <= 0:
+                retry_after = min(
+                    _MAX_COOLDOWN_S, 0.5 * (2 ** (self._throttle_streak - 1))
+                ) + random.uniform(0, 0.4)
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._cond.notify_all()
+
+    def succeeded(self) -> None:
+        """A successful response: recover the rate additively toward the ceiling."""
+        with self._cond:
+            self._throttle_streak = 0
+            if self._rate < self._ceiling:
+                self._rate = min(self._ceiling, self._rate + self._ceiling * _RECOVERY_STEP)
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth + throttle counters for /debug. Pure in-memory read."""
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "name": self.name,
+                "ratePerS": round(self._rate, 3),
+                "ratePerSCeiling": self._ceiling,
+                "burst": self._burst,
+                "maxInFlight": self._max_in_flight,
+                "inFlight": self._in_flight,
+                "queueDepth": self._waiting,
+                "peakQueueDepth": self._peak_waiting,
+                "admitted": self._admitted,
+                "throttled": self._throttled,
+                "pausedForS": round(max(0.0, self._paused_until - now), 3),
+                "avgWaitMs": round(1000 * self._wait_s_total / self._admitted, 1) if self._admitted else 0.0,
+                "maxWaitMs": round(1000 * self._wait_s_max, 1),
+            }
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After in seconds (the delta-seconds form), or None if absent/unparsable.
+
+    The HTTP-date form is rare on API 429s; treating it as "no hint" just falls
+    back to the governor's own jittered backoff.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value.strip())
+    except ValueError:
+        return None
+    return seconds if seconds >= 0 else None
@@ -2,21 +2,198 @@
 
 Docs: https://openrouter.ai/docs
 All LLM calls in this project go through OpenRouter (not direct Anthropic/OpenAI keys).
+
+Response cache: `chat`/`chat_json` completions and `embed` vectors persist in the
+same disk store as the Nimble cache (clients/_cache: memory tier, single-flight,
+bounded disk), keyed on a canonical fingerprint of model + messages +
+temperature + json mode. Each call site names itself (`cache="names"`, ...) to
+pick its TTL from _SITE_TTLS; `cache=None` opts a call out (the deliberately
+stochastic ones, e.g. llm.more_names). A repeat delivery for the same idea then
+replays the same completions instead of paying for them again — and because
+prompts embed the live recon + cross-idea "avoid" lists, any change upstream is
+a different fingerprint, i.e. a miss. LLM_CACHE=0 turns the cache off.
+
+Near-duplicate mode (opt-in, LLM_CACHE_SEMANTIC=1): a call site may pass
+`cache_idea=`; on an exact miss, a prior completion for the same site/model/
+temperature whose idea embedding is within LLM_CACHE_SEMANTIC_MIN_SIM (cosine)
+is served instead. Only sites whose prompt is essentially the idea itself opt
+in (llm.adjacent_angles). Each bucket's (idea, completion key) list lives in the
+same disk store, so it survives restarts and is shared across workers; the idea
+vectors come from the embedding cache. cache_stats() reports hits, and the
+latency and tokens they saved.
 """
 from __future__ import annotations
 
+import hashlib
 import json
+import math
 import os
 import re
+import threading
+import time
 from typing import Any
 
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from .. import telemetry
+from .._env import env_int
+from . import _cache
+
 load_dotenv()
 
 BASE_URL = "https://openrouter.ai/api/v1"
 
+# Per-call-site TTLs (seconds). Completions grounded in recon live as long as the
+# recon they were built from (NIMBLE_CACHE_TTL_SECONDS defaults to a week);
+# competitor classification is near-static. Unlisted sites use the default.
+_DEFAULT_TTL_SECONDS = env_int("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600)
+_SITE_TTLS: dict[str, int] = {
+    "classify": 30 * 24 * 3600,
+    "pricing": 7 * 24 * 3600,
+    "complaints": 7 * 24 * 3600,
+    "summary": 7 * 24 * 3600,
+    "names": 7 * 24 * 3600,
+    "angles": 7 * 24 * 3600,
+    "verdict": 7 * 24 * 3600,
+    "thesis": 7 * 24 * 3600,
+    "landing": 7 * 24 * 3600,
+}
+
+# Near-duplicate index: per (site, model, temperature, json_mode) bucket, the last
+# N [idea, fingerprint] pairs, persisted under _semantic_key(bucket). Unit idea
+# vectors are memoised per process (re-derived from the embedding cache, no paid
+# call) so a lookup only re-reads the small pair list from disk.
+_SEMANTIC_MAX_PER_BUCKET = 256
+_SEMANTIC_VECTORS: dict[str, list[float]] = {}
+
+_STATS_LOCK = threading.Lock()
+_STATS = {
+    "hits": 0,
+    "semanticHits": 0,
+    "misses": 0,
+    "bypassed": 0,
+    "savedMs": 0,
+    "savedTokens": 0,
+    "embedHits": 0,
+    "embedMisses": 0,
+}
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("LLM_CACHE", "1").strip() != "0"
+
+
+def _semantic_enabled() -> bool:
+    return os.getenv("LLM_CACHE_SEMANTIC", "0").strip() == "1"
+
+
+def _semantic_min_sim() -> float:
+    try:
+        return float(os.getenv("LLM_CACHE_SEMANTIC_MIN_SIM", "0.97"))
+    except ValueError:
+        return 0.97
+
+
+def _bump(**deltas: int) -> None:
+    with _STATS_LOCK:
+        for name, delta in deltas.items():
+            _STATS[name] += delta
+
+
+def cache_stats() -> dict[str, Any]:
+    """LLM cache counters for /debug: hits (exact + near-duplicate), misses,
+    opted-out calls, and the latency (ms) + tokens the hits saved."""
+    with _STATS_LOCK:
+        out: dict[str, Any] = dict(_STATS)
+    served = out["hits"] + out["semanticHits"]
+    total = served + out["misses"]
+    out["hitRatio"] = round(served / total, 4) if total else None
+    out["enabled"] = _cache_enabled()
+    out["semantic"] = _semantic_enabled()
+    return out
+
+
+def _fingerprint(kind: str, payload: dict[str, Any]) -> str:
+    """Stable cache key: sha256 of the canonical (sorted, compact) JSON."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return f"openrouter:{kind}:v1:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _unit(vector: list[float]) -> list[float] | None:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm > 0 else None
+
+
+def _semantic_key(bucket: tuple[Any, ...]) -> str:
+    site, model, temperature, json_mode = bucket
+    return _fingerprint(
+        "semantic", {"site": site, "model": model, "temperature": temperature, "json": json_mode}
+    )
+
+
+def _semantic_entries(bucket: tuple[Any, ...]) -> list[tuple[str, str]]:
+    """The bucket's persisted (idea, fingerprint) pairs, oldest first. Read from
+    disk, not the memory tier, so entries other workers added are visible."""
+    hit = _cache.peek(_semantic_key(bucket), memory=False)
+    if hit is None or not isinstance(hit.value, list):
+        return []
+    return [(str(e[0]), str(e[1])) for e in hit.value if isinstance(e, list) and len(e) == 2]
+
+
+def _idea_vectors(ideas: list[str]) -> dict[str, list[float]]:
+    """Unit vectors for ideas, memoised; misses go through embed() (disk-cached)."""
+    with _STATS_LOCK:
+        out = {idea: _SEMANTIC_VECTORS[idea] for idea in ideas if idea in _SEMANTIC_VECTORS}
+    missing = [idea for idea in dict.fromkeys(ideas) if idea not in out]
+    vectors = embed(missing) if missing else None
+    if vectors and len(vectors) == len(missing):
+        fresh: dict[str, list[float]] = {}
+        for idea, vec in zip(missing, vectors):
+            unit = _unit(vec)
+            if unit is not None:
+                fresh[idea] = unit
+        out.update(fresh)
+        with _STATS_LOCK:
+            if len(_SEMANTIC_VECTORS) + len(fresh) > 4 * _SEMANTIC_MAX_PER_BUCKET:
+                _SEMANTIC_VECTORS.clear()
+            _SEMANTIC_VECTORS.update(fresh)
+    return out
+
+
+def _near_duplicate(bucket: tuple[Any, ...], idea: str, ttl: int) -> Any | None:
+    """A cached completion for a near-identical idea in this bucket, or None."""
+    entries = _semantic_entries(bucket)
+    if not entries:
+        return None
+    vectors = _idea_vectors([idea] + [prior for prior, _key in entries])
+    query = vectors.get(idea)
+    if query is None:
+        return None
+    min_sim = _semantic_min_sim()
+    best: tuple[float, str] | None = None
+    for prior, key in entries:
+        vec = vectors.get(prior)
+        if vec is None or len(vec) != len(query):
+            continue
+        sim = sum(a * b for a, b in zip(vec, query))
+        if sim >= min_sim and (best is None or sim > best[0]):
+            best = (sim, key)
+    if best is None:
+        return None
+    hit = _cache.peek(best[1], max_age_seconds=ttl)
+    return hit.value if hit is not None else None
+
+
+def _remember_idea(bucket: tuple[Any, ...], idea: str, key: str) -> None:
+    """Append (idea, key) to the bucket's persisted list. Best-effort: two
+    workers appending at once may drop one entry (last write wins)."""
+    if not _idea_vectors([idea]):
+        return
+    entries = [e for e in _semantic_entries(bucket) if e[1] != key]
+    entries.append((idea, key))
+    _cache.put(_semantic_key(bucket), [list(e) for e in entries[-_SEMANTIC_MAX_PER_BUCKET:]])
+
 
 def _client() -> OpenAI:
     api_key = os.environ.get("OPENROUTER_API_KEY")
@@ -47,15 +224,31 @@ def embed(texts: list[str]) -> list[list[float]] | None:
     if not texts:
         return None
     try:
-        response = _client().embeddings.create(
-            model=default_embed_model(),
-            input=texts,
-            extra_headers=_extra_headers() or None,
-        )
-        vectors = [list(item.embedding) for item in response.data]
-        if len(vectors) != len(texts) or any(not v for v in vectors):
-            return None
-        return vectors
+        model = default_embed_model()
+        keys = [_fingerprint("embed", {"model": model, "input": t}) for t in texts]
+        vectors: list[list[float] | None] = [None] * len(texts)
+        if _cache_enabled():
+            for i, key in enumerate(keys):
+                hit = _cache.peek(key)  # no TTL: a model's embedding never changes
+                if hit is not None and isinstance(hit.value, list) and hit.value:
+                    vectors[i] = hit.value
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        _bump(embedHits=len(texts) - len(missing), embedMisses=len(missing))
+        if missing:
+            with telemetry.span("llm.embed", texts=len(missing)), telemetry.provider_call("openrouter"):
+                response = _client().embeddings.create(
+                    model=model,
+                    input=[texts[i] for i in missing],
+                    extra_headers=_extra_headers() or None,
+                )
+            fresh = [list(item.embedding) for item in response.data]
+            if len(fresh) != len(missing) or any(not v for v in fresh):
+                return None
+            for i, vec in zip(missing, fresh):
+                vectors[i] = vec
+                if _cache_enabled():
+                    _cache.cached_json(keys[i], lambda vec=vec: vec)
+        return [v for v in vectors if v is not None]
     except Exception:
         return None
 
@@ -69,14 +262,62 @@ def _extra_headers() -> dict[str, str]:
     return headers
 
 
+def _complete(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """One live completion -> the cacheable record (content + what it cost)."""
+    started = time.monotonic()
+    with telemetry.provider_call("openrouter"):
+        response = _client().chat.completions.create(**kwargs)
+    content = response.choices[0].message.content
+    if not content:
+        raise RuntimeError("OpenRouter returned empty content")
+    if "response_format" in kwargs:
+        _parse_json(content)  # raises on unparseable JSON, so it's never cached
+    usage = getattr(response, "usage", None)
+    return {
+        "content": content,
+        "latencyMs": int((time.monotonic() - started) * 1000),
+        "tokens": int(getattr(usage, "total_tokens", 0) or 0),
+    }
+
+
 def chat(
     messages: list[dict[str, str]],
     *,
     model: str | None = None,
     json_mode: bool = False,
     temperature: float = 0.7,
+    cache: str | None = "chat",
+    cache_idea: str | None = None,
+) -> str:
+    """Single chat completion; returns assistant message text.
+
+    `cache` names the call site (its TTL comes from _SITE_TTLS); None bypasses
+    the response cache for calls that are meant to vary. `cache_idea` opts the
+    site into near-duplicate reuse when LLM_CACHE_SEMANTIC=1. Each call is one
+    `llm.<site>` span (`llm.uncached` when opted out), hit or miss.
+    """
+    with telemetry.span(f"llm.{cache or 'uncached'}") as attrs:
+        return _chat(
+            messages,
+            model=model,
+            json_mode=json_mode,
+            temperature=temperature,
+            cache=cache,
+            cache_idea=cache_idea,
+            span_attrs=attrs,
+        )
+
+
+def _chat(
+    messages: list[dict[str, str]],
+    *,
+    model: str | None,
+    json_mode: bool,
+    temperature: float,
+    cache: str | None,
+    cache_idea: str | None,
+    span_attrs: dict[str, Any],
 ) -> str:
-    """Single chat completion; returns assistant message text."""
     kwargs: dict[str, Any] = {
         "model": model or default_model(),
         "messages": messages,
@@ -86,11 +327,34 @@ def chat(
     if json_mode:
         kwargs["response_format"] = {"type": "json_object"}
 
-    response = _client().chat.completions.create(**kwargs)
-    content = response.choices[0].message.content
-    if not content:
-        raise RuntimeError("OpenRouter returned empty content")
-    return content
+    if cache is None or not _cache_enabled():
+        _bump(bypassed=1)
+        return _complete(kwargs)["content"]
+
+    key = _fingerprint(
+        "chat",
+        {"model": kwargs["model"], "messages": messages, "temperature": temperature, "json": json_mode},
+    )
+    ttl = _SITE_TTLS.get(cache, _DEFAULT_TTL_SECONDS)
+    bucket = (cache, kwargs["model"], temperature, json_mode)
+    semantic = bool(cache_idea) and _semantic_enabled()
+    if semantic and _cache.peek(key, max_age_seconds=ttl) is None:
+        near = _near_duplicate(bucket, str(cache_idea), ttl)
+        if isinstance(near, dict) and near.get("content"):
+            span_attrs["cached"] = "semantic"
+            _bump(semanticHits=1, savedMs=int(near.get("latencyMs") or 0), savedTokens=int(near.get("tokens") or 0))
+            return str(near["content"])
+
+    result = _cache.cached_json_meta(key, lambda: _complete(kwargs), max_age_seconds=ttl)
+    record = result.value
+    span_attrs["cached"] = result.from_cache
+    if result.from_cache:
+        _bump(hits=1, savedMs=int(record.get("latencyMs") or 0), savedTokens=int(record.get("tokens") or 0))
+    else:
+        _bump(misses=1)
+        if semantic:
+            _remember_idea(bucket, str(cache_idea), key)
+    return str(record["content"])
 
 
 def _strip_code_fences(text: str) -> str:
@@ -111,13 +375,27 @@ def chat_json(
     *,
     model: str | None = None,
     temperature: float = 0.7,
+    cache: str | None = "chat",
+    cache_idea: str | None = None,
 ) -> Any:
     """Chat completion with JSON response; parses and returns the decoded value.
 
     Tolerates fenced output and a stray prose preamble/suffix by falling back to
-    the first balanced JSON object/array in the text.
+    the first balanced JSON object/array in the text. `cache` / `cache_idea` as
+    for :func:`chat` (the raw completion is what's cached).
     """
-    raw = chat(messages, model=model, json_mode=True, temperature=temperature)
+    raw = chat(
+        messages,
+        model=model,
+        json_mode=True,
+        temperature=temperature,
+        cache=cache,
+        cache_idea=cache_idea,
+    )
+    return _parse_json(raw)
+
+
+def _parse_json(raw: str) -> Any:
     cleaned = _strip_code_fences(raw)
     try:
         return json.loads(cleaned)
@@ -156,5 +434,6 @@ def chat_with_tools(
     if tool_choice is not None:
         kwargs["tool_choice"] = tool_choice
 
-    response = _client().chat.completions.create(**kwargs)
+    with telemetry.span("llm.agent"), telemetry.provider_call("openrouter"):
+        response = _client().chat.completions.create(**kwargs)
     return response.choices[0].message
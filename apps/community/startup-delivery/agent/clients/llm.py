@@ -361,6 +361,7 @@ def _request_names(
     temperature: float,
     niche_intel: dict[str, Any] | None = None,
     extra_instruction: str = "",
+    cache: str | None = "names",
 ) -> tuple[str, list[NameCandidate]]:
     exclude = exclude or []
     exclude_names = {c.name.strip().lower() for c in exclude if c.name}
@@ -376,7 +377,7 @@ def _request_names(
     )
 
     try:
-        payload = _openrouter.chat_json(messages, temperature=temperature)
+        payload = _openrouter.chat_json(messages, temperature=temperature, cache=cache)
     except Exception as exc:  # network, auth, malformed JSON, etc.
         raise LLMError(f"OpenRouter name generation failed: {exc}") from exc
 
@@ -1188,7 +1189,7 @@ def adjacent_angles(idea: str, gap: str = "") -> list[str]:
         {"role": "user", "content": f"Idea: {idea}\n\nPositioning gap: {gap or '(none)'}"},
     ]
     try:
-        payload = _openrouter.chat_json(messages, temperature=0.85)
+        payload = _openrouter.chat_json(messages, temperature=0.85, cache="angles", cache_idea=idea)
     except Exception:
         return []
     items = payload.get("variants") if isinstance(payload, dict) else None
@@ -1243,7 +1244,7 @@ def _assess_once(
         # Low temperature so the same idea yields a reproducible verdict
         # run-to-run; the score is anchored deterministically in _coerce_verdict
         # regardless, but a stable call/headline matters for credibility.
-        payload = _openrouter.chat_json(messages, temperature=0.1)
+        payload = _openrouter.chat_json(messages, temperature=0.1, cache="verdict")
     except Exception:
         return _fallback_verdict(recon, niche_intel)
     return _coerce_verdict(payload, recon, niche_intel)
@@ -1658,7 +1659,7 @@ def _strategy_thesis(
         },
     ]
     try:
-        payload = _openrouter.chat_json(messages, temperature=0.4)
+        payload = _openrouter.chat_json(messages, temperature=0.4, cache="thesis")
     except Exception:
         return fallback
     if not isinstance(payload, dict):
@@ -1805,7 +1806,7 @@ def _list_of_dicts(value: Any) -> list[dict[str, Any]]:
 
 def _landing_payload(pick: NameCandidate, recon: ReconResult) -> dict[str, Any]:
     try:
-        payload = _openrouter.chat_json(_landing_messages(pick, recon), temperature=0.65)
+        payload = _openrouter.chat_json(_landing_messages(pick, recon), temperature=0.65, cache="landing")
         if not isinstance(payload, dict):
             raise LLMError("Landing-page model returned non-object JSON")
     except Exception:
@@ -2097,7 +2098,8 @@ def more_names(recon: ReconResult, exclude: list[NameCandidate]) -> list[NameCan
     """Another batch of ~5 names, used when the first batch is all taken.
 
     Returns fresh candidates whose names and domains are not in `exclude`, with
-    incumbent-colliding names dropped (always keeping >=1).
+    incumbent-colliding names dropped (always keeping >=1). Never served from the
+    LLM response cache: a fresh batch is the whole point.
     """
     _gap, candidates = _request_names(
         recon,
@@ -2105,6 +2107,7 @@ def more_names(recon: ReconResult, exclude: list[NameCandidate]) -> list[NameCan
         include_gap=False,
         exclude=exclude,
         temperature=0.95,
+        cache=None,
     )
     return _drop_incumbent_collisions(candidates, recon)
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import os
 import random
+import threading
 import time
 from typing import Any
 
@@ -15,8 +16,10 @@ from dotenv import load_dotenv
 
 import json as _json
 
+from .. import telemetry
 from .._env import env_int
 from ..schemas import DomainOption, NameCandidate
+from . import _cache
 from ._cache import cached_json
 
 load_dotenv()
@@ -54,12 +57,24 @@ def _session() -> requests.Session:
 # What we extract per domain from name.com: (purchasable, price, renewal_price, premium).
 DomainStatus = tuple[bool, float | None, float | None, bool]
 
-# Availability TTL: domains change hands fast enough that a permanently-pinned cache
-# would eventually serve a lie ("available" for a name someone just registered), but
-# the free quota is small — so re-check at most a couple times a day. 12h is the
-# balance: fresh enough to be honest, cheap enough not to burn the quota on reruns.
-# Overridable via NAMECOM_CACHE_TTL_SECONDS for the demo/tests.
-_AVAILABILITY_TTL_SECONDS = env_int("NAMECOM_CACHE_TTL_SECONDS", 12 * 3600)
+# Suggestion TTL (suggest_domains only): domains change hands fast enough that a
+# permanently-pinned cache would eventually suggest a name someone just registered,
+# but the free quota is small — so re-fetch at most a couple times a day. 12h is
+# the balance: fresh enough to be honest, cheap enough not to burn the quota on
+# reruns. Overridable via NAMECOM_CACHE_TTL_SECONDS.
+_SUGGEST_TTL_SECONDS = env_int("NAMECOM_CACHE_TTL_SECONDS", 12 * 3600)
+
+# check_domains caches PER DOMAIN, in two tiers. A registered name almost never
+# frees up again, so "taken" is cached for long (the negative cache); "available"
+# is the answer that goes stale in a way that hurts (someone registers it), so it
+# is re-checked soon. Only the domains missing from the cache go to name.com.
+# For the demo/tests, override these two (0 forces live availability checks);
+# NAMECOM_CACHE_TTL_SECONDS does not affect check_domains.
+_TAKEN_TTL_SECONDS = env_int("NAMECOM_TAKEN_TTL_SECONDS", 30 * 86400)
+_AVAILABLE_TTL_SECONDS = env_int("NAMECOM_AVAILABLE_TTL_SECONDS", 3600)
+
+_STATS_LOCK = threading.Lock()
+_STATS = {"takenHits": 0, "availableHits": 0, "misses": 0, "batches": 0}
 
 # name.com standard registrations sit well under this; premium/aftermarket names
 # (e.g. a $2,500 .com) sit far above. Used as a fallback premium signal when the
@@ -113,6 +128,11 @@ def _backoff_seconds(attempt: int) -> float:
 
 
 def _post_check(session: requests.Session, path: str, domains: list[str]) -> dict[str, Any]:
+    with telemetry.provider_call("namecom"):
+        return _post_check_once(session, path, domains)
+
+
+def _post_check_once(session: requests.Session, path: str, domains: list[str]) -> dict[str, Any]:
     url = f"{_base_url()}{path}"
     body: dict[str, Any] = {"domainNames": domains}
     if path.startswith("/core/"):
@@ -158,39 +178,87 @@ def _post_check(session: requests.Session, path: str, domains: list[str]) -> dic
     )
 
 
+def _bump(name: str) -> None:
+    with _STATS_LOCK:
+        _STATS[name] += 1
+
+
+def availability_cache_stats() -> dict[str, Any]:
+    """Per-domain availability cache counters for /debug."""
+    with _STATS_LOCK:
+        return {
+            **_STATS,
+            "takenTtlSeconds": _TAKEN_TTL_SECONDS,
+            "availableTtlSeconds": _AVAILABLE_TTL_SECONDS,
+        }
+
+
+def _status_key(domain: str) -> str:
+    # v3: per-domain entries (v2 cached whole batches keyed by their composition).
+    return f"namecom:v3:{_base_url()}:{domain}"
+
+
+def cached_statuses(domains: list[str]) -> dict[str, DomainStatus]:
+    """The still-fresh cached status of each domain that has one (no API call).
+
+    A cached "taken" holds for NAMECOM_TAKEN_TTL_SECONDS, a cached "available"
+    only for NAMECOM_AVAILABLE_TTL_SECONDS; anything older is left out (a miss).
+    """
+    out: dict[str, DomainStatus] = {}
+    for domain in domains:
+        hit = _cache.peek(_status_key(domain), max_age_seconds=_TAKEN_TTL_SECONDS)
+        if hit is None or not isinstance(hit.value, list) or len(hit.value) != 4:
+            continue
+        status: DomainStatus = (bool(hit.value[0]), hit.value[1], hit.value[2], bool(hit.value[3]))
+        if status[0] and (hit.fetched_at is None or time.time() - hit.fetched_at > _AVAILABLE_TTL_SECONDS):
+            continue
+        out[domain] = status
+        _bump("availableHits" if status[0] else "takenHits")
+    return out
+
+
 def check_domains(domains: list[str], *, use_cache: bool = True) -> dict[str, DomainStatus]:
-    """Batch availability + price (+ renewal + premium flag) for up to 50 domains."""
-    cleaned = [d.strip().lower() for d in domains if d.strip()]
+    """Batch availability + price (+ renewal + premium flag) for up to 50 domains.
+
+    Served per domain from the tiered availability cache; only the misses are
+    sent to name.com, in one request. use_cache=False checks every domain live
+    (the probe / "Refresh" path) and still writes the fresh results back.
+    """
+    cleaned = list(dict.fromkeys(d.strip().lower() for d in domains if d.strip()))
     if not cleaned:
         return {}
     if len(cleaned) > 50:
         raise ValueError("name.com supports at most 50 domains per request")
 
-    # v2 key: the cached value shape changed (4-tuple), so bust the old 2-tuple cache.
-    cache_key = f"namecom:v2:{_base_url()}:{','.join(sorted(cleaned))}"
+    out = cached_statuses(cleaned) if use_cache else {}
+    missing = [d for d in cleaned if d not in out]
+    if not missing:
+        return out
+    with _STATS_LOCK:
+        _STATS["misses"] += len(missing)
+        _STATS["batches"] += 1
 
-    def fetch() -> dict[str, DomainStatus]:
-        session = _session()
+    session = _session()
+    with telemetry.span("namecom.check", domains=len(missing), cached=len(out)):
         try:
-            payload = _post_check(session, CORE_PATH, cleaned)
+            payload = _post_check(session, CORE_PATH, missing)
         except NameComError as core_err:
             if "HTTP 404" in str(core_err) or "HTTP 405" in str(core_err):
-                payload = _post_check(session, V4_PATH, cleaned)
+                payload = _post_check(session, V4_PATH, missing)
             else:
                 # v4 often returns 403 when creds are wrong; try anyway for older accounts
                 try:
-                    payload = _post_check(session, V4_PATH, cleaned)
+                    payload = _post_check(session, V4_PATH, missing)
                 except NameComError:
                     raise core_err from None
-        return _parse_results(payload)
-
-    # force=True bypasses the cached read for a live check but still writes the
-    # fresh result back (so the on-camera demo can recompute without going stale).
-    # max_age_seconds expires a stale availability entry so "available" never
-    # silently means "available 3 weeks ago".
-    return cached_json(
-        cache_key, fetch, force=not use_cache, max_age_seconds=_AVAILABILITY_TTL_SECONDS
-    )
+        fresh = _parse_results(payload)
+    for domain, status in fresh.items():
+        try:
+            _cache.put(_status_key(domain), list(status))
+        except OSError:
+            pass  # an unwritable cache only costs a re-check next time
+    out.update(fresh)
+    return out
 
 
 def check_domain(candidate: NameCandidate, *, use_cache: bool = True) -> NameCandidate:
@@ -218,11 +286,14 @@ def suggest_domains(
         session = _session()
         url = f"{_base_url()}{SEARCH_STREAM_PATH}"
         rows: list[dict[str, Any]] = []
+        started = time.perf_counter()
+        ok = False
         try:
-            with session.post(
+            with telemetry.span("namecom.suggest") as attrs, session.post(
                 url, json={"keyword": keyword, "timeout": timeout_ms}, timeout=20, stream=True
             ) as resp:
                 if not resp.ok:
+                    attrs["error"] = f"HTTP {resp.status_code}"
                     return []
                 for line in resp.iter_lines():
                     if not line:
@@ -233,13 +304,16 @@ def suggest_domains(
                         continue
                     if isinstance(obj, dict) and obj.get("purchasable") and obj.get("domainName"):
                         rows.append(obj)
+                ok = True
         except requests.RequestException:
             return []
+        finally:
+            telemetry.record_call("namecom", time.perf_counter() - started, ok=ok)
         return rows
 
     try:
         rows = cached_json(
-            cache_key, fetch, force=not use_cache, max_age_seconds=_AVAILABILITY_TTL_SECONDS
+            cache_key, fetch, force=not use_cache, max_age_seconds=_SUGGEST_TTL_SECONDS
         )
     except Exception:
         return []
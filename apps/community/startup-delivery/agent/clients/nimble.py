@@ -15,10 +15,11 @@ reason we fall back to an extractive summary so we never hard-crash.
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import random
 import re
-import time
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
@@ -26,12 +27,16 @@ from urllib.parse import urlparse
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .. import telemetry
 from .._env import env_int
 from ..saturated_niches import crowded_market_note, crowded_market_signal
 from ..schemas import Competitor, MarketHeat, ReconResult
 from . import _openrouter
 from ._cache import CacheResult, cached_json, cached_json_meta
+from ._limiter import RateGovernor, parse_retry_after
 from .namecom import domain_source_status
 
 load_dotenv()
@@ -76,46 +81,165 @@ def _headers() -> dict[str, str]:
 
 # Transient failures get a jittered retry (count configurable via NIMBLE_MAX_RETRIES;
 # default 1) so one flaky call doesn't empty the whole competitor set mid-demo. 403 is
-# terminal (feature gating), never retried.
+# terminal (feature gating), never retried. 429 is NOT retried by the adapter (even
+# with Retry-After, see _JitteredRetry): it goes back through the process-wide
+# governor (below) so every caller backs off together instead of each thread
+# hammering the same throttled window.
 _MAX_RETRIES = env_int("NIMBLE_MAX_RETRIES", 1)
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Process-wide Nimble governor, shared by every delivery / job / stream in this
+# process: at most NIMBLE_RATE_PER_S request starts per second (bursting to
+# NIMBLE_BURST) and NIMBLE_MAX_IN_FLIGHT requests open at once. A 429 halves the
+# rate and pauses admissions for Retry-After; successes recover it. Cache hits and
+# single-flight waiters never reach _post, so they never queue here.
+_GOVERNOR = RateGovernor(
+    "nimble",
+    rate_per_s=env_int("NIMBLE_RATE_PER_S", 8),
+    burst=env_int("NIMBLE_BURST", 8),
+    max_in_flight=env_int("NIMBLE_MAX_IN_FLIGHT", 8),
+)
 
+# Keep-alive pool per Nimble host. Sized for the widest fan-out one delivery makes
+# (the _MAX_EXTRACTS parallel extracts; the SERP angles and complaint mines are
+# narrower) times a few concurrent deliveries, so parallel calls reuse warm TLS
+# connections instead of handshaking each time. Overridable via NIMBLE_POOL_SIZE.
+_POOL_SIZE = env_int("NIMBLE_POOL_SIZE", max(_MAX_EXTRACTS, 2) * 4)
+
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry with the same jittered linear backoff `_post` used to do by
+    hand (~0.5s, ~1.0s, ... plus up to 0.4s jitter), including on the FIRST retry
+    (stock Retry retries immediately). A Retry-After header on a 503 still takes
+    precedence — urllib3 honors it before consulting this. 429 is dropped from the
+    Retry-After statuses so it comes back as a response for the governor instead
+    of being slept on inside a held slot."""
+
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+    def get_backoff_time(self) -> float:
+        attempt = len(self.history)
+        if attempt <= 0:
+            return 0.0
+        return 0.5 * attempt + random.uniform(0, 0.4)
+
+
+def _retry_policy() -> Retry:
+    return _JitteredRetry(
+        total=_MAX_RETRIES,
+        connect=_MAX_RETRIES,
+        read=_MAX_RETRIES,
+        status=_MAX_RETRIES,
+        status_forcelist=_RETRY_STATUSES,
+        # Every Nimble call is a POST; they're safe to replay (reads, cached by key).
+        allowed_methods=frozenset({"POST"}),
+        respect_retry_after_header=True,
+        # Hand the final 429/5xx back as a response so _post maps it to NimbleError.
+        raise_on_status=False,
+    )
 
-def _post(url: str, body: dict[str, Any]) -> dict[str, Any]:
-    """POST JSON to Nimble and return the parsed object (raises on failure).
 
-    Retries on timeouts / connection errors / 429 / 5xx with jittered backoff;
-    403 (enterprise gating) and other 4xx are terminal.
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """The process-wide pooled Session for every Nimble call (lazy, thread-safe).
+
+    Only the connection pool is shared: auth headers are passed per request (the
+    key is read at call time) and Nimble sets no cookies, so concurrent use from
+    the recon thread pools is safe. urllib3's pools are themselves thread-safe.
     """
-    last: NimbleError | None = None
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=2,  # one pool per Nimble host (SERP + extract)
+                    pool_maxsize=_POOL_SIZE,
+                    max_retries=_retry_policy(),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def http_stats() -> dict[str, Any]:
+    """Connection-reuse counters for the pooled Nimble session (for /debug).
+
+    Summed over urllib3's per-host pools: `requests` is every request sent on a
+    pooled connection, `connections` every new connection opened. Their gap is
+    handshakes saved. Best-effort and pure in-memory; never raises.
+    """
+    requests_sent = 0
+    connections = 0
+    try:
+        if _SESSION is not None:
+            adapter = _SESSION.get_adapter("https://")
+            for pool in list(adapter.poolmanager.pools._container.values()):
+                requests_sent += getattr(pool, "num_requests", 0)
+                connections += getattr(pool, "num_connections", 0)
+    except Exception:
+        pass
+    reused = max(0, requests_sent - connections)
+    return {
+        "poolSize": _POOL_SIZE,
+        "requests": requests_sent,
+        "connections": connections,
+        "reused": reused,
+        "reuseRatio": round(reused / requests_sent, 4) if requests_sent else None,
+    }
+
+
+def limiter_stats() -> dict[str, Any]:
+    """Queue depth / wait / throttle counters of the Nimble governor (for /debug)."""
+    return _GOVERNOR.stats()
+
+
+def _post(url: str, body: dict[str, Any]) -> dict[str, Any]:
+    """POST JSON to Nimble over the pooled session and return the parsed object.
+
+    Every attempt first takes a slot from the process-wide governor (rate + in-flight
+    cap). Timeouts / connection errors / 5xx are retried by the session's adapter
+    with jittered backoff; a 429 tells the governor to back EVERYONE off, then this
+    call re-queues for a fresh slot (up to NIMBLE_MAX_RETRIES times). 403
+    (enterprise gating) and other 4xx are terminal. The whole call, retries
+    included, counts as ONE Nimble request (ok/error + latency) in /metrics.
+    """
+    with telemetry.provider_call("nimble"):
+        return _post_once(url, body)
+
+
+def _post_once(url: str, body: dict[str, Any]) -> dict[str, Any]:
     for attempt in range(_MAX_RETRIES + 1):
         try:
-            response = requests.post(url, json=body, headers=_headers(), timeout=_HTTP_TIMEOUT)
+            with _GOVERNOR.slot():
+                response = _session().post(url, json=body, headers=_headers(), timeout=_HTTP_TIMEOUT)
         except requests.RequestException as exc:
-            last = NimbleError(f"Nimble request failed for {url}: {exc}")
-            if attempt < _MAX_RETRIES:
-                time.sleep(0.5 * (attempt + 1) + random.uniform(0, 0.3))
-                continue
-            raise last from exc
-
-        if response.status_code == 403:
-            raise NimbleError(
-                f"Nimble 403 Forbidden for {url} — this endpoint/feature is likely "
-                "enterprise-only (e.g. /search + include_answer). Use the free SERP/extract."
-            )
-        if response.status_code == 429 or response.status_code >= 500:
-            last = NimbleError(f"Nimble HTTP {response.status_code} for {url}: {response.text[:200]}")
-            if attempt < _MAX_RETRIES:
-                time.sleep(0.6 * (attempt + 1) + random.uniform(0, 0.4))
-                continue
-            raise last
-        if not response.ok:
-            raise NimbleError(f"Nimble HTTP {response.status_code} for {url}: {response.text[:300]}")
-        data = response.json()
-        if not isinstance(data, dict):
-            raise NimbleError(f"Nimble returned non-object JSON for {url}")
-        return data
-
-    raise last or NimbleError(f"Nimble request failed for {url}")
+            raise NimbleError(f"Nimble request failed for {url}: {exc}") from exc
+        if response.status_code != 429:
+            if response.ok:  # a failing upstream must not push the rate back up
+                _GOVERNOR.succeeded()
+            break
+        _GOVERNOR.throttled(parse_retry_after(response.headers.get("Retry-After")))
+        if attempt >= _MAX_RETRIES:
+            raise NimbleError(f"Nimble HTTP 429 for {url}: {response.text[:200]}")
+
+    if response.status_code == 403:
+        raise NimbleError(
+            f"Nimble 403 Forbidden for {url} — this endpoint/feature is likely "
+            "enterprise-only (e.g. /search + include_answer). Use the free SERP/extract."
+        )
+    if response.status_code in _RETRY_STATUSES:
+        raise NimbleError(f"Nimble HTTP {response.status_code} for {url}: {response.text[:200]}")
+    if not response.ok:
+        raise NimbleError(f"Nimble HTTP {response.status_code} for {url}: {response.text[:300]}")
+    data = response.json()
+    if not isinstance(data, dict):
+        raise NimbleError(f"Nimble returned non-object JSON for {url}")
+    return data
 
 
 # --------------------------------------------------------------------------- #
@@ -402,7 +526,10 @@ def _extract(url: str) -> dict[str, Any]:
     """Cached extract call for a single competitor page."""
     body = {"url": url, "formats": ["markdown"]}
     cache_key = f"nimble:extract:v1:{url}"
-    return cached_json(cache_key, lambda: _post(EXTRACT_URL, body), max_age_seconds=_RECON_TTL_SECONDS)
+    with telemetry.span("recon.extract", host=_registrable(url)) as attrs:
+        result = cached_json_meta(cache_key, lambda: _post(EXTRACT_URL, body), max_age_seconds=_RECON_TTL_SECONDS)
+        attrs["cached"] = result.from_cache
+        return result.value
 
 
 def _markdown_from_extract(extract: dict[str, Any]) -> str:
@@ -534,7 +661,7 @@ def _classify_competitors(competitors: list[Competitor]) -> list[Competitor]:
         {"role": "user", "content": lines},
     ]
     try:
-        payload = _openrouter.chat_json(messages, temperature=0.0)
+        payload = _openrouter.chat_json(messages, temperature=0.0, cache="classify")
     except Exception:
         return competitors
     kinds = payload.get("kinds") if isinstance(payload, dict) else None
@@ -611,7 +738,7 @@ def _distill_complaints(idea: str, snippets: list[str]) -> tuple[list[str], floa
         },
         {"role": "user", "content": f"Product space: {idea}\n\nReview/complaint snippets:\n{evidence}"},
     ]
-    payload = _openrouter.chat_json(messages, temperature=0.3)
+    payload = _openrouter.chat_json(messages, temperature=0.3, cache="complaints")
     items: Any = []
     if isinstance(payload, list):
         items = payload
@@ -643,6 +770,20 @@ def _distill_complaints(idea: str, snippets: list[str]) -> tuple[list[str], floa
     return complaints, severity
 
 
+def _complaint_targets(competitors: list[Competitor]) -> list[str]:
+    """The incumbent names we mine. Only names are needed, and enrichment never
+    changes a name, so this can run straight off the raw SERP competitor set."""
+    return [c.name for c in competitors[:_MAX_COMPLAINT_MINES] if c.name]
+
+
+def _complaint_snippets(name: str) -> list[str]:
+    """Complaint snippets for one incumbent; [] on any failure."""
+    try:
+        return _snippets_from_serp(_complaints_serp(name))
+    except Exception:
+        return []
+
+
 def mine_complaints(
     idea: str, competitors: list[Competitor]
 ) -> tuple[list[str], float | None]:
@@ -652,19 +793,13 @@ def mine_complaints(
     Best-effort: any failure returns ([], None) so the recon never breaks on this.
     Returns (complaints, severity) where severity is the avg 1-3 (None if none).
     """
-    names = [c.name for c in competitors[:_MAX_COMPLAINT_MINES] if c.name]
+    names = _complaint_targets(competitors)
     if not names:
         return [], None
 
-    def grab(name: str) -> list[str]:
-        try:
-            return _snippets_from_serp(_complaints_serp(name))
-        except Exception:
-            return []
-
     snippets: list[str] = []
     with ThreadPoolExecutor(max_workers=len(names)) as pool:
-        for res in pool.map(grab, names):
+        for res in pool.map(telemetry.bind(_complaint_snippets), names):
             snippets.extend(res)
     if not snippets:
         return [], None
@@ -730,7 +865,7 @@ def _pricing_band_from_markdowns(
         {"role": "user", "content": f"Product space: {idea}\n\nCompetitor pages:\n{evidence}"},
     ]
     try:
-        payload = _openrouter.chat_json(messages, temperature=0.0)
+        payload = _openrouter.chat_json(messages, temperature=0.0, cache="pricing")
     except Exception:
         return None
     if not isinstance(payload, dict):
@@ -871,7 +1006,7 @@ def _llm_summary(idea: str, competitors: list[Competitor]) -> str:
             "content": f"Startup idea: {idea}\n\nLive web search results:\n{evidence}",
         },
     ]
-    summary = _openrouter.chat(messages, temperature=0.3).strip()
+    summary = _openrouter.chat(messages, temperature=0.3, cache="summary").strip()
     if not summary:
         raise NimbleError("OpenRouter returned an empty market summary")
     return summary
@@ -889,91 +1024,138 @@ def _market_summary(idea: str, competitors: list[Competitor]) -> str:
 # --------------------------------------------------------------------------- #
 # Public API                                                                  #
 # --------------------------------------------------------------------------- #
-def research_idea(idea: str) -> ReconResult:
-    """Step 1 "SEE": live web recon for `idea` via Nimble.
+async def research_idea_async(idea: str) -> ReconResult:
+    """Step 1 "SEE": live web recon for `idea` via Nimble, as a dependency graph.
 
-    1. SERP the idea -> Competitor objects from the top organic results.
-    2. Extract the top few competitor pages (best-effort) to enrich positioning
-       and detect pricing; extraction failures are skipped, never fatal.
-    3. Synthesize a cited market_summary via the LLM (extractive fallback).
-    4. positioning_gap is left None (Step 2 fills it).
+    Same stages and same ReconResult as always, but each stage starts as soon as
+    its inputs exist instead of waiting for the previous phase to drain:
+
+      SERP primary + SERP alt -> competitors
+      competitors -> extracts -> {classify, market summary, pricing band}
+      competitors -> complaint SERPs -> distill
+      Tower saturated_niches reads (independent, start immediately)
+
+    Complaint mining only needs incumbent NAMES, which enrichment never changes,
+    so it overlaps the extracts. Classification, summary and the pricing pass all
+    read the enriched set and run side by side. The blocking HTTP/LLM helpers run
+    in worker threads via asyncio.to_thread; every stage keeps its best-effort
+    fallback, so a failed stage degrades exactly as it did in the phased version.
 
     Every Nimble HTTP call is cached to disk by a stable key, so reruns are cheap
     and never re-burn the scarce free pages.
     """
     idea = (idea or "").strip()
 
+    # Tower reads don't depend on recon at all: start them first.
+    note_task = asyncio.create_task(asyncio.to_thread(crowded_market_note, idea))
+    signal_task = asyncio.create_task(asyncio.to_thread(crowded_market_signal, idea))
+
     # SERP acquisition is best-effort: a timeout, non-200, 403, malformed JSON, a
     # corrupt cache file, or a missing API key degrades to an empty result set
     # rather than crashing. The extractive market_summary still produces a valid
     # ReconResult in that case.
     #
+    # The PRIMARY serp goes through the metadata path so the recon's freshness is
+    # HONEST: recon_at is the actual fetch time (the original time on a cache hit),
+    # and recon_from_cache says whether this run hit disk or went live.
+    async def _primary() -> tuple[CacheResult[dict[str, Any]] | None, list[Competitor]]:
+        try:
+            meta = await asyncio.to_thread(_serp_meta, idea)
+        except Exception:
+            try:
+                return None, _competitors_from_serp(await asyncio.to_thread(_serp, idea))
+            except Exception:
+                return None, []
+        try:
+            return meta, _competitors_from_serp(meta.value)
+        except Exception:
+            return meta, []
+
     # Multi-angle (env-gated, default ON): a SECOND "best <idea> tools alternatives"
-    # SERP runs IN PARALLEL with the primary one and is merged+deduped by registrable
-    # host. Both calls are cached, so this widens recon depth without doubling latency
-    # or re-burning quota. Disable with NIMBLE_MULTI_ANGLE=0 if quota/latency is tight.
-    def _competitors(serp_fn: Any) -> list[Competitor]:
+    # SERP runs concurrently with the primary one and is merged+deduped by
+    # registrable host. Disable with NIMBLE_MULTI_ANGLE=0 if quota/latency is tight.
+    async def _alternate() -> list[Competitor]:
+        if not _multi_angle_enabled():
+            return []
         try:
-            return _competitors_from_serp(serp_fn(idea))
+            return _competitors_from_serp(await asyncio.to_thread(_serp_alt, idea))
         except Exception:
             return []
 
-    # Run the PRIMARY serp through the metadata path so the recon's freshness is
-    # HONEST: recon_at is the actual fetch time (the original time on a cache hit),
-    # and recon_from_cache says whether this run hit disk or went live. Best-effort:
-    # any failure falls back to a live "now" stamp so the result still validates.
-    serp_meta: CacheResult[dict[str, Any]] | None = None
-    try:
-        serp_meta = _serp_meta(idea)
-    except Exception:
-        serp_meta = None
+    (serp_meta, primary), alt = await asyncio.gather(_primary(), _alternate())
+    competitors = _merge_competitors(primary, alt) if _multi_angle_enabled() else primary
 
-    def _competitors_primary() -> list[Competitor]:
-        if serp_meta is None:
-            return _competitors(_serp)
+    async def _complaints() -> tuple[list[str], float | None]:
+        names = _complaint_targets(competitors)
+        if not names:
+            return [], None
+        batches = await asyncio.gather(
+            *(asyncio.to_thread(_complaint_snippets, name) for name in names)
+        )
+        snippets = [snippet for batch in batches for snippet in batch]
+        if not snippets:
+            return [], None
         try:
-            return _competitors_from_serp(serp_meta.value)
+            return await asyncio.to_thread(_distill_complaints, idea, snippets)
         except Exception:
-            return []
+            return [], None
 
-    if _multi_angle_enabled():
-        with ThreadPoolExecutor(max_workers=2) as pool:
-            primary_future = pool.submit(_competitors_primary)
-            alt_future = pool.submit(_competitors, _serp_alt)
-            primary = primary_future.result()
-            alt = alt_future.result()
-        competitors = _merge_competitors(primary, alt)
-    else:
-        competitors = _competitors_primary()
+    complaints_task = asyncio.create_task(_complaints())
 
-    # Enrich the top few pages in PARALLEL (each is a slow HTTP extract; running
-    # them concurrently is the single biggest speedup on the live run). The rest
-    # stay SERP-only. ThreadPoolExecutor.map preserves order; enrichment never
-    # raises. We KEEP the scraped markdowns so the WTP-band pass can reuse them
-    # below with NO second Extract.
+    # Enrich the top few pages concurrently (each is a slow HTTP extract). The rest
+    # stay SERP-only; gather preserves order and enrichment never raises. We KEEP
+    # the scraped markdowns so the WTP-band pass can reuse them with NO second
+    # Extract — the enriched head aligns with `head_markdowns` (same order).
     head, tail = competitors[:_MAX_EXTRACTS], competitors[_MAX_EXTRACTS:]
-    head_markdowns: list[str] = []
-    if head:
-        with ThreadPoolExecutor(max_workers=len(head)) as pool:
-            enriched_head = list(pool.map(_enrich_with_markdown, head))
-        enriched = [c for c, _md in enriched_head] + tail
-        head_markdowns = [md for _c, md in enriched_head]
-    else:
-        enriched = tail
-
-    enriched = _classify_competitors(enriched)
-    market_summary = _market_summary(idea, enriched)
-    complaints, complaint_severity = mine_complaints(idea, enriched)
-
-    # PRICING -> WTP band: best-effort normalization over the markdowns ALREADY
-    # scraped above (one cheap haiku call, NO new Extract). Falls back to regex
-    # pricing presence on ANY failure — never raises. The `enriched` head aligns
-    # with `head_markdowns` (same order), so each markdown maps to its competitor.
-    priced_competitor_count, pricing_band = _resolve_pricing(
-        idea, enriched[: len(head_markdowns)], head_markdowns
+    enriched_head = await asyncio.gather(
+        *(asyncio.to_thread(_enrich_with_markdown, comp) for comp in head)
+    )
+    enriched = [c for c, _md in enriched_head] + tail
+    head_markdowns = [md for _c, md in enriched_head]
+
+    # Classification only adds `kind`, which neither the summary nor the pricing
+    # pass reads, so all three fan out over the same enriched set. The pricing
+    # pass is best-effort normalization (one cheap haiku call, NO new Extract) and
+    # falls back to regex pricing presence on ANY failure — never raises.
+    enriched, market_summary, (priced_competitor_count, pricing_band) = await asyncio.gather(
+        asyncio.to_thread(_classify_competitors, enriched),
+        asyncio.to_thread(_market_summary, idea, enriched),
+        asyncio.to_thread(_resolve_pricing, idea, enriched[: len(head_markdowns)], head_markdowns),
+    )
+    complaints, complaint_severity = await complaints_task
+    saturated_note = await note_task
+    signal = await signal_task
+
+    return _assemble_recon(
+        idea,
+        serp_meta=serp_meta,
+        enriched=enriched,
+        head_markdowns=head_markdowns,
+        market_summary=market_summary,
+        complaints=complaints,
+        complaint_severity=complaint_severity,
+        priced_competitor_count=priced_competitor_count,
+        pricing_band=pricing_band,
+        saturated_note=saturated_note,
+        signal=signal,
     )
 
-    saturated_note = crowded_market_note(idea)
+
+def _assemble_recon(
+    idea: str,
+    *,
+    serp_meta: CacheResult[dict[str, Any]] | None,
+    enriched: list[Competitor],
+    head_markdowns: list[str],
+    market_summary: str,
+    complaints: list[str],
+    complaint_severity: float | None,
+    priced_competitor_count: int,
+    pricing_band: str | None,
+    saturated_note: str,
+    signal: dict[str, Any] | None,
+) -> ReconResult:
+    """Fold the finished recon stages into a ReconResult (no network I/O)."""
     if saturated_note:
         market_summary = f"{market_summary}\n\n{saturated_note}"
 
@@ -993,7 +1175,6 @@ def research_idea(idea: str) -> ReconResult:
     # table isn't reachable (e.g. local dev outside the Tower runtime), fall back
     # to a truthful live signal derived from this run's SERP competitor count, so
     # the "Market Heat" card always reflects real data.
-    signal = crowded_market_signal(idea)
     if signal:
         market_heat = MarketHeat(**signal)
     elif enriched:
@@ -1053,6 +1234,36 @@ def research_idea(idea: str) -> ReconResult:
     )
 
 
+def _run_sync(coro: Any) -> Any:
+    """Run a coroutine to completion from sync code.
+
+    The orchestrator, agent loop and bridge workers call recon from plain threads,
+    where asyncio.run is all we need. If the caller is already inside a running
+    event loop, run it on a short-lived helper thread instead of deadlocking it.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(telemetry.bind(asyncio.run), coro).result()
+
+
+def research_idea(idea: str) -> ReconResult:
+    """Step 1 "SEE": live web recon for `idea` via Nimble (sync entry point).
+
+    1. SERP the idea -> Competitor objects from the top organic results.
+    2. Extract the top few competitor pages (best-effort) to enrich positioning
+       and detect pricing; extraction failures are skipped, never fatal.
+    3. Synthesize a cited market_summary via the LLM (extractive fallback).
+    4. positioning_gap is left None (Step 2 fills it).
+
+    Thin wrapper over :func:`research_idea_async`, which overlaps these stages.
+    """
+    with telemetry.span("recon"):
+        return _run_sync(research_idea_async(idea))
+
+
 if __name__ == "__main__":
     result = research_idea("an app that books last-minute dog groomers")
     print(result.model_dump_json(indent=2))
@@ -13,10 +13,15 @@ import math
 import os
 import tempfile
 import threading
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .embedding_index import EmbeddingIndex
+from .embedding_index import available as _vectors_available
+from .token_index import TokenIndex
+
 # Reuse the same niche-overlap tokenizer the saturated_niches signal uses, so
 # "dog grooming app" matches a past "last-minute dog groomers" delivery.
 from .saturated_niches import _tokens
@@ -39,9 +44,19 @@ _NOTE_CAP = 500  # outcome note hard cap (chars)
 
 # Key under which an optional per-row idea embedding is stored on the JSONL row.
 # Underscore-prefixed so it reads as bridge-internal metadata (not part of the
-# DeliveryPackage contract); pydantic ignores it on model_validate.
+# DeliveryPackage contract); pydantic ignores it on model_validate. New rows no
+# longer carry it (vectors go to the embeddings sidecar below); rows logged with
+# it inline are still read.
 _EMBEDDING_KEY = "_idea_embedding"
 
+# Idea vectors written by the background embedding worker / backfill
+# (agent.embeddings) live in a SIDECAR next to the deliveries log, one
+# {"tracking_id", "vector"} line each, so embedding never holds up record() and
+# older rows can gain a vector without rewriting the log. Bounded like the log
+# (with headroom, since one delivery can be re-embedded after a model change).
+_EMBEDDINGS_SUFFIX = ".embeddings.jsonl"
+_MAX_EMBEDDING_LINES = 2 * _MAX_LINES
+
 
 def _path() -> Path:
     return Path(os.getenv("DELIVERIES_LOG", str(_DEFAULT_PATH)))
@@ -51,11 +66,17 @@ def _outcomes_path() -> Path:
     return Path(os.getenv("OUTCOMES_LOG", str(_DEFAULT_OUTCOMES_PATH)))
 
 
+def _embeddings_path() -> Path:
+    base = _path()
+    return base.with_name(base.stem + _EMBEDDINGS_SUFFIX)
+
+
 def _embeddings_enabled() -> bool:
     """OPT-IN flag for the embeddings-backed "niche memory". Default OFF.
 
-    NICHE_EMBEDDINGS=1 turns on best-effort idea embeddings at record() time and
-    cosine-ranked semantic recall in for_niche(). With it unset/"0" the store is
+    NICHE_EMBEDDINGS=1 turns on best-effort idea embeddings for recorded rows
+    (queued to the background worker in agent.embeddings) and cosine-ranked
+    semantic recall in for_niche(). With it unset/"0" the store is
     byte-for-byte its prior self: no embedding work, plain token-overlap recall.
     Read at call time so it can be toggled per-process. The same embeddings would
     back an Iceberg vector recall in the Tower runtime; here we operate purely over
@@ -100,56 +121,467 @@ def _idea_embedding(idea: str) -> list[float] | None:
 def record(package: dict[str, Any]) -> None:
     """Append one delivered package (snake_case model_dump) to the log.
 
-    When NICHE_EMBEDDINGS=1 we ALSO attach a best-effort idea embedding under
-    `_idea_embedding`. That whole step is wrapped: a missing key, provider error,
-    or unavailable embeddings API just omits the field — the row is still written
-    exactly as before. With the flag off this is a no-op and the write is
+    When NICHE_EMBEDDINGS=1 the idea is ALSO queued for embedding. The row is
+    written first and exactly as before; the background worker (agent.embeddings)
+    embeds queued ideas in batches and stores the vectors in the embeddings
+    sidecar, so the delivery never waits on the embeddings API. Queueing is
+    wrapped: a full queue or any failure just leaves the row without a vector
+    (`python -m agent.embeddings` backfills it later). With the flag off this is
     byte-for-byte identical to the prior behavior.
     """
-    path = _path()
-    row = package
+    with _LOCK:
+        _DELIVERIES.append(json.dumps(package, ensure_ascii=False))
     if _embeddings_enabled():
         try:
-            vector = _idea_embedding(str(package.get("idea", "")))
-            if vector:
-                row = dict(package)
-                row[_EMBEDDING_KEY] = vector
+            from . import embeddings
+
+            embeddings.enqueue(str(package.get("tracking_id", "")), str(package.get("idea", "")))
         except Exception:
-            row = package  # any failure → write the original row, no embedding
-    with _LOCK:
+            pass  # no vector for this row; the backfill picks it up
+
+
+# ---- the in-process index ------------------------------------------------------
+# The JSONL files stay the system of record AND the import/export format: copy one
+# in (or hand-edit it) and the next read picks it up. What changed is that reads
+# no longer re-parse the whole file every call. Each log keeps an in-process index
+# of its bounded tail, validated on every read by a single os.stat():
+#
+#   - unchanged file (same path/inode/size/mtime) -> served straight from memory;
+#   - same inode, grown                            -> parse ONLY the appended bytes;
+#   - anything else (replaced, truncated, new path) -> one full reload.
+#
+# Appends are O(1): write one line, then parse it back from the known offset. The
+# trim is incremental — the in-memory view drops its head as it grows, and the
+# file is only rewritten (atomically) once it carries _TRIM_SLACK surplus lines,
+# so the rewrite cost is amortized over many appends instead of paid on each one.
+_TRIM_SLACK = 50
+
+
+class _JsonlLog:
+    """Offset-tracked view of one bounded append-only JSONL log.
+
+    `_entries` mirrors the last `max_lines` PHYSICAL lines of the file (blank and
+    malformed lines included, so trimming keeps the same tail the old full-file
+    trim kept) as (raw_line, parsed_dict_or_None). Every entry has a monotonic
+    sequence number (`_base` + position) so secondary indexes survive head drops.
+    Subclasses maintain those indexes through _reset / _added / _dropped. Caller
+    holds _LOCK for every method.
+    """
+
+    def __init__(self, path_fn: Any, max_lines: int) -> None:
+        self._path_fn = path_fn
+        self._max_lines = max_lines
+        self._signature: tuple[Any, ...] | None = None
+        self._offset = 0  # byte offset just past the last fully-parsed line
+        self._physical = 0  # lines currently in the FILE (>= len(_entries))
+        self._entries: list[tuple[str, dict[str, Any] | None]] = []
+        self._base = 0  # sequence number of _entries[0]
+        self._clear()
+
+    # -- subclass hooks --------------------------------------------------------
+    def _reset(self) -> None:
+        pass
+
+    def _added(self, seq: int, row: dict[str, Any]) -> None:
+        pass
+
+    def _dropped(self, seq: int, row: dict[str, Any]) -> None:
+        pass
+
+    # -- internals -------------------------------------------------------------
+    def _clear(self) -> None:
+        self._entries = []
+        self._base = 0
+        self._offset = 0
+        self._physical = 0
+        self._reset()
+
+    def _row_at(self, seq: int) -> dict[str, Any] | None:
+        return self._entries[seq - self._base][1]
+
+    def _push(self, raw: str) -> None:
+        line = raw.strip()
+        row: dict[str, Any] | None = None
+        if line:
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                obj = None
+            if isinstance(obj, dict):
+                row = obj
+        seq = self._base + len(self._entries)
+        self._entries.append((raw, row))
+        self._physical += 1
+        if row is not None:
+            self._added(seq, row)
+        while len(self._entries) > self._max_lines:
+            _raw, dropped = self._entries.pop(0)
+            if dropped is not None:
+                self._dropped(self._base, dropped)
+            self._base += 1
+
+    def _consume(self, chunk: bytes) -> None:
+        """Index every COMPLETE line in `chunk` (read from self._offset). A torn
+        final line (a writer mid-append) is left for the next read."""
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+        for raw in chunk[:end].split(b"\n"):
+            self._push(raw.decode("utf-8", errors="replace").rstrip("\r"))
+        self._offset += end + 1
+
+    def sync(self) -> None:
+        """Bring the index in line with the file on disk. Never raises."""
+        path = self._path_fn()
+        try:
+            st = path.stat()
+        except OSError:
+            if self._signature is not None:
+                self._signature = None
+                self._clear()
+            return
+        signature = (str(path), st.st_ino, st.st_size, st.st_mtime_ns)
+        if signature == self._signature:
+            return
+        previous = self._signature
+        # Appends only ever grow the file; a same-size change is an in-place edit.
+        grown = previous is not None and previous[:2] == signature[:2] and st.st_size > previous[2]
+        if not grown:
+            self._clear()
+        try:
+            with path.open("rb") as fh:
+                fh.seek(self._offset)
+                chunk = fh.read()
+        except OSError:
+            return
+        self._consume(chunk)
+        self._signature = signature
+
+    def append(self, line: str) -> None:
+        """Append one JSONL line, index it, and trim the file when it's due."""
+        self.extend([line])
+
+    def extend(self, lines: list[str]) -> None:
+        """Append several JSONL lines in one write (same indexing + trimming)."""
+        if not lines:
+            return
+        self.sync()  # pick up any external change BEFORE our offset moves
+        path = self._path_fn()
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(row, ensure_ascii=False) + "\n")
-        _trim(path)
+            fh.write("".join(line + "\n" for line in lines))
+        self.sync()
+        if self._physical > self._max_lines + _TRIM_SLACK:
+            self._rewrite(path)
+
+    def _rewrite(self, path: Path) -> None:
+        """Atomically rewrite the file as the indexed tail (temp file + os.replace,
+        so a crash mid-trim can't leave a truncated log)."""
+        tail = "".join(raw + "\n" for raw, _row in self._entries)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(tail)
+            os.replace(tmp, path)
+            st = path.stat()
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+        self._signature = (str(path), st.st_ino, st.st_size, st.st_mtime_ns)
+        self._offset = st.st_size
+        self._physical = len(self._entries)
+
+    # -- reads -----------------------------------------------------------------
+    def rows(self) -> list[dict[str, Any]]:
+        """Every parseable row in file order (oldest -> newest)."""
+        return [row for _raw, row in self._entries if row is not None]
+
+
+class _DeliveriesLog(_JsonlLog):
+    """The deliveries log plus its secondary indexes:
+
+      - `_by_tid`: upper-cased tracking_id -> seq of its NEWEST row (get());
+      - `_by_domain`: lower-cased domain -> seq of its newest row, ordered oldest
+        -> newest delivery (the deduped recent() view is this, reversed);
+      - running aggregates over that deduped view (stats()), adjusted as a
+        domain's newest row is replaced or ages out of the window;
+      - `embedded`: tracking_id -> seq of its newest row carrying an idea
+        embedding, plus the seqs not yet folded into the embedding matrix;
+      - `ideas`: an inverted token index (stemmed idea token -> seqs) for the
+        token-overlap niche recall.
+    """
 
+    def _reset(self) -> None:
+        self.count = 0
+        self._by_tid: dict[str, int] = {}
+        self._by_domain: OrderedDict[str, int] = OrderedDict()
+        self._verdicts = {"build": 0, "pivot": 0, "pass": 0}
+        self._score_sum = 0.0
+        self._score_n = 0
+        self._secured = 0.0
+        self._tlds: Counter[str] = Counter()
+        self._themes: Counter[str] = Counter()
+        # Newest deduped row carrying each TLD / theme: stats() breaks count ties
+        # newest-first, the order the old newest-first scan first met them in.
+        self._tld_seen: dict[str, int] = {}
+        self._theme_seen: dict[str, int] = {}
+        self.embedded: dict[str, int] = {}
+        self.unindexed: list[int] = []
+        self.ideas = TokenIndex()
+
+    def _tally(self, seq: int, row: dict[str, Any], sign: int, tokens: frozenset[str]) -> None:
+        """Add (sign=1) or remove (sign=-1) one deduped row from the aggregates."""
+        v = row.get("verdict") or {}
+        call = str(v.get("call", "")).lower()
+        if call in self._verdicts:
+            self._verdicts[call] += sign
+        if isinstance(v.get("score"), (int, float)):
+            self._score_sum += sign * float(v["score"])
+            self._score_n += sign
+        price = row.get("price_usd")
+        if isinstance(price, (int, float)):
+            self._secured += sign * float(price)
+        domain = str(row.get("domain", ""))
+        if "." in domain:
+            tld = domain.rsplit(".", 1)[-1]
+            self._tlds[tld] += sign
+            # No fallback needed on removal: a superseded row's TLD comes straight
+            # back with its domain's new row, and a dropped row is the oldest.
+            if sign > 0:
+                self._tld_seen[tld] = seq
+        for tok in tokens:
+            self._themes[tok] += sign
+            if sign > 0:
+                self._theme_seen[tok] = seq
+            elif self._theme_seen.get(tok) == seq:
+                # The superseding row may not carry this token: fall back to the
+                # newest other deduped row that does.
+                newest = max((s for s in self.ideas.docs(tok) if s != seq and self._deduped_at(s)), default=None)
+                if newest is None:
+                    self._theme_seen.pop(tok, None)
+                else:
+                    self._theme_seen[tok] = newest
+
+    def _deduped_at(self, seq: int) -> bool:
+        """Whether `seq` is still its domain's newest row."""
+        row = self._row_at(seq)
+        return row is not None and self._by_domain.get(str(row.get("domain", "")).lower()) == seq
+
+    def _added(self, seq: int, row: dict[str, Any]) -> None:
+        self.count += 1
+        self._by_tid[str(row.get("tracking_id", "")).upper()] = seq
+        domain = str(row.get("domain", "")).lower()
+        prior = self._by_domain.pop(domain, None)
+        if prior is not None:
+            self._tally(prior, self._row_at(prior) or {}, -1, self.ideas.tokens(prior))
+        self._by_domain[domain] = seq
+        tokens = frozenset(_tokens(str(row.get("idea", ""))))
+        self.ideas.add(seq, tokens)
+        self._tally(seq, row, 1, tokens)
+        if isinstance(row.get(_EMBEDDING_KEY), list) and row[_EMBEDDING_KEY]:
+            self.embedded[str(row.get("tracking_id", "")).upper()] = seq
+            self.unindexed.append(seq)
+
+    def _dropped(self, seq: int, row: dict[str, Any]) -> None:
+        self.count -= 1
+        tid = str(row.get("tracking_id", "")).upper()
+        if self._by_tid.get(tid) == seq:
+            del self._by_tid[tid]
+        if self.embedded.get(tid) == seq:
+            del self.embedded[tid]
+        domain = str(row.get("domain", "")).lower()
+        if self._by_domain.get(domain) == seq:
+            del self._by_domain[domain]
+            self._tally(seq, row, -1, self.ideas.tokens(seq))
+        self.ideas.remove(seq)
+
+    def newest(self, tracking_id: str) -> dict[str, Any] | None:
+        seq = self._by_tid.get(tracking_id)
+        return None if seq is None else self._row_at(seq)
+
+    def deduped(self, limit: int) -> list[dict[str, Any]]:
+        """Newest row per domain, newest delivery first."""
+        out: list[dict[str, Any]] = []
+        for seq in reversed(self._by_domain.values()):
+            row = self._row_at(seq)
+            if row is not None:
+                out.append(row)
+            if len(out) >= limit:
+                break
+        return out
+
+    def aggregates(self) -> dict[str, Any]:
+        def top(counts: Counter[str], seen: dict[str, int], n: int) -> list[tuple[str, int]]:
+            live = ((k, c) for k, c in counts.items() if c > 0)
+            return sorted(live, key=lambda kv: (-kv[1], -seen.get(kv[0], 0), kv[0]))[:n]
 
-def _trim(path: Path) -> None:
+        return {
+            "verdicts": dict(self._verdicts),
+            "avgScore": round(self._score_sum / self._score_n) if self._score_n else 0,
+            "securedValueUsd": round(self._secured, 2),
+            "topTlds": [{"tld": t, "count": c} for t, c in top(self._tlds, self._tld_seen, 4)],
+            # Only themes that recur — the lakehouse spotting contested spaces.
+            "topThemes": [{"token": t, "count": c} for t, c in top(self._themes, self._theme_seen, 6) if c > 1],
+        }
+
+
+class _OutcomesLog(_JsonlLog):
+    """The outcomes log plus a latest-wins map: upper-cased tracking_id -> seq."""
+
+    def _reset(self) -> None:
+        self._latest: dict[str, int] = {}
+
+    @staticmethod
+    def _tid(row: dict[str, Any]) -> str:
+        return str(row.get("tracking_id", "")).strip().upper()
+
+    def _added(self, seq: int, row: dict[str, Any]) -> None:
+        tid = self._tid(row)
+        if tid:
+            self._latest[tid] = seq
+
+    def _dropped(self, seq: int, row: dict[str, Any]) -> None:
+        tid = self._tid(row)
+        if tid and self._latest.get(tid) == seq:
+            del self._latest[tid]
+
+    def latest(self) -> dict[str, dict[str, Any]]:
+        out: dict[str, dict[str, Any]] = {}
+        for tid, seq in self._latest.items():
+            row = self._row_at(seq)
+            if row is not None:
+                out[tid] = _strip_outcome_row(row)
+        return out
+
+    def latest_for(self, tracking_id: str) -> dict[str, Any] | None:
+        seq = self._latest.get(tracking_id)
+        row = None if seq is None else self._row_at(seq)
+        return None if row is None else _strip_outcome_row(row)
+
+
+class _EmbeddingsLog(_JsonlLog):
+    """The embeddings sidecar: upper-cased tracking_id -> seq of its newest
+    vector line, plus the seqs not yet folded into the embedding matrix."""
+
+    def _reset(self) -> None:
+        self.vectors: dict[str, int] = {}
+        self.unindexed: list[int] = []
+
+    def _added(self, seq: int, row: dict[str, Any]) -> None:
+        tid = str(row.get("tracking_id", "")).upper()
+        if tid and isinstance(row.get("vector"), list) and row["vector"]:
+            self.vectors[tid] = seq
+            self.unindexed.append(seq)
+
+    def _dropped(self, seq: int, row: dict[str, Any]) -> None:
+        tid = str(row.get("tracking_id", "")).upper()
+        if self.vectors.get(tid) == seq:
+            del self.vectors[tid]
+
+    def vector(self, tracking_id: str) -> list[float] | None:
+        seq = self.vectors.get(tracking_id)
+        row = None if seq is None else self._row_at(seq)
+        return None if row is None else row.get("vector")
+
+
+_DELIVERIES = _DeliveriesLog(_path, _MAX_LINES)
+_OUTCOMES = _OutcomesLog(_outcomes_path, _MAX_OUTCOME_LINES)
+_EMBEDDINGS = _EmbeddingsLog(_embeddings_path, _MAX_EMBEDDING_LINES)
+_VECTORS: EmbeddingIndex | None = None
+
+
+def _has_vector(tracking_id: str) -> bool:
+    """Liveness for the matrix: a logged delivery with a vector on record."""
+    return tracking_id in _DELIVERIES.embedded or (
+        tracking_id in _DELIVERIES._by_tid and tracking_id in _EMBEDDINGS.vectors
+    )
+
+
+def _vector_index(dim: int | None = None) -> EmbeddingIndex | None:
+    """The embedding matrix for the current log, caught up with it. Caller holds
+    _LOCK. None when NumPy is missing or anything goes wrong (callers fall back).
+
+    Folds in every vector the deliveries index and the embeddings sidecar haven't
+    handed over yet (new appends, or ALL of them after a reload / log switch —
+    already-present ids are skipped), and compacts away rows that aged out of the
+    log. A `dim` differing from the matrix's (the embedding model changed)
+    rebuilds it at that dim.
+    """
+    global _VECTORS
+    if not _vectors_available():
+        return None
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return
-    if len(lines) > _MAX_LINES:
-        path.write_text("\n".join(lines[-_MAX_LINES:]) + "\n", encoding="utf-8")
+        _EMBEDDINGS.sync()
+        base = _path()
+        rebuild = _VECTORS is None or _VECTORS.base != base
+        if rebuild:
+            _VECTORS = EmbeddingIndex(base)
+        if dim is not None and _VECTORS.dim is not None and dim != _VECTORS.dim:
+            _VECTORS.reset(dim)
+            rebuild = True
+        if rebuild:
+            _DELIVERIES.unindexed = list(_DELIVERIES.embedded.values())
+            _EMBEDDINGS.unindexed = list(_EMBEDDINGS.vectors.values())
+        for log, key in ((_DELIVERIES, _EMBEDDING_KEY), (_EMBEDDINGS, "vector")):
+            pending, log.unindexed = log.unindexed, []
+            for seq in pending:
+                if seq < log._base:
+                    continue  # aged out before it was indexed
+                row = log._row_at(seq) or {}
+                tid = str(row.get("tracking_id", "")).upper()
+                if tid and tid not in _VECTORS:
+                    _VECTORS.add(tid, row.get(key) or [])
+        _VECTORS.compact(_has_vector, len(_DELIVERIES.embedded) + len(_EMBEDDINGS.vectors))
+        return _VECTORS
+    except Exception:
+        return None
+
+
+def store_embeddings(pairs: list[tuple[str, list[float]]]) -> int:
+    """Persist (tracking_id, idea vector) pairs to the embeddings sidecar in one
+    append and fold them into the matrix. Ids that already have a vector are
+    skipped (the worker and a backfill can race). Returns how many were stored."""
+    with _LOCK:
+        _DELIVERIES.sync()
+        _EMBEDDINGS.sync()
+        lines: list[str] = []
+        seen: set[str] = set()
+        for tracking_id, vector in pairs:
+            tid = (tracking_id or "").strip().upper()
+            if not tid or not vector or tid in seen or tid in _DELIVERIES.embedded or tid in _EMBEDDINGS.vectors:
+                continue
+            seen.add(tid)
+            lines.append(json.dumps({"tracking_id": tid, "vector": [float(x) for x in vector]}))
+        _EMBEDDINGS.extend(lines)
+        if lines:
+            _vector_index()
+        return len(lines)
+
+
+def missing_embeddings() -> list[tuple[str, str]]:
+    """(tracking_id, idea) for every logged delivery with no vector yet, oldest
+    first — the backfill's work list (it shrinks as vectors are stored)."""
+    with _LOCK:
+        _DELIVERIES.sync()
+        _EMBEDDINGS.sync()
+        out: list[tuple[str, str]] = []
+        for tid, seq in sorted(_DELIVERIES._by_tid.items(), key=lambda kv: kv[1]):
+            if not tid or _has_vector(tid):
+                continue
+            idea = str((_DELIVERIES._row_at(seq) or {}).get("idea", "")).strip()
+            if idea:
+                out.append((tid, idea))
+        return out
 
 
 def _read_all() -> list[dict[str, Any]]:
-    path = _path()
-    try:
-        raw = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return []
-    out: list[dict[str, Any]] = []
-    for line in raw:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(obj, dict):
-            out.append(obj)
-    return out
+    """Every delivery row in log order (oldest -> newest), from the index."""
+    with _LOCK:
+        _DELIVERIES.sync()
+        return _DELIVERIES.rows()
 
 
 def count_all() -> int:
@@ -157,29 +589,26 @@ def count_all() -> int:
 
     `recent()` dedupes by domain for the gallery, which undercounts real activity
     when the same idea/domain ships more than once. Use this for headline totals.
+    Maintained by the index, so it's O(1).
     """
-    return len(_read_all())
+    with _LOCK:
+        _DELIVERIES.sync()
+        return _DELIVERIES.count
 
 
 def recent(limit: int = 24) -> list[dict[str, Any]]:
     """The most recent deliveries, newest first, deduped by domain.
 
     Each returned row has its LATEST captured outcome folded in as an `outcome`
-    field (best-effort; absent/None when none exists). The outcome lookup is done
-    once over the whole outcome log (latest-wins) so the dock/list reads stay one
-    pass; a missing/corrupt outcome log simply yields rows with no outcome."""
+    field (best-effort; absent/None when none exists). Both come straight off the
+    indexes (newest row per domain; latest outcome per id), so this costs one
+    stat() per log plus `limit` lookups — no file parse. A missing/corrupt outcome
+    log simply yields rows with no outcome."""
     latest = _latest_outcomes()
-    seen: set[str] = set()
-    out: list[dict[str, Any]] = []
-    for obj in reversed(_read_all()):
-        domain = str(obj.get("domain", "")).lower()
-        if domain in seen:
-            continue
-        seen.add(domain)
-        out.append(_with_outcome(obj, latest))
-        if len(out) >= limit:
-            break
-    return out
+    with _LOCK:
+        _DELIVERIES.sync()
+        rows = _DELIVERIES.deduped(limit)
+    return [_with_outcome(obj, latest) for obj in rows]
 
 
 def get(tracking_id: str) -> dict[str, Any] | None:
@@ -192,10 +621,12 @@ def get(tracking_id: str) -> dict[str, Any] | None:
     tid = (tracking_id or "").strip().upper()
     if not tid:
         return None
-    for obj in reversed(_read_all()):
-        if str(obj.get("tracking_id", "")).upper() == tid:
-            return _with_outcome(obj, {tid: outcome_for(tid)})
-    return None
+    with _LOCK:
+        _DELIVERIES.sync()
+        obj = _DELIVERIES.newest(tid)
+    if obj is None:
+        return None
+    return _with_outcome(obj, {tid: outcome_for(tid)})
 
 
 # ---- outcome capture: the labeled feature store (CAPTURE-ONLY) ----------------
@@ -207,34 +638,6 @@ def _utc_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _atomic_append(path: Path, line: str, max_lines: int) -> None:
-    """Append one JSONL line, then atomically rewrite a bounded tail.
-
-    Mirrors the existing write model (lock-held append + trim) but the trim
-    rewrites via a temp file + os.replace so a crash mid-trim can't leave a
-    truncated log. Caller holds _LOCK."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(line + "\n")
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return
-    if len(lines) <= max_lines:
-        return
-    tail = "\n".join(lines[-max_lines:]) + "\n"
-    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".", suffix=".tmp")
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as fh:
-            fh.write(tail)
-        os.replace(tmp, path)
-    except OSError:
-        try:
-            os.unlink(tmp)
-        except OSError:
-            pass
-
-
 def _validate_outcome(outcome: dict[str, Any]) -> dict[str, Any] | None:
     """Validate + normalize a raw outcome dict. Returns the clean dict or None.
 
@@ -298,32 +701,12 @@ def record_outcome(tracking_id: str, outcome: dict[str, Any]) -> dict[str, Any]
     row = {"tracking_id": tid, **stamped}
     try:
         with _LOCK:
-            _atomic_append(_outcomes_path(), json.dumps(row, ensure_ascii=False), _MAX_OUTCOME_LINES)
+            _OUTCOMES.append(json.dumps(row, ensure_ascii=False))
     except Exception:
         pass  # never raise into the caller; return the accepted outcome anyway
     return stamped
 
 
-def _read_outcomes() -> list[dict[str, Any]]:
-    """All outcome rows in file order (oldest -> newest). Best-effort; [] on miss."""
-    try:
-        raw = _outcomes_path().read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return []
-    out: list[dict[str, Any]] = []
-    for line in raw:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(obj, dict) and obj.get("tracking_id"):
-            out.append(obj)
-    return out
-
-
 def _strip_outcome_row(row: dict[str, Any]) -> dict[str, Any]:
     """The outcome row minus its routing key, ready to fold onto a delivery."""
     return {k: v for k, v in row.items() if k != "tracking_id"}
@@ -332,17 +715,15 @@ def _strip_outcome_row(row: dict[str, Any]) -> dict[str, Any]:
 def _latest_outcomes() -> dict[str, dict[str, Any]]:
     """Map upper-cased tracking_id -> its LATEST outcome (latest-wins).
 
-    Append-only log => the last row for an id is the current one. Best-effort:
-    any read/parse failure yields an empty map (rows then carry no outcome)."""
-    latest: dict[str, dict[str, Any]] = {}
+    Append-only log => the last row for an id is the current one; the outcomes
+    index tracks exactly that. Best-effort: any read failure yields an empty map
+    (rows then carry no outcome)."""
     try:
-        for row in _read_outcomes():  # oldest -> newest; last write wins
-            tid = str(row.get("tracking_id", "")).strip().upper()
-            if tid:
-                latest[tid] = _strip_outcome_row(row)
+        with _LOCK:
+            _OUTCOMES.sync()
+            return _OUTCOMES.latest()
     except Exception:
         return {}
-    return latest
 
 
 def outcome_for(tracking_id: str) -> dict[str, Any] | None:
@@ -353,11 +734,9 @@ def outcome_for(tracking_id: str) -> dict[str, Any] | None:
     if not tid:
         return None
     try:
-        latest: dict[str, Any] | None = None
-        for row in _read_outcomes():  # oldest -> newest; keep the last match
-            if str(row.get("tracking_id", "")).strip().upper() == tid:
-                latest = _strip_outcome_row(row)
-        return latest
+        with _LOCK:
+            _OUTCOMES.sync()
+            return _OUTCOMES.latest_for(tid)
     except Exception:
         return None
 
@@ -383,57 +762,76 @@ def _with_outcome(row: dict[str, Any], latest: dict[str, dict[str, Any] | None])
 def stats() -> dict[str, Any]:
     """Dataset-level intelligence over the whole lakehouse — the lakehouse *doing*
     something, not just storing. Powers the Loading Dock's aggregate panel.
+
+    Served from counters the deliveries index maintains over the domain-deduped
+    view (one row per distinct domain, its newest delivery), so it's a constant-
+    time read however long the log. Ties in topTlds/topThemes keep the order the
+    newest-first view meets them in (then by name within one delivery).
     """
-    rows = recent(limit=1000)  # deduped by domain, newest-first
-    verdicts = {"build": 0, "pivot": 0, "pass": 0}
-    scores: list[float] = []
-    secured = 0.0
-    tld_counts: dict[str, int] = {}
-    theme_counts: dict[str, int] = {}
+    with _LOCK:
+        _DELIVERIES.sync()
+        return {
+            # TRUE total (every logged delivery), not the domain-deduped count, so
+            # repeated ideas/domains aren't undercounted. Per-bucket aggregations
+            # stay on the deduped view (one row per distinct domain).
+            "total": _DELIVERIES.count,
+            **_DELIVERIES.aggregates(),
+        }
 
-    for r in rows:
-        v = r.get("verdict") or {}
-        call = str(v.get("call", "")).lower()
-        if call in verdicts:
-            verdicts[call] += 1
-        if isinstance(v.get("score"), (int, float)):
-            scores.append(float(v["score"]))
-        price = r.get("price_usd")
-        if isinstance(price, (int, float)):
-            secured += float(price)
-        domain = str(r.get("domain", ""))
-        if "." in domain:
-            tld_counts[domain.rsplit(".", 1)[-1]] = tld_counts.get(domain.rsplit(".", 1)[-1], 0) + 1
-        for tok in _tokens(str(r.get("idea", ""))):
-            theme_counts[tok] = theme_counts.get(tok, 0) + 1
 
-    top = lambda d, n: sorted(d.items(), key=lambda kv: -kv[1])[:n]  # noqa: E731
-    return {
-        # TRUE total (every logged delivery), not the domain-deduped `rows` count, so
-        # repeated ideas/domains aren't undercounted. Per-bucket aggregations below
-        # stay on the deduped `rows` (one row per distinct domain).
-        "total": count_all(),
-        "verdicts": verdicts,
-        "avgScore": round(sum(scores) / len(scores)) if scores else 0,
-        "securedValueUsd": round(secured, 2),
-        "topTlds": [{"tld": t, "count": c} for t, c in top(tld_counts, 4)],
-        # Only themes that recur — the lakehouse spotting contested spaces.
-        "topThemes": [{"token": t, "count": c} for t, c in top(theme_counts, 6) if c > 1],
-    }
+def _bm25_enabled() -> bool:
+    """OPT-IN BM25 ranking for token-overlap recall (NICHE_BM25=1). Default OFF:
+    plain shared-token count, exactly the original ranking."""
+    return os.getenv("NICHE_BM25", "0").strip() == "1"
 
 
 def _for_niche_tokens(idea: str, *, limit: int = 8) -> list[dict[str, Any]]:
-    """The original token-overlap recall — the always-available fallback."""
+    """The original token-overlap recall — the always-available fallback.
+
+    Scored off the inverted token index: only past deliveries sharing a token
+    with this idea are touched, ranked by overlap (ties: older delivery first,
+    as the original stable sort over the log did).
+    """
     idea_tokens = _tokens(idea)
     if not idea_tokens:
         return []
-    scored: list[tuple[int, dict[str, Any]]] = []
-    for obj in _read_all():
-        overlap = len(idea_tokens & _tokens(str(obj.get("idea", ""))))
-        if overlap:
-            scored.append((overlap, obj))
+    with _LOCK:
+        _DELIVERIES.sync()
+        ranked = _DELIVERIES.ideas.query(idea_tokens, limit=limit, bm25=_bm25_enabled())
+        return [row for seq, _score in ranked if (row := _DELIVERIES._row_at(seq)) is not None]
+
+
+def _semantic_scan(query: list[float], limit: int) -> list[dict[str, Any]]:
+    """Pure-python cosine over every embedded row — the no-NumPy path."""
+    with _LOCK:
+        _DELIVERIES.sync()
+        _EMBEDDINGS.sync()
+        candidates = [
+            (obj, obj.get(_EMBEDDING_KEY) or _EMBEDDINGS.vector(str(obj.get("tracking_id", "")).upper()))
+            for obj in _DELIVERIES.rows()
+        ]
+    scored: list[tuple[float, dict[str, Any]]] = []
+    for obj, vec in candidates:
+        if isinstance(vec, list) and vec:
+            sim = _cosine(query, vec)
+            if sim is not None:
+                scored.append((sim, obj))
     scored.sort(key=lambda pair: pair[0], reverse=True)
-    return [obj for _overlap, obj in scored[:limit]]
+    return [obj for _sim, obj in scored[:limit]]
+
+
+def _semantic_matrix(query: list[float], limit: int) -> list[dict[str, Any]] | None:
+    """Top-k off the memmapped embedding matrix (one mat-vec + argpartition).
+    None when the matrix can't answer (no NumPy, nothing indexed, dim mismatch)."""
+    with _LOCK:
+        _DELIVERIES.sync()
+        index = _vector_index(dim=len(query))
+        if index is None:
+            return None
+        hits = index.search(query, limit, _has_vector)
+        if hits is None:
+            return None
+        return [row for tid, _sim in hits if (row := _DELIVERIES.newest(tid)) is not None]
 
 
 def for_niche_semantic(idea: str, *, limit: int = 8) -> list[dict[str, Any]]:
@@ -441,10 +839,12 @@ def for_niche_semantic(idea: str, *, limit: int = 8) -> list[dict[str, Any]]:
     to this idea's embedding.
 
     Only engages when NICHE_EMBEDDINGS=1 AND we can embed this idea AND at least
-    one past row carries a stored embedding. In every other case — flag off, no
+    one past row has a stored embedding (inline or in the sidecar). In every other case — flag off, no
     embeddings provider, no embedded rows, or ANY error — it FALLS BACK to the
-    token-overlap recall, so it's always safe to call. Operates over the local
-    JSONL mirror; the same vectors would back an Iceberg vector recall on Tower.
+    token-overlap recall, so it's always safe to call. Ranking runs off the
+    NumPy embedding matrix (embedding_index) when NumPy is installed, else a
+    pure-python scan of the JSONL mirror; the same vectors would back an Iceberg
+    vector recall on Tower.
     """
     try:
         if not _embeddings_enabled():
@@ -452,18 +852,13 @@ def for_niche_semantic(idea: str, *, limit: int = 8) -> list[dict[str, Any]]:
         query = _idea_embedding(idea)
         if not query:
             return _for_niche_tokens(idea, limit=limit)
-        scored: list[tuple[float, dict[str, Any]]] = []
-        for obj in _read_all():
-            vec = obj.get(_EMBEDDING_KEY)
-            if isinstance(vec, list) and vec:
-                sim = _cosine(query, vec)
-                if sim is not None:
-                    scored.append((sim, obj))
-        if not scored:
+        ranked = _semantic_matrix(query, limit)
+        if ranked is None:
+            ranked = _semantic_scan(query, limit)
+        if not ranked:
             # No embedded history yet — keep behavior useful via token overlap.
             return _for_niche_tokens(idea, limit=limit)
-        scored.sort(key=lambda pair: pair[0], reverse=True)
-        return [obj for _sim, obj in scored[:limit]]
+        return ranked
     except Exception:
         return _for_niche_tokens(idea, limit=limit)
 
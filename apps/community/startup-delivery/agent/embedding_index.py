@@ -0,0 +1,224 @@
+"""Persistent, vectorized embedding matrix for niche-memory recall.
+
+deliveries_store.for_niche_semantic used to parse every stored embedding out of
+the JSONL and cosine it in pure Python on every call. This keeps the same vectors
+in a NumPy memmap instead — L2-normalized float32 rows, so cosine is a plain dot
+product — next to a row-id sidecar:
+
+  <log>.vectors.f32   raw float32, row-major, `dim` floats per row (np.memmap)
+  <log>.vectors.ids   "dim=<d>" header line, then one row id per matrix row
+
+Both files are APPEND-ONLY, so adding a row is O(1) and a crash between the two
+appends just leaves a tail the loader ignores (it uses the shorter of the two).
+Rows whose delivery aged out of the bounded log stay in the matrix until they
+outnumber the live ones, then one atomic compaction drops them. Top-k is a
+single matrix-vector product plus argpartition.
+
+The matrix is a DERIVED cache: the JSONL rows remain the system of record, and
+a missing/corrupt/foreign-dimension matrix is just rebuilt from them. NumPy is
+OPTIONAL — `available()` is False without it and the store keeps its pure-Python
+scan. Not thread-safe by itself: deliveries_store calls it under its _LOCK.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# Rebuild once dead rows (aged out of the log) outnumber live ones by this
+# factor; the floor keeps a tiny index from compacting on every trim.
+_COMPACT_FACTOR = 2
+_COMPACT_FLOOR = 64
+# Over-fetch before the liveness filter so a few dead rows near the top don't
+# starve the result; a short page falls back to a full sort.
+_OVERFETCH = 4
+
+
+def _numpy() -> Any | None:
+    try:
+        import numpy
+
+        return numpy
+    except Exception:
+        return None
+
+
+def available() -> bool:
+    """True when NumPy is importable (the vectorized path can engage)."""
+    return _numpy() is not None
+
+
+class EmbeddingIndex:
+    """One memmapped embedding matrix keyed by row id (a tracking id)."""
+
+    def __init__(self, base: Path) -> None:
+        self.base = base
+        self.dim: int | None = None
+        self.ids: list[str] = []
+        self._pos: dict[str, int] = {}
+        self._matrix: Any = None  # np.memmap view, refreshed when rows are added
+        self._load()
+
+    # -- files -----------------------------------------------------------------
+    @property
+    def _vectors_path(self) -> Path:
+        return self.base.with_name(self.base.stem + ".vectors.f32")
+
+    @property
+    def _ids_path(self) -> Path:
+        return self.base.with_name(self.base.stem + ".vectors.ids")
+
+    def _load(self) -> None:
+        """Read the sidecar + size the matrix. Anything inconsistent -> empty."""
+        self.dim, self.ids, self._pos, self._matrix = None, [], {}, None
+        try:
+            lines = self._ids_path.read_text(encoding="utf-8").splitlines()
+            if not lines or not lines[0].startswith("dim="):
+                return
+            dim = int(lines[0][4:])
+            rows = self._vectors_path.stat().st_size // (4 * dim)
+        except (OSError, ValueError):
+            return
+        if dim <= 0:
+            return
+        self.dim = dim
+        self.ids = lines[1 : 1 + rows]
+        self._pos = {rid: i for i, rid in enumerate(self.ids)}
+
+    def _view(self) -> Any:
+        """The (rows, dim) float32 memmap over exactly len(self.ids) rows."""
+        np = _numpy()
+        n = len(self.ids)
+        if np is None or not n or self.dim is None:
+            return None
+        if self._matrix is None or self._matrix.shape[0] != n:
+            self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(n, self.dim))
+        return self._matrix
+
+    def _normalized(self, vector: Iterable[float]) -> Any | None:
+        np = _numpy()
+        try:
+            arr = np.asarray(list(vector), dtype=np.float32)
+        except (TypeError, ValueError):
+            return None
+        if arr.ndim != 1 or not arr.size:
+            return None
+        norm = float(np.linalg.norm(arr))
+        if not np.isfinite(norm) or norm <= 0.0:
+            return None
+        return arr / norm
+
+    # -- writes ----------------------------------------------------------------
+    def __contains__(self, row_id: str) -> bool:
+        return row_id in self._pos
+
+    def add(self, row_id: str, vector: Iterable[float]) -> bool:
+        """Append one row (normalized). False if skipped: no NumPy, already
+        present, zero/invalid vector, or a dimension other than the matrix's."""
+        if _numpy() is None or not row_id or row_id in self._pos:
+            return False
+        arr = self._normalized(vector)
+        if arr is None or (self.dim is not None and arr.size != self.dim):
+            return False
+        try:
+            self.base.parent.mkdir(parents=True, exist_ok=True)
+            if self.dim is None:
+                self._start(int(arr.size))
+            with self._vectors_path.open("ab") as fh:
+                fh.write(arr.tobytes())
+            with self._ids_path.open("a", encoding="utf-8") as fh:
+                fh.write(row_id + "\n")
+        except OSError:
+            self._load()  # resync with whatever actually landed on disk
+            return False
+        self._pos[row_id] = len(self.ids)
+        self.ids.append(row_id)
+        return True
+
+    def _start(self, dim: int) -> None:
+        """Begin an empty matrix of `dim` (truncating any previous one)."""
+        self._vectors_path.write_bytes(b"")
+        self._ids_path.write_text(f"dim={dim}\n", encoding="utf-8")
+        self.dim, self.ids, self._pos, self._matrix = dim, [], {}, None
+
+    def reset(self, dim: int | None = None) -> None:
+        """Drop every row (e.g. the embedding model changed dimension)."""
+        try:
+            if dim is None:
+                for path in (self._vectors_path, self._ids_path):
+                    path.unlink(missing_ok=True)
+                self.dim, self.ids, self._pos, self._matrix = None, [], {}, None
+            else:
+                self._start(dim)
+        except OSError:
+            self._load()
+
+    def compact(self, live: Callable[[str], bool], live_count: int) -> None:
+        """Rewrite the matrix keeping only live rows, once dead ones dominate
+        (`live_count` makes the not-yet check O(1)). The ids sidecar is removed
+        FIRST and rewritten last, each file atomically (temp + os.replace): a crash
+        in between leaves no sidecar, which loads as empty and is rebuilt from the
+        log — never ids misaligned with rows."""
+        np = _numpy()
+        if len(self.ids) <= max(_COMPACT_FLOOR, _COMPACT_FACTOR * live_count):
+            return
+        matrix = self._view()
+        if np is None or matrix is None:
+            return
+        keep = [i for i, rid in enumerate(self.ids) if live(rid)]
+        ids = [self.ids[i] for i in keep]
+        data = np.ascontiguousarray(matrix[keep]).tobytes() if keep else b""
+        self._matrix = None  # release the old mapping before replacing the file
+        try:
+            self._ids_path.unlink(missing_ok=True)
+            _atomic_write(self._vectors_path, data)
+            header = f"dim={self.dim}\n"
+            _atomic_write(self._ids_path, (header + "".join(f"{rid}\n" for rid in ids)).encode("utf-8"))
+        except OSError:
+            self._load()
+            return
+        self.ids = ids
+        self._pos = {rid: i for i, rid in enumerate(ids)}
+
+    # -- reads -----------------------------------------------------------------
+    def search(self, query: Iterable[float], k: int, live: Callable[[str], bool]) -> list[tuple[str, float]] | None:
+        """Top-k (row_id, cosine) among live rows, best first.
+
+        None means "can't answer" (no NumPy, empty matrix, bad query, dimension
+        mismatch) so the caller falls back; [] means "answered, nothing live".
+        """
+        np = _numpy()
+        matrix = self._view()
+        if np is None or matrix is None or k <= 0:
+            return None
+        q = self._normalized(query)
+        if q is None or q.size != self.dim:
+            return None
+        sims = matrix @ q
+        n = sims.shape[0]
+        fetch = min(n, k * _OVERFETCH)
+        while True:
+            if fetch >= n:
+                order = np.argsort(-sims, kind="stable")
+            else:
+                top = np.argpartition(-sims, fetch - 1)[:fetch]
+                order = top[np.lexsort((top, -sims[top]))]  # ties: older row first
+            out = [(self.ids[i], float(sims[i])) for i in order.tolist() if live(self.ids[i])]
+            if len(out) >= k or fetch >= n:
+                return out[:k]
+            fetch = n
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,158 @@
+"""Batched idea embeddings, off the delivery hot path — plus a resumable backfill.
+
+record() used to embed its idea inline (one `embed([idea])` round-trip while the
+delivery request was still open), and rows logged before NICHE_EMBEDDINGS=1 never
+got a vector at all. Now:
+
+  - `enqueue(tracking_id, idea)` is all record() does: a background worker
+    collects queued ideas for up to EMBED_BATCH_WAIT_MS (or EMBED_BATCH_SIZE of
+    them) and embeds the whole batch in ONE `embed()` call;
+  - vectors land in the deliveries log's embeddings SIDECAR
+    (`<log>.embeddings.jsonl`, via deliveries_store.store_embeddings), which the
+    semantic recall and the NumPy matrix read alongside legacy inline vectors;
+  - `python -m agent.embeddings` backfills every logged delivery that has no
+    vector yet, in chunks. Progress IS the sidecar, so an interrupted run just
+    resumes where it stopped.
+
+Best-effort throughout: a failed batch is dropped (the backfill picks it up
+later) and nothing here ever raises into a delivery. stdlib-only.
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+
+from . import deliveries_store
+from ._env import env_int
+
+log = logging.getLogger("agent.embeddings")
+
+_BATCH_SIZE = env_int("EMBED_BATCH_SIZE", 16)
+_BATCH_WAIT_S = env_int("EMBED_BATCH_WAIT_MS", 250) / 1000.0
+# Bounded so an embeddings outage can't grow memory without limit; overflow is
+# dropped (and left to the backfill).
+_QUEUE: "queue.Queue[tuple[str, str]]" = queue.Queue(maxsize=env_int("EMBED_QUEUE_MAX", 1000))
+
+_WORKER: threading.Thread | None = None
+_WORKER_LOCK = threading.Lock()
+
+
+def _embed_batch(batch: list[tuple[str, str]]) -> int | None:
+    """Embed one batch in a single call and store it. Returns vectors stored
+    (0 when every id already had one), or None when the provider call failed."""
+    from .clients import _openrouter
+
+    vectors = _openrouter.embed([idea for _tid, idea in batch])
+    if not vectors or len(vectors) != len(batch):
+        return None
+    return deliveries_store.store_embeddings(
+        [(tid, vec) for (tid, _idea), vec in zip(batch, vectors) if vec]
+    )
+
+
+def _take_batch(first: tuple[str, str]) -> list[tuple[str, str]]:
+    """`first` plus whatever else arrives within the batch window / size cap."""
+    batch = [first]
+    deadline = time.monotonic() + _BATCH_WAIT_S
+    while len(batch) < _BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_QUEUE.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _run() -> None:
+    while True:
+        batch = _take_batch(_QUEUE.get())
+        try:
+            _embed_batch(batch)
+        except Exception as exc:
+            log.warning("embedding batch failed size=%d error=%r", len(batch), exc)
+        finally:
+            for _ in batch:
+                _QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    global _WORKER
+    if _WORKER is not None:
+        return
+    with _WORKER_LOCK:
+        if _WORKER is None:
+            _WORKER = threading.Thread(target=_run, name="embeddings", daemon=True)
+            _WORKER.start()
+            atexit.register(drain, 5.0)
+
+
+def enqueue(tracking_id: str, idea: str) -> bool:
+    """Queue one delivery's idea for embedding. Never blocks, never raises;
+    False when there's nothing to embed or the queue is full."""
+    tid = (tracking_id or "").strip().upper()
+    idea = (idea or "").strip()
+    if not tid or not idea:
+        return False
+    try:
+        _QUEUE.put_nowait((tid, idea))
+    except queue.Full:
+        return False
+    _ensure_worker()
+    return True
+
+
+def drain(timeout: float = 5.0) -> bool:
+    """Wait up to `timeout` s for queued ideas to be embedded (tests, shutdown)."""
+    deadline = time.monotonic() + timeout
+    while _QUEUE.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def backfill(*, chunk: int = 64, limit: int | None = None, out=sys.stdout) -> int:
+    """Embed every logged delivery without a vector, `chunk` ideas per call.
+
+    Each chunk is stored before the next is requested, so an interrupted run
+    loses at most one chunk and a rerun skips everything already done. Stops
+    early when a chunk fails (provider down / no key). Returns vectors stored.
+    """
+    todo = deliveries_store.missing_embeddings()
+    if limit is not None:
+        todo = todo[:limit]
+    print(f"backfill: {len(todo)} deliveries without an embedding", file=out)
+    stored = 0
+    for start in range(0, len(todo), max(1, chunk)):
+        batch = todo[start : start + max(1, chunk)]
+        added = _embed_batch(batch)
+        # 0 is fine: the background worker embedded the chunk meanwhile.
+        if added is None:
+            print(f"backfill: chunk at {start} failed; stopping (rerun to resume)", file=out)
+            break
+        stored += added
+        print(f"backfill: {start + len(batch)}/{len(todo)} ({stored} stored)", file=out)
+    return stored
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="agent.embeddings",
+        description="Backfill idea embeddings for logged deliveries into the embeddings sidecar.",
+    )
+    parser.add_argument("--chunk", type=int, default=64, help="ideas per embed() call (default 64)")
+    parser.add_argument("--limit", type=int, default=None, help="embed at most this many deliveries")
+    args = parser.parse_args(argv)
+    backfill(chunk=args.chunk, limit=args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
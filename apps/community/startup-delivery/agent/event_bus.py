@@ -0,0 +1,168 @@
+"""Asyncio-native pipeline event fan-out for the SSE surfaces.
+
+The pipeline runs in a worker thread and reports through an `on_event(kind,
+data)` callback (the orchestrator's EventSink). This hub carries those events
+to any number of async SSE consumers without a thread or a polling loop per
+client:
+
+  - the worker publishes to the run's `Channel` (keyed by trackingId);
+  - each subscriber owns a bounded buffer bound to ITS event loop, and the
+    publish is handed over with `loop.call_soon_threadsafe`, so the consumer
+    wakes on the next loop tick instead of on a 1s queue poll;
+  - the publisher NEVER blocks on a slow client. Backpressure is a bounded
+    buffer per subscriber (SSE_BUFFER_EVENTS): when it is full the oldest
+    buffered event is dropped and counted. The job record in jobs_store stays
+    complete, so a lagging client can resync via GET /jobs/{id}. Terminal
+    events (`package`, `error`) and the end-of-stream marker are always kept;
+  - many subscribers per run: /deliver/stream's own client plus any
+    GET /jobs/{id}/events watchers that attach while the run is live.
+
+stdlib-only; the registry is thread-safe (one Lock), buffers are only touched
+on their own loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any
+
+from ._env import env_int
+
+_BUFFER_EVENTS = env_int("SSE_BUFFER_EVENTS", 256)
+
+# Never dropped under backpressure: the client needs these to finish cleanly.
+_TERMINAL_KINDS = {"package", "error"}
+
+# Marker kind delivered to every subscriber when the run's channel closes.
+END = "__end__"
+
+_LOCK = threading.Lock()
+_CHANNELS: dict[str, "Channel"] = {}
+_COUNTERS = {"published": 0, "dropped": 0}
+
+
+class Subscription:
+    """One consumer's bounded buffer on one event loop."""
+
+    def __init__(self, channel: "Channel", loop: asyncio.AbstractEventLoop, maxlen: int) -> None:
+        self.channel = channel
+        self._loop = loop
+        self._buf: deque[tuple[str, Any]] = deque()
+        self._maxlen = max(1, maxlen)
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    # Runs ON self._loop (scheduled via call_soon_threadsafe).
+    def _offer(self, item: tuple[str, Any]) -> None:
+        if len(self._buf) >= self._maxlen and item[0] not in _TERMINAL_KINDS and item[0] != END:
+            # Drop the oldest droppable event to make room (progress events are
+            # superseded by later ones; the full record lives in jobs_store).
+            for i, (kind, _data) in enumerate(self._buf):
+                if kind not in _TERMINAL_KINDS and kind != END:
+                    del self._buf[i]
+                    self.dropped += 1
+                    with _LOCK:
+                        _COUNTERS["dropped"] += 1
+                    break
+        self._buf.append(item)
+        self._ready.set()
+
+    def _deliver(self, item: tuple[str, Any]) -> bool:
+        """Hand one item to this subscriber's loop. False if the loop is gone."""
+        try:
+            self._loop.call_soon_threadsafe(self._offer, item)
+            return True
+        except RuntimeError:  # loop closed: the client's request is over
+            return False
+
+    async def get(self, timeout: float) -> tuple[str, Any] | None:
+        """Next (kind, data), or None after `timeout` seconds idle (heartbeat)."""
+        if not self._buf:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._buf.popleft()
+
+    def close(self) -> None:
+        self.channel.unsubscribe(self)
+
+
+class Channel:
+    """Every subscriber of one run. Published from the worker thread."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self._subs: list[Subscription] = []
+        self.closed = False
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop | None = None, *, maxlen: int | None = None) -> Subscription:
+        """Attach a consumer on `loop` (default: the running loop). A subscriber
+        to an already-closed channel immediately receives END."""
+        sub = Subscription(self, loop or asyncio.get_running_loop(), maxlen or _BUFFER_EVENTS)
+        with _LOCK:
+            closed = self.closed
+            if not closed:
+                self._subs.append(sub)
+        if closed:
+            sub._deliver((END, None))
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with _LOCK:
+            if sub in self._subs:
+                self._subs.remove(sub)
+
+    def publish(self, kind: str, data: Any) -> None:
+        """Fan one event out to every subscriber. Thread-safe; never blocks."""
+        with _LOCK:
+            subs = list(self._subs)
+            _COUNTERS["published"] += 1
+        gone = [sub for sub in subs if not sub._deliver((kind, data))]
+        for sub in gone:
+            self.unsubscribe(sub)
+
+    def close(self) -> None:
+        """End the run: every subscriber gets END, and the channel is unregistered."""
+        with _LOCK:
+            if self.closed:
+                return
+            self.closed = True
+            subs, self._subs = self._subs, []
+            if _CHANNELS.get(self.key) is self:
+                del _CHANNELS[self.key]
+        for sub in subs:
+            sub._deliver((END, None))
+
+    @property
+    def subscribers(self) -> int:
+        with _LOCK:
+            return len(self._subs)
+
+
+def open_channel(key: str) -> Channel:
+    """Register (or return the live) channel for one run."""
+    with _LOCK:
+        channel = _CHANNELS.get(key)
+        if channel is None:
+            channel = _CHANNELS[key] = Channel(key)
+        return channel
+
+
+def channel(key: str) -> Channel | None:
+    """The live channel for a run, or None when it isn't running here."""
+    with _LOCK:
+        return _CHANNELS.get(key)
+
+
+def stats() -> dict[str, Any]:
+    """Live channels / subscribers / fan-out counters for /debug."""
+    with _LOCK:
+        return {
+            "channels": len(_CHANNELS),
+            "subscribers": sum(len(c._subs) for c in _CHANNELS.values()),
+            "bufferEvents": _BUFFER_EVENTS,
+            **_COUNTERS,
+        }
@@ -0,0 +1,422 @@
+"""Durable SQLite job queue + fixed worker pool behind POST /jobs.
+
+POST /jobs used to start one daemon thread per job and lean on the pipeline
+semaphore for admission: a burst past MAX_CONCURRENCY got 429s, and a restart
+silently dropped every job in flight. Now a job is a row in a local SQLite
+queue (next to the deliveries log, JOBS_DB to override) and a FIXED pool of
+JOBS_WORKERS threads drains it:
+
+  - admission is a queue bound, not a free slot: JOBS_MAX_QUEUED waiting jobs
+    in total and JOBS_MAX_QUEUED_PER_CLIENT per client, past which enqueue
+    raises QueueFull (the route's 429);
+  - claim order is priority (higher first), then FIFO, skipping any client
+    that already has JOBS_PER_CLIENT jobs running — so one busy caller can't
+    starve the rest;
+  - each claim takes a lease (JOBS_VISIBILITY_TIMEOUT_SECONDS) that the run
+    renews through `heartbeat` as it makes progress. A job whose lease lapses
+    (a hung worker) becomes claimable again, up to JOBS_MAX_ATTEMPTS claims in
+    all, then fails. `attempts` is the fencing token: a straggler's `_settle`
+    is a no-op, and the runner checks `owns` before every side effect so a
+    late finish never publishes, persists or closes over the re-run;
+  - on boot, `start` re-queues every row still marked running: this process
+    owns the DB, so those runs died with the previous process;
+  - workers still take a `_PIPELINE_SLOTS` slot per job (passed in by the
+    bridge), so queued jobs share the box's concurrency cap with /deliver and
+    /deliver/stream instead of stacking on top of it.
+
+jobs_store remains the per-job progress record the UI polls; this module only
+owns scheduling. `stats()` reports queue depth, running, the oldest wait and
+p50/p95 queue wait of recent claims for /debug and /metrics.
+
+stdlib-only; one Lock serializes every statement on the shared connection
+(WAL mode, so a reader never blocks the writer on disk). Scheduling never
+raises into a worker; `enqueue` raises only QueueFull.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from . import deliveries_store
+from ._env import env_int
+
+WORKERS = env_int("JOBS_WORKERS", 2)
+PER_CLIENT = env_int("JOBS_PER_CLIENT", 1)
+MAX_QUEUED = env_int("JOBS_MAX_QUEUED", 200)
+MAX_QUEUED_PER_CLIENT = env_int("JOBS_MAX_QUEUED_PER_CLIENT", 10)
+VISIBILITY_TIMEOUT_S = env_int("JOBS_VISIBILITY_TIMEOUT_SECONDS", 900)
+MAX_ATTEMPTS = env_int("JOBS_MAX_ATTEMPTS", 3)
+# Finished rows are kept this long for stats/debugging, then pruned.
+_RETAIN_S = env_int("JOBS_RETAIN_SECONDS", 7 * 24 * 3600)
+_POLL_S = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    tracking_id   TEXT PRIMARY KEY,
+    idea          TEXT NOT NULL,
+    build_landing INTEGER NOT NULL DEFAULT 0,
+    client        TEXT NOT NULL DEFAULT '',
+    priority      INTEGER NOT NULL DEFAULT 0,
+    status        TEXT NOT NULL,              -- queued | running | done | failed
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    enqueued_at   REAL NOT NULL,
+    started_at    REAL,
+    lease_until   REAL,
+    finished_at   REAL,
+    error         TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, priority DESC, enqueued_at);
+CREATE INDEX IF NOT EXISTS jobs_by_client ON jobs (client, status);
+"""
+
+log = logging.getLogger("agent.bridge")  # reuse the bridge logger
+
+_LOCK = threading.Lock()
+_CONN: Optional[sqlite3.Connection] = None
+_WAKE = threading.Condition()
+_WORKERS: list[threading.Thread] = []
+_WAITS: deque[float] = deque(maxlen=256)  # queue wait (s) of recent first claims
+# (tracking_id, attempts) -> last lease renewal (monotonic). A renewal younger
+# than a tenth of the lease can't have lapsed, so heartbeats skip the write.
+_BEATS: dict[tuple[str, int], float] = {}
+_COUNTERS = {"enqueued": 0, "rejected": 0, "claimed": 0, "recovered": 0, "expired": 0, "completed": 0, "failed": 0}
+
+
+class QueueFull(RuntimeError):
+    """The queue (or this client's share of it) is at capacity."""
+
+
+def _db_path() -> Path:
+    configured = os.getenv("JOBS_DB", "").strip()
+    return Path(configured) if configured else deliveries_store._path().parent / "jobs.sqlite3"
+
+
+def _conn() -> sqlite3.Connection:
+    """The shared connection, opened + migrated on first use. Caller holds _LOCK."""
+    global _CONN
+    if _CONN is None:
+        path = _db_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _CONN = conn
+    return _CONN
+
+
+def _notify() -> None:
+    with _WAKE:
+        _WAKE.notify_all()
+
+
+# ---------------------------------------------------------------------------
+# Producer side
+# ---------------------------------------------------------------------------
+
+def enqueue(
+    tracking_id: str, idea: str, *, build_landing: bool = False, client: str = "", priority: int = 0
+) -> int:
+    """Durably queue one delivery; returns how many queued jobs are ahead of it.
+
+    Raises QueueFull when the queue or this client's share of it is full."""
+    now = time.time()
+    with _LOCK:
+        conn = _conn()
+        queued = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+        mine = conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND client = ?", (client,)
+        ).fetchone()[0]
+        if queued >= MAX_QUEUED or mine >= MAX_QUEUED_PER_CLIENT:
+            _COUNTERS["rejected"] += 1
+            raise QueueFull("queue full" if queued >= MAX_QUEUED else "client queue full")
+        conn.execute(
+            "INSERT INTO jobs (tracking_id, idea, build_landing, client, priority, status, enqueued_at)"
+            " VALUES (?, ?, ?, ?, ?, 'queued', ?)",
+            (tracking_id, idea, int(build_landing), client, int(priority), now),
+        )
+        ahead = conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND tracking_id != ?"
+            " AND (priority > ? OR (priority = ? AND enqueued_at <= ?))",
+            (tracking_id, priority, priority, now),
+        ).fetchone()[0]
+        _COUNTERS["enqueued"] += 1
+    _notify()
+    return int(ahead)
+
+
+# ---------------------------------------------------------------------------
+# Consumer side
+# ---------------------------------------------------------------------------
+
+def _expire(conn: sqlite3.Connection, now: float) -> list[str]:
+    """Fail lapsed leases that have used every attempt (the rest simply become
+    claimable again). Returns their ids. Caller holds _LOCK."""
+    rows = conn.execute(
+        "SELECT tracking_id FROM jobs WHERE status = 'running' AND lease_until < ? AND attempts >= ?",
+        (now, MAX_ATTEMPTS),
+    ).fetchall()
+    ids = [r["tracking_id"] for r in rows]
+    if ids:
+        conn.executemany(
+            "UPDATE jobs SET status = 'failed', finished_at = ?, error = 'lease expired' WHERE tracking_id = ?",
+            [(now, tid) for tid in ids],
+        )
+        _COUNTERS["expired"] += len(ids)
+    return ids
+
+
+# Rows a worker may claim right now: waiting, or running on a lapsed lease,
+# and not from a client already at its running cap.
+_RUNNABLE = """
+    (status = 'queued' OR (status = 'running' AND lease_until < :now))
+    AND client NOT IN (
+        SELECT client FROM jobs
+        WHERE status = 'running' AND lease_until >= :now
+        GROUP BY client HAVING COUNT(*) >= :cap
+    )
+"""
+
+
+def _claimable() -> bool:
+    """Whether a claim could succeed now — a read-only peek, so an idle worker
+    only takes a pipeline slot when there is something to run."""
+    with _LOCK:
+        row = _conn().execute(
+            f"SELECT 1 FROM jobs WHERE {_RUNNABLE} LIMIT 1",
+            {"now": time.time(), "cap": max(1, PER_CLIENT)},
+        ).fetchone()
+    return row is not None
+
+
+def _claim() -> tuple[Optional[dict[str, Any]], list[str]]:
+    """Lease the next runnable job: highest priority, oldest first, among clients
+    under their running cap. Returns (job or None, ids that just failed)."""
+    now = time.time()
+    with _LOCK:
+        conn = _conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            expired = _expire(conn, now)
+            row = conn.execute(
+                f"SELECT * FROM jobs WHERE {_RUNNABLE} ORDER BY priority DESC, enqueued_at ASC LIMIT 1",
+                {"now": now, "cap": max(1, PER_CLIENT)},
+            ).fetchone()
+            job = None
+            if row is not None:
+                job = dict(row)
+                job["attempts"] = int(row["attempts"]) + 1
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = ?, started_at = ?, lease_until = ?"
+                    " WHERE tracking_id = ?",
+                    (job["attempts"], now, now + VISIBILITY_TIMEOUT_S, job["tracking_id"]),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if job is not None:
+            _COUNTERS["claimed"] += 1
+            if row["status"] == "queued":
+                _WAITS.append(max(0.0, now - float(row["enqueued_at"])))
+            else:
+                log.warning(
+                    "jobs.queue lease expired, re-running trackingId=%s attempt=%s",
+                    job["tracking_id"], job["attempts"],
+                )
+    return job, expired
+
+
+def heartbeat(tracking_id: str, attempts: int, *, force: bool = False) -> bool:
+    """Renew this claim's lease; False once the claim is no longer the owner
+    (the lease lapsed and the job was re-claimed, expired, or settled).
+
+    Cheap to call on every progress event: a renewal younger than a tenth of
+    the lease is trusted without touching the DB unless `force`."""
+    key = (tracking_id, int(attempts))
+    now = time.monotonic()
+    last = _BEATS.get(key)
+    if not force and last is not None and now - last < VISIBILITY_TIMEOUT_S / 10:
+        return True
+    with _LOCK:
+        cur = _conn().execute(
+            "UPDATE jobs SET lease_until = ? WHERE tracking_id = ? AND attempts = ? AND status = 'running'",
+            (time.time() + VISIBILITY_TIMEOUT_S, tracking_id, int(attempts)),
+        )
+        owned = cur.rowcount > 0
+    if owned:
+        _BEATS[key] = now
+    else:
+        _BEATS.pop(key, None)
+    return owned
+
+
+def owns(job: dict[str, Any]) -> bool:
+    """Whether this claim still owns the job. Renews the lease as it checks, so
+    the side effects that follow run under a fresh lease."""
+    return heartbeat(job["tracking_id"], job["attempts"], force=True)
+
+
+def _settle(job: dict[str, Any], status: str, error: Optional[str] = None) -> None:
+    """Record a claim's outcome unless a later claim has taken the job over."""
+    _BEATS.pop((job["tracking_id"], int(job["attempts"])), None)
+    with _LOCK:
+        cur = _conn().execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, lease_until = NULL, error = ?"
+            " WHERE tracking_id = ? AND attempts = ? AND status = 'running'",
+            (status, time.time(), error, job["tracking_id"], job["attempts"]),
+        )
+        if cur.rowcount:
+            _COUNTERS["completed" if status == "done" else "failed"] += 1
+    _notify()  # a client slot just freed up
+
+
+def _worker(
+    run: Callable[[dict[str, Any]], None],
+    slots: Optional[threading.Semaphore],
+    on_expired: Optional[Callable[[str], None]],
+) -> None:
+    while True:
+        job = None
+        try:
+            # Peek first: /deliver and friends take slots non-blocking, so an
+            # idle worker holding one just to poll would 429 them. Then take
+            # the slot BEFORE claiming, so a claimed job starts immediately.
+            if not _claimable():
+                with _WAKE:
+                    _WAKE.wait(_POLL_S)
+                continue
+            if slots is not None and not slots.acquire(timeout=_POLL_S):
+                continue
+            try:
+                job, expired = _claim()
+                for tid in expired:
+                    if on_expired is not None:
+                        on_expired(tid)
+                if job is not None:
+                    try:
+                        run(job)
+                    except Exception as exc:
+                        _settle(job, "failed", repr(exc))
+                    else:
+                        _settle(job, "done")
+            finally:
+                if slots is not None:
+                    slots.release()
+        except Exception as exc:  # a scheduling hiccup must not kill the worker
+            log.warning("jobs.queue worker error error=%s", repr(exc))
+            time.sleep(_POLL_S)
+        if job is None:
+            with _WAKE:
+                _WAKE.wait(_POLL_S)
+
+
+def start(
+    run: Callable[[dict[str, Any]], None],
+    *,
+    slots: Optional[threading.Semaphore] = None,
+    on_recovered: Optional[Callable[[dict[str, Any]], None]] = None,
+    on_expired: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Recover orphaned jobs and start the worker pool (idempotent).
+
+    `run(job)` executes one claimed job (a dict of its row: tracking_id, idea,
+    build_landing, client, priority, attempts); returning marks it done, raising
+    marks it failed. `on_recovered(job)` is told about each job re-queued from a
+    previous process, `on_expired(tracking_id)` about each job failed for
+    running out of leases."""
+    with _LOCK:
+        if _WORKERS:
+            return
+        conn = _conn()
+        rows = [
+            dict(r) for r in conn.execute("SELECT * FROM jobs WHERE status = 'running'").fetchall()
+        ]
+        conn.execute(
+            "UPDATE jobs SET status = 'queued', lease_until = NULL WHERE status = 'running'"
+        )
+        conn.execute(
+            "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+            (time.time() - _RETAIN_S,),
+        )
+        _COUNTERS["recovered"] += len(rows)
+        for i in range(max(1, WORKERS)):
+            thread = threading.Thread(
+                target=_worker, args=(run, slots, on_expired), name=f"jobs-worker-{i}", daemon=True
+            )
+            _WORKERS.append(thread)
+    for row in rows:
+        log.info("jobs.queue recovered trackingId=%s attempts=%s", row["tracking_id"], row["attempts"])
+        if on_recovered is not None:
+            try:
+                on_recovered(row)
+            except Exception:
+                pass
+    for thread in _WORKERS:
+        thread.start()
+
+
+# ---------------------------------------------------------------------------
+# Introspection
+# ---------------------------------------------------------------------------
+
+def position(tracking_id: str) -> Optional[int]:
+    """Queued jobs ahead of this one, or None when it isn't waiting."""
+    with _LOCK:
+        conn = _conn()
+        row = conn.execute(
+            "SELECT priority, enqueued_at FROM jobs WHERE tracking_id = ? AND status = 'queued'",
+            (tracking_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return int(
+            conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND tracking_id != ?"
+                " AND (priority > ? OR (priority = ? AND enqueued_at < ?))",
+                (tracking_id, row["priority"], row["priority"], row["enqueued_at"]),
+            ).fetchone()[0]
+        )
+
+
+def _quantile(values: list[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def stats() -> dict[str, Any]:
+    """Queue depth / running / wait-time counters for /debug and /metrics. Never raises."""
+    try:
+        with _LOCK:
+            conn = _conn()
+            counts = {
+                r["status"]: int(r["n"])
+                for r in conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")
+            }
+            oldest = conn.execute("SELECT MIN(enqueued_at) FROM jobs WHERE status = 'queued'").fetchone()[0]
+            waits = list(_WAITS)
+            counters = dict(_COUNTERS)
+    except Exception as exc:
+        return {"error": repr(exc)}
+    p50 = _quantile(waits, 0.5)
+    p95 = _quantile(waits, 0.95)
+    return {
+        "workers": len(_WORKERS),
+        "perClient": PER_CLIENT,
+        "maxQueued": MAX_QUEUED,
+        "queued": counts.get("queued", 0),
+        "running": counts.get("running", 0),
+        "oldestQueuedMs": int((time.time() - oldest) * 1000) if oldest else None,
+        "waitP50Ms": int(p50 * 1000) if p50 is not None else None,
+        "waitP95Ms": int(p95 * 1000) if p95 is not None else None,
+        **counters,
+    }
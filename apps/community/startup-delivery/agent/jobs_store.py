@@ -1,15 +1,28 @@
 """Durable, file-backed in-progress job store for the delivery pipeline.
 
-Ephemeral across machine restarts on purpose — if a job was running and the
-process died, the finished package is the system of record in
-``deliveries_store``.  This store powers in-progress resume/polling:
-``POST /jobs`` mints a record here at launch, every SSE event folded in via
-``apply_event`` updates it atomically, and ``GET /jobs/{id}`` polls it cheaply.
+The finished package's system of record is ``deliveries_store``; scheduling
+(and re-running a job the process died on) belongs to ``job_queue``.  This
+store powers in-progress resume/polling: ``POST /jobs`` mints a record here
+when the job is queued (``queued=True``) and again when a worker starts it,
+every SSE event folded in via ``apply_event`` updates it in memory, and
+``GET /jobs/{id}`` polls it cheaply.
+
+Write-behind: one delivery emits dozens of ``check``/``step``/``candidate``
+events, and rewriting the whole job JSON per event made every job dozens of
+full-file rewrites. Now each event is folded into the in-memory table and
+appended as ONE line to a per-job event log (``<id>.events.jsonl``); a
+background flusher snapshots dirty jobs to ``<id>.json`` on a time budget
+(``JOBS_FLUSH_INTERVAL_MS``) or sooner once a job has buffered
+``JOBS_FLUSH_EVENTS`` events, then truncates that job's event log.
+``finish``/``fail`` flush synchronously. On a cold read (restart) the snapshot
+is loaded and any logged events past its ``_eventSeq`` are replayed, so a crash
+between flushes loses nothing that reached the event log. Live jobs are served
+from memory with no disk I/O.
 
 Design constraints:
   - stdlib-only; zero new dependencies
   - thread-safe (one module-level Lock guards all mutation + disk writes)
-  - atomic disk writes (temp-file → os.replace in the same directory)
+  - atomic snapshot writes (temp-file → os.replace in the same directory)
   - never raises to callers (swallow + log internally; ``get`` may return None)
   - Python 3.9-compatible (``from __future__ import annotations`` covers all
     annotation-only uses of modern union syntax; runtime paths use
@@ -17,6 +30,7 @@ Design constraints:
 """
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
@@ -28,12 +42,26 @@ from pathlib import Path
 from typing import Optional
 
 from . import deliveries_store
+from ._env import env_int
 
 _LOCK = threading.Lock()
 _CACHE: dict[str, dict] = {}
+# trackingId -> events folded since its last snapshot (the write-behind backlog).
+_DIRTY: dict[str, int] = {}
 
 JOB_STALE_SECONDS: int = int(os.getenv("JOB_STALE_SECONDS", "900"))
 
+# Write-behind budgets: snapshot dirty jobs at least every JOBS_FLUSH_INTERVAL_MS,
+# and early once one job has buffered JOBS_FLUSH_EVENTS events.
+_FLUSH_INTERVAL_S = env_int("JOBS_FLUSH_INTERVAL_MS", 1000) / 1000.0
+_FLUSH_EVENTS = env_int("JOBS_FLUSH_EVENTS", 25)
+# Directory pruning is a full scan, so run it at most this often (not per start).
+_PRUNE_INTERVAL_S = 300.0
+_LAST_PRUNE = 0.0
+
+_FLUSHER: Optional[threading.Thread] = None
+_WAKE = threading.Event()
+
 # New deliveries mint 8 random suffix chars; keep 4-char legacy IDs readable so
 # already-shared demo links keep working.
 TRACKING_ID_RE = re.compile(r"^DEL-[0-9]{8}-(?:[A-Z0-9]{4}|[A-Z0-9]{8})$")
@@ -69,6 +97,10 @@ def _job_path(tracking_id: str) -> Path:
     return _jobs_dir_path() / f"{_tracking_id(tracking_id)}.json"
 
 
+def _events_path(tracking_id: str) -> Path:
+    return _jobs_dir_path() / f"{_tracking_id(tracking_id)}.events.jsonl"
+
+
 def _norm_domain(d: str) -> str:
     """Lowercase, strip whitespace, remove trailing dots."""
     return (d or "").strip().lower().rstrip(".")
@@ -78,8 +110,9 @@ def _now() -> float:
     return time.time()
 
 
-def _write(record: dict) -> None:
-    """Atomically write record to disk (temp-file → os.replace). Caller holds _LOCK."""
+def _write(record: dict) -> bool:
+    """Atomically write record to disk (temp-file → os.replace). Caller holds _LOCK.
+    Returns False (after logging) if the write failed."""
     tid = record.get("trackingId", "UNKNOWN")
     target = _ensure_jobs_dir() / f"{tid}.json"
     tmp_path: Optional[str] = None
@@ -94,6 +127,7 @@ def _write(record: dict) -> None:
             tmp_path = fh.name
             json.dump(record, fh, ensure_ascii=False)
         os.replace(tmp_path, str(target))
+        return True
     except Exception as exc:
         log.warning(
             "jobs_store write failed trackingId=%s error=%s", tid, repr(exc)
@@ -103,6 +137,69 @@ def _write(record: dict) -> None:
                 os.unlink(tmp_path)
             except Exception:
                 pass
+        return False
+
+
+def _append_event(tracking_id: str, seq: int, kind: str, data: dict, at: float) -> None:
+    """Append one event line to the job's log (O(1)). Caller holds _LOCK."""
+    line = json.dumps({"seq": seq, "kind": kind, "data": data, "at": at}, ensure_ascii=False)
+    try:
+        _ensure_jobs_dir()
+        with _events_path(tracking_id).open("a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+    except Exception as exc:
+        log.warning(
+            "jobs_store event append failed trackingId=%s error=%s", tracking_id, repr(exc)
+        )
+
+
+def _snapshot(tracking_id: str) -> None:
+    """Write the job's current record and drop its now-folded event log.
+    Caller holds _LOCK. If the write fails the event log is kept and the job
+    stays dirty so the flusher retries; if only the truncate fails, replay
+    skips the logged events by ``_eventSeq`` anyway."""
+    record = _CACHE.get(tracking_id)
+    if record is None:
+        _DIRTY.pop(tracking_id, None)
+        return
+    if not _write(record):
+        _DIRTY.setdefault(tracking_id, 0)
+        return
+    _DIRTY.pop(tracking_id, None)
+    try:
+        _events_path(tracking_id).unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def flush() -> None:
+    """Snapshot every job with buffered events. Never raises."""
+    try:
+        with _LOCK:
+            for tid in list(_DIRTY):
+                _snapshot(tid)
+    except Exception as exc:
+        log.warning("jobs_store flush failed error=%s", repr(exc))
+
+
+def _flush_loop() -> None:
+    while True:
+        _WAKE.wait(_FLUSH_INTERVAL_S)
+        _WAKE.clear()
+        flush()
+
+
+def _ensure_flusher() -> None:
+    """Start the write-behind daemon on first use (and flush at exit)."""
+    global _FLUSHER
+    if _FLUSHER is not None:
+        return
+    with _LOCK:
+        if _FLUSHER is not None:
+            return
+        _FLUSHER = threading.Thread(target=_flush_loop, name="jobs-flush", daemon=True)
+        _FLUSHER.start()
+    atexit.register(flush)
 
 
 def _candidate_key(candidate: dict) -> str:
@@ -175,25 +272,54 @@ def _merge_one_candidate(existing: list, candidate: dict) -> list:
 
 
 def _load_from_disk(tracking_id: str) -> Optional[dict]:
-    """Try reading a job record from disk.  Returns None on any failure."""
+    """Read a job's snapshot and replay any logged events past its ``_eventSeq``
+    (those buffered when the process died).  Returns None on any failure."""
     path = _job_path(tracking_id)
     try:
         if not path.exists():
             return None
-        return json.loads(path.read_text(encoding="utf-8"))
+        record = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return None
+    try:
+        lines = _events_path(tracking_id).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return record
+    for line in lines:
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # torn final line from a crash mid-append
+        if not isinstance(event, dict) or event.get("seq", 0) <= record.get("_eventSeq", 0):
+            continue
+        folded = _fold(record, str(event.get("kind")), event.get("data") or {}, float(event.get("at") or 0))
+        if folded is not None:
+            record = folded
+            record["_eventSeq"] = event["seq"]
+    return record
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def start(tracking_id: str, idea: str, *, build_landing: bool = False) -> None:
-    """Create a fresh running record, persist, and best-effort prune old files."""
+def start(
+    tracking_id: str,
+    idea: str,
+    *,
+    build_landing: bool = False,
+    queued: bool = False,
+) -> None:
+    """Create a fresh running record, persist, and best-effort prune old files.
+
+    ``queued=True`` marks a job still waiting in ``job_queue``: the envelope's
+    ``status`` stays ``"running"`` (the web client's contract: running | done |
+    error) with ``queued`` set, and the staleness guard leaves it alone. The
+    worker calls ``start`` again when it picks the job up."""
     now = _now()
     record: dict = {
         "status": "running",
+        "queued": queued,
         "trackingId": tracking_id,
         "idea": idea,
         "buildLanding": build_landing,
@@ -202,6 +328,7 @@ def start(tracking_id: str, idea: str, *, build_landing: bool = False) -> None:
         "phase": "start",
         "steps": [],
         "_nextStepId": 0,
+        "_eventSeq": 0,
         "partial": {
             "idea": idea,
             "trackingId": tracking_id,
@@ -221,14 +348,97 @@ def start(tracking_id: str, idea: str, *, build_landing: bool = False) -> None:
     }
     with _LOCK:
         _CACHE[tracking_id] = record
-        _write(record)
+        _snapshot(tracking_id)
     _prune()
 
 
+def _fold(record: dict, kind: str, data: dict, at: float) -> Optional[dict]:
+    """Pure fold of ONE event into a copy of ``record`` (None for unknown kinds).
+
+    Shared by live ``apply_event`` and restart replay, so both produce the same
+    record; ``at`` is the event's own timestamp for the same reason."""
+    # Work on a shallow copy so we can atomically replace the cache entry.
+    record = dict(record)
+    partial = dict(record.get("partial") or {})
+
+    if kind == "start":
+        partial["idea"] = data.get("idea", partial.get("idea", ""))
+        partial["trackingId"] = data.get("trackingId", partial.get("trackingId", ""))
+        record["phase"] = "start"
+
+    elif kind == "see":
+        partial["marketSummary"] = data.get("marketSummary", "")
+        partial["competitors"] = data.get("competitors") or []
+        partial["reconAt"] = data.get("reconAt")
+        partial["marketHeat"] = data.get("marketHeat")
+        partial["complaints"] = data.get("complaints") or []
+        record["phase"] = "see"
+
+    elif kind == "think":
+        partial["positioningGap"] = data.get("positioningGap", "")
+        partial["learnedFrom"] = data.get("learnedFrom", 0)
+        incoming = data.get("candidates") or []
+        partial["candidates"] = _merge_candidates(
+            partial.get("candidates") or [], incoming
+        )
+        record["phase"] = "think"
+
+    elif kind == "verdict":
+        partial["verdict"] = data.get("verdict")
+        record["phase"] = "verdict"
+
+    elif kind == "check":
+        candidate = data.get("candidate") or {}
+        partial["candidates"] = _merge_one_candidate(
+            partial.get("candidates") or [], candidate
+        )
+        record["phase"] = "check"
+
+    elif kind == "secured":
+        candidate = data.get("candidate") or {}
+        partial["candidates"] = _merge_one_candidate(
+            partial.get("candidates") or [], candidate
+        )
+        domain = candidate.get("domain", "")
+        partial["securedDomain"] = _norm_domain(domain) if domain else None
+        record["phase"] = "secured"
+
+    elif kind == "build":
+        record["phase"] = "build"
+
+    elif kind in ("step", "tool"):
+        steps: list = list(record.get("steps") or [])
+        step_id: int = record.get("_nextStepId", len(steps))
+        ok_raw = data.get("ok")
+        steps.append({
+            "id": step_id,
+            "kind": kind,
+            "label": data.get("label"),
+            "tool": data.get("tool"),
+            "detail": data.get("detail"),
+            "ok": ok_raw is not False,
+            "at": at,
+        })
+        if len(steps) > 40:
+            steps = steps[-40:]
+        record["steps"] = steps
+        record["_nextStepId"] = step_id + 1
+
+    else:
+        # Unknown kind: ignore (don't persist either)
+        return None
+
+    record["partial"] = partial
+    record["updatedAt"] = at
+    return record
+
+
 def apply_event(tracking_id: str, kind: str, data: dict) -> None:
     """Thread-safe fold of ONE (already camelCase / JSON-safe) event into the job.
 
-    Never raises.  If no job exists for ``tracking_id``, silently no-ops.
+    In-memory fold + one appended event-log line; the snapshot rewrite is left
+    to the write-behind flusher. Never raises.  If no job exists for
+    ``tracking_id``, silently no-ops.
     """
     try:
         with _LOCK:
@@ -239,81 +449,19 @@ def apply_event(tracking_id: str, kind: str, data: dict) -> None:
                     return
                 _CACHE[tracking_id] = record
 
-            # Work on a shallow copy so we can atomically replace the cache entry.
-            record = dict(record)
-            partial = dict(record.get("partial") or {})
-
-            if kind == "start":
-                partial["idea"] = data.get("idea", partial.get("idea", ""))
-                partial["trackingId"] = data.get("trackingId", partial.get("trackingId", ""))
-                record["phase"] = "start"
-
-            elif kind == "see":
-                partial["marketSummary"] = data.get("marketSummary", "")
-                partial["competitors"] = data.get("competitors") or []
-                partial["reconAt"] = data.get("reconAt")
-                partial["marketHeat"] = data.get("marketHeat")
-                partial["complaints"] = data.get("complaints") or []
-                record["phase"] = "see"
-
-            elif kind == "think":
-                partial["positioningGap"] = data.get("positioningGap", "")
-                partial["learnedFrom"] = data.get("learnedFrom", 0)
-                incoming = data.get("candidates") or []
-                partial["candidates"] = _merge_candidates(
-                    partial.get("candidates") or [], incoming
-                )
-                record["phase"] = "think"
-
-            elif kind == "verdict":
-                partial["verdict"] = data.get("verdict")
-                record["phase"] = "verdict"
-
-            elif kind == "check":
-                candidate = data.get("candidate") or {}
-                partial["candidates"] = _merge_one_candidate(
-                    partial.get("candidates") or [], candidate
-                )
-                record["phase"] = "check"
-
-            elif kind == "secured":
-                candidate = data.get("candidate") or {}
-                partial["candidates"] = _merge_one_candidate(
-                    partial.get("candidates") or [], candidate
-                )
-                domain = candidate.get("domain", "")
-                partial["securedDomain"] = _norm_domain(domain) if domain else None
-                record["phase"] = "secured"
-
-            elif kind == "build":
-                record["phase"] = "build"
-
-            elif kind in ("step", "tool"):
-                steps: list = list(record.get("steps") or [])
-                step_id: int = record.get("_nextStepId", len(steps))
-                ok_raw = data.get("ok")
-                steps.append({
-                    "id": step_id,
-                    "kind": kind,
-                    "label": data.get("label"),
-                    "tool": data.get("tool"),
-                    "detail": data.get("detail"),
-                    "ok": ok_raw is not False,
-                    "at": _now(),
-                })
-                if len(steps) > 40:
-                    steps = steps[-40:]
-                record["steps"] = steps
-                record["_nextStepId"] = step_id + 1
-
-            else:
-                # Unknown kind: ignore (don't persist either)
+            at = _now()
+            folded = _fold(record, kind, data, at)
+            if folded is None:
                 return
-
-            record["partial"] = partial
-            record["updatedAt"] = _now()
-            _CACHE[tracking_id] = record
-            _write(record)
+            seq = int(record.get("_eventSeq", 0)) + 1
+            folded["_eventSeq"] = seq
+            _CACHE[tracking_id] = folded
+            _append_event(tracking_id, seq, kind, data, at)
+            _DIRTY[tracking_id] = _DIRTY.get(tracking_id, 0) + 1
+            backlog = _DIRTY[tracking_id]
+        _ensure_flusher()
+        if backlog >= _FLUSH_EVENTS:
+            _WAKE.set()
 
     except Exception as exc:
         log.warning(
@@ -337,7 +485,7 @@ def finish(tracking_id: str, package: dict) -> None:
             record["phase"] = "done"
             record["updatedAt"] = _now()
             _CACHE[tracking_id] = record
-            _write(record)
+            _snapshot(tracking_id)  # forced flush: the terminal state is durable now
     except Exception as exc:
         log.warning(
             "jobs_store finish failed trackingId=%s error=%s", tracking_id, repr(exc)
@@ -359,7 +507,7 @@ def fail(tracking_id: str, message: str) -> None:
             record["phase"] = "error"
             record["updatedAt"] = _now()
             _CACHE[tracking_id] = record
-            _write(record)
+            _snapshot(tracking_id)  # forced flush: the terminal state is durable now
     except Exception as exc:
         log.warning(
             "jobs_store fail failed trackingId=%s error=%s", tracking_id, repr(exc)
@@ -373,6 +521,9 @@ def get(tracking_id: str) -> Optional[dict]:
     updated for longer than ``JOB_STALE_SECONDS`` (env ``JOB_STALE_SECONDS``,
     default 900), returns a shallow-copied envelope with status/phase/error
     set to indicate a timeout (and best-effort persists that transition).
+
+    Bookkeeping fields (``_eventSeq``, ``_nextStepId``, anything starting with
+    ``_``) stay in the stored record and are left out of the envelope.
     """
     tid = _tracking_id(tracking_id)
     if not _valid_tracking_id(tid):
@@ -388,8 +539,9 @@ def get(tracking_id: str) -> Optional[dict]:
     if record is None:
         return None
 
-    # Staleness guard (checked outside the write lock to keep lock brief)
-    if record.get("status") == "running":
+    # Staleness guard (checked outside the write lock to keep lock brief). A
+    # queued job hasn't started, so a long wait in a burst isn't a timeout.
+    if record.get("status") == "running" and not record.get("queued"):
         updated_at = record.get("updatedAt")
         if isinstance(updated_at, (int, float)):
             if _now() - float(updated_at) > JOB_STALE_SECONDS:
@@ -400,22 +552,45 @@ def get(tracking_id: str) -> Optional[dict]:
                 try:
                     with _LOCK:
                         _CACHE[tid] = stale
-                        _write(stale)
+                        _snapshot(tid)
                 except Exception:
                     pass
-                return stale
+                return _public(stale)
 
-    return record
+    return _public(record)
+
+
+def _public(record: dict) -> dict:
+    """The envelope as callers see it: a copy without internal ``_`` fields."""
+    return {k: v for k, v in record.items() if not k.startswith("_")}
 
 
 def _prune(max_age_seconds: int = 86400, max_files: int = 200) -> None:
-    """Best-effort delete stale job files.  Never raises."""
+    """Best-effort delete stale job files (snapshot + event log) and drop
+    finished jobs of the same age from memory.  Throttled to one directory scan
+    per ``_PRUNE_INTERVAL_S``.  Never raises."""
+    global _LAST_PRUNE
     try:
+        now = _now()
+        if now - _LAST_PRUNE < _PRUNE_INTERVAL_S:
+            return
+        _LAST_PRUNE = now
+
+        with _LOCK:
+            for tid, record in list(_CACHE.items()):
+                updated_at = record.get("updatedAt")
+                if (
+                    tid not in _DIRTY
+                    and record.get("status") != "running"
+                    and isinstance(updated_at, (int, float))
+                    and now - float(updated_at) > max_age_seconds
+                ):
+                    del _CACHE[tid]
+
         jobs_dir = _jobs_dir_path()
         if not jobs_dir.exists():
             return
         files = list(jobs_dir.glob("*.json"))
-        now = _now()
 
         # Delete files older than max_age_seconds by mtime
         surviving: list = []
@@ -424,6 +599,7 @@ def _prune(max_age_seconds: int = 86400, max_files: int = 200) -> None:
                 mtime = f.stat().st_mtime
                 if now - mtime > max_age_seconds:
                     f.unlink(missing_ok=True)
+                    _events_path(f.stem).unlink(missing_ok=True)
                 else:
                     surviving.append((mtime, f))
             except Exception:
@@ -436,6 +612,7 @@ def _prune(max_age_seconds: int = 86400, max_files: int = 200) -> None:
             for _mtime, f in to_delete:
                 try:
                     f.unlink(missing_ok=True)
+                    _events_path(f.stem).unlink(missing_ok=True)
                 except Exception:
                     pass
     except Exception:
@@ -7,7 +7,6 @@ Step 4 is still optional/bonus, but the Day-4 pipeline now runs end-to-end:
 """
 from __future__ import annotations
 
-import logging
 import os
 import secrets
 import sys
@@ -16,7 +15,8 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Callable, Optional
 
-from . import deliveries_store, naming
+from . import deliveries_store, naming, telemetry
+from ._log import kv as _kv, setup_logger
 from .clients import llm, namecom, nimble
 from .landing import publish_landing_page
 from .schemas import (
@@ -33,38 +33,11 @@ MAX_NAME_ROUNDS = 3  # retry guard so we never loop forever
 MAX_IDEA_CHARS = 300
 
 
-# Lightweight, request-scoped logging mirroring the bridge's format. Level from
-# LOG_LEVEL (default INFO). Additive observability only — no behavior changes,
-# no secrets logged. Configured here too (not just in server.py) so the CLI /
-# Tower entrypoints get structured lines without importing the bridge.
-def _setup_logger() -> logging.Logger:
-    logger = logging.getLogger("agent.orchestrator")
-    level_name = os.getenv("LOG_LEVEL", "INFO").strip().upper()
-    logger.setLevel(getattr(logging, level_name, logging.INFO))
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        handler.setFormatter(
-            logging.Formatter("ts=%(asctime)s level=%(levelname)s logger=%(name)s %(message)s")
-        )
-        logger.addHandler(handler)
-    logger.propagate = False
-    return logger
-
-
-log = _setup_logger()
-
-
-def _kv(**fields: object) -> str:
-    """`key=value` context suffix; drops None and quotes values with spaces/`=`."""
-    parts: list[str] = []
-    for key, value in fields.items():
-        if value is None:
-            continue
-        text = str(value)
-        if text == "" or any(ch in text for ch in (" ", "=", '"')):
-            text = '"' + text.replace('"', '\\"') + '"'
-        parts.append(f"{key}={text}")
-    return " ".join(parts)
+# Lightweight, request-scoped logging in the bridge's format (agent/_log.py).
+# Additive observability only — no behavior changes, no secrets logged.
+# Configured here too (not just in server.py) so the CLI / Tower entrypoints
+# get structured lines without importing the bridge.
+log = setup_logger("agent.orchestrator")
 
 # Off-by-default feature flag for the REAL tool-calling agent loop (agent_loop.py).
 # "1" => try the agentic loop, but fall back to the deterministic pipeline below on
@@ -156,13 +129,16 @@ def _chunked(items: list[str], size: int) -> list[list[str]]:
 def _check_domains_batched(domains: list[str]) -> dict[str, "namecom.DomainStatus"]:
     """Availability for any number of domains, chunk-safe under name.com's 50 cap.
 
-    Splits into <=45-domain batches and merges the per-batch status dicts. For the
-    common (<=45) case this is exactly one call — unchanged from the prior behavior.
-    name.com's own 50-guard stays intact as a backstop.
+    Domains with a fresh per-domain cache entry (namecom.cached_statuses) are
+    answered up front; only the MISSES are split into <=45-domain batches, so a
+    rerun over mostly-known names costs one small call (or none). The misses are
+    checked with use_cache=False (results are still written back) since they
+    were just looked up. name.com's own 50-guard stays intact as a backstop.
     """
-    statuses: dict[str, "namecom.DomainStatus"] = {}
-    for batch in _chunked(domains, _NAMECOM_BATCH):
-        statuses.update(namecom.check_domains(batch))
+    statuses = namecom.cached_statuses(domains)
+    misses = [d for d in domains if d not in statuses]
+    for batch in _chunked(misses, _NAMECOM_BATCH):
+        statuses.update(namecom.check_domains(batch, use_cache=False))
     return statuses
 
 
@@ -291,7 +267,16 @@ def deliver_startup(
     # The deterministic path and the agent-loop path both receive it so only ONE id
     # is ever used for the whole run, even across a fallback.
     tracking_id = (tracking_id or "").strip() or _tracking_id()
+    # The trackingId doubles as the trace id: every span opened below (recon,
+    # each extract and LLM call site, name.com batches, verification, landing)
+    # is filed under it for GET /debug/trace/{trackingId} and /metrics.
+    with telemetry.trace(tracking_id), telemetry.span("deliver", buildLanding=build_landing):
+        return _deliver(idea, build_landing=build_landing, on_event=on_event, tracking_id=tracking_id)
+
 
+def _deliver(
+    idea: str, *, build_landing: bool, on_event: EventSink, tracking_id: str
+) -> DeliveryPackage:
     # OPT-IN agentic path (AGENT_LOOP=1): let the LLM drive a real tool-calling
     # loop. It emits the SAME see/think/verdict/check/secured events (plus optional
     # `step` narration) and returns an equivalent DeliveryPackage. On ANY failure
@@ -361,13 +346,14 @@ def deliver_startup(
         niche_intel = deliveries_store.niche_intel(idea)
     except Exception:
         niche_intel = None
-    recon.positioning_gap, candidates = llm.find_gap_and_names(
-        recon, avoid=avoid, niche_intel=niche_intel
-    )
-    # Deterministic brandability re-rank (pure, offline): reorder so the most
-    # brandable, NON-colliding name leads — that's the one the .delivery-first TLD
-    # check below tends to secure. Drops any incumbent-host collision (keeps >=1).
-    candidates = naming.rank_candidates(candidates, recon)
+    with telemetry.span("think"):
+        recon.positioning_gap, candidates = llm.find_gap_and_names(
+            recon, avoid=avoid, niche_intel=niche_intel
+        )
+        # Deterministic brandability re-rank (pure, offline): reorder so the most
+        # brandable, NON-colliding name leads — that's the one the .delivery-first TLD
+        # check below tends to secure. Drops any incumbent-host collision (keeps >=1).
+        candidates = naming.rank_candidates(candidates, recon)
     _emit(
         on_event,
         "think",
@@ -380,14 +366,16 @@ def deliver_startup(
 
     # VERDICT — build/pivot/pass decision grounded in the recon + gap. Emitted
     # as its own event so the UI can lead the box with the actual decision.
-    verdict = llm.assess_opportunity(recon, niche_intel=niche_intel)
+    with telemetry.span("verdict"):
+        verdict = llm.assess_opportunity(recon, niche_intel=niche_intel)
     _emit(on_event, "verdict", {"verdict": verdict})
 
     # STEP 3 — CHECK: keep only buyable domains (name.com), loop if all taken
     winners: list[NameCandidate] = []
     tried: list[NameCandidate] = []
     for _round in range(MAX_NAME_ROUNDS):
-        checked = _check_candidates(candidates, on_event=on_event)
+        with telemetry.span("check", round=_round + 1, candidates=len(candidates)):
+            checked = _check_candidates(candidates, on_event=on_event)
         tried.extend(checked)
         winners = [c for c in checked if c.available]
         if winners:
@@ -413,9 +401,10 @@ def deliver_startup(
     # name.com's own alternates + a defensive bundle for the winner. Both ride out
     # on the final package (the UI renders them in the unbox), so no live event.
     pick_label, _pick_tld = _label_and_tld(pick.domain)
-    suggestions = namecom.suggest_domains(pick_label) if pick_label else []
-    suggestions = [s for s in suggestions if s.domain.lower() != pick.domain.lower()]
-    launch_kit = _launch_kit(pick)
+    with telemetry.span("launch_kit"):
+        suggestions = namecom.suggest_domains(pick_label) if pick_label else []
+        suggestions = [s for s in suggestions if s.domain.lower() != pick.domain.lower()]
+        launch_kit = _launch_kit(pick)
 
     # DOMAIN STRATEGIST — the prize-aligned reasoning layer. Reasons OVER the real
     # name.com data just secured for the winner (the renewal cliff, premium traps,
@@ -458,8 +447,9 @@ def deliver_startup(
     landing_url: str | None = None
     if build_landing:
         _emit(on_event, "build", {"domain": pick.domain})
-        landing_html = llm.write_landing_page(pick, recon)
-        landing_url = publish_landing_page(pick.domain, landing_html)
+        with telemetry.span("landing"):
+            landing_html = llm.write_landing_page(pick, recon)
+            landing_url = publish_landing_page(pick.domain, landing_html)
 
     # Attach the lakehouse intelligence summary so the result can show the same
     # aggregate signal the prompts were grounded in. Only when there's real niche
@@ -577,12 +567,13 @@ def build_landing_only(idea: str, brand: str, domain: str) -> LandingBuild:
     idea = _normalize_idea(idea)
     recon: ReconResult = nimble.research_idea(idea)  # cached -> cheap, no quota burn
     pick = NameCandidate(name=brand, domain=domain)
-    html = llm.write_landing_page(pick, recon)
-    landing_url: str | None = None
-    try:
-        landing_url = publish_landing_page(domain, html)
-    except Exception as exc:  # file hosting may be unavailable (hosted Vercel) — keep the html
-        log.warning("build_landing_only publish skipped " + _kv(domain=domain, error=repr(exc)))
+    with telemetry.span("landing"):
+        html = llm.write_landing_page(pick, recon)
+        landing_url: str | None = None
+        try:
+            landing_url = publish_landing_page(domain, html)
+        except Exception as exc:  # file hosting may be unavailable (hosted Vercel) — keep the html
+            log.warning("build_landing_only publish skipped " + _kv(domain=domain, error=repr(exc)))
     return LandingBuild(landing_html=html, landing_url=landing_url)
 
 
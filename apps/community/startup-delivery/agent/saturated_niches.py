@@ -6,9 +6,14 @@ existing client cache, so reruns do not burn pages.
 """
 from __future__ import annotations
 
+import threading
+import time
 from datetime import UTC, datetime
 from typing import Any, Iterable
 
+from ._env import env_int
+from .token_index import TokenIndex
+
 DEFAULT_NICHES: tuple[str, ...] = (
     "AI website builders",
     "AI meeting note takers",
@@ -104,7 +109,14 @@ def _row_for_niche(niche: str, refreshed_at: str) -> dict[str, Any]:
 
 
 def refresh_saturated_niches(niches: Iterable[str] | None = None) -> list[dict[str, Any]]:
-    """Refresh the Tower Iceberg `saturated_niches` table."""
+    """Refresh the Tower Iceberg `saturated_niches` table.
+
+    Only this process's cached niche index is dropped. The scheduled refresh
+    normally runs as its own Tower job, so a running bridge keeps matching
+    against the rows it already loaded for up to SATURATED_NICHES_TTL_SECONDS
+    (default 600) after the table changes. Set it to 0 to read the table on
+    every match instead.
+    """
     import pyarrow as pa
     import tower
 
@@ -112,28 +124,58 @@ def refresh_saturated_niches(niches: Iterable[str] | None = None) -> list[dict[s
     rows = [_row_for_niche(niche, refreshed_at) for niche in (niches or DEFAULT_NICHES)]
     table = tower.tables("saturated_niches").create_if_not_exists(_schema())
     table.upsert(pa.Table.from_pylist(rows, schema=_schema()), join_cols=["niche"])
+    _invalidate_niche_index()
     return rows
 
 
-def _best_niche_match(idea: str) -> dict[str, Any] | None:
-    """The saturated_niches row whose niche best overlaps the idea, or None."""
+# The table only changes when the scheduled refresh runs, yet every delivery asks
+# for the best match twice (note + signal). So the rows and their inverted token
+# index are loaded ONCE and reused for SATURATED_NICHES_TTL_SECONDS (default 10
+# min); a refresh in this process drops them immediately, one in another process
+# (the scheduled Tower job) is seen once the TTL lapses. Failed loads are not
+# cached, so a transient Tower hiccup is retried on the next call.
+_NICHE_INDEX_TTL_SECONDS = env_int("SATURATED_NICHES_TTL_SECONDS", 600)
+_NICHE_INDEX_LOCK = threading.Lock()
+_NICHE_INDEX: tuple[float, list[dict[str, Any]], TokenIndex] | None = None
+
+
+def _invalidate_niche_index() -> None:
+    global _NICHE_INDEX
+    with _NICHE_INDEX_LOCK:
+        _NICHE_INDEX = None
+
+
+def _niche_index() -> tuple[list[dict[str, Any]], TokenIndex] | None:
+    """The saturated_niches rows + a token index over their niche names, or None."""
+    global _NICHE_INDEX
+    with _NICHE_INDEX_LOCK:
+        cached = _NICHE_INDEX
+        if cached is not None and time.monotonic() - cached[0] < _NICHE_INDEX_TTL_SECONDS:
+            return cached[1], cached[2]
     try:
         import tower
 
         rows = tower.tables("saturated_niches").load().read().to_dicts()
     except Exception:
         return None
+    index = TokenIndex()
+    for i, row in enumerate(rows):
+        index.add(i, _tokens(str(row.get("niche", ""))))
+    with _NICHE_INDEX_LOCK:
+        _NICHE_INDEX = (time.monotonic(), rows, index)
+    return rows, index
 
-    idea_tokens = _tokens(idea)
-    best: dict[str, Any] | None = None
-    best_overlap = 0
-    for row in rows:
-        overlap = len(idea_tokens & _tokens(str(row.get("niche", ""))))
-        if overlap > best_overlap:
-            best = row
-            best_overlap = overlap
 
-    return best if best_overlap else None
+def _best_niche_match(idea: str) -> dict[str, Any] | None:
+    """The saturated_niches row whose niche best overlaps the idea, or None.
+
+    Highest shared-token count wins; ties go to the earlier table row."""
+    loaded = _niche_index()
+    if loaded is None:
+        return None
+    rows, index = loaded
+    ranked = index.query(_tokens(idea), limit=1)
+    return rows[ranked[0][0]] if ranked else None
 
 
 def crowded_market_signal(idea: str) -> dict[str, Any] | None:
@@ -17,10 +17,9 @@ The SvelteKit route (web/src/routes/api/deliver/...) proxies here via AGENT_URL.
 """
 from __future__ import annotations
 
+import asyncio
 import json
-import logging
 import os
-import queue
 import re
 import subprocess
 import threading
@@ -29,14 +28,14 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
-from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from . import deliveries_store, jobs_store
+from . import deliveries_store, event_bus, job_queue, jobs_store, telemetry
 from ._env import env_int
-from .clients import namecom
+from ._log import kv as _kv, setup_logger
+from .clients import _cache, _openrouter, namecom, nimble
 from .orchestrator import build_landing_only, deliver_startup, new_tracking_id, refine_names
 from .schemas import (
     Competitor,
@@ -82,36 +81,7 @@ def _valid_tracking_id(value: str) -> bool:
 # Lightweight key=value lines on stdout. Level from LOG_LEVEL (default INFO).
 # Each delivery is stamped with its trackingId and step/lifecycle boundaries log
 # elapsed_ms where it's cheap. Never logs secrets — only names/presence elsewhere.
-
-def _setup_logger() -> logging.Logger:
-    logger = logging.getLogger("agent.bridge")
-    level_name = os.getenv("LOG_LEVEL", "INFO").strip().upper()
-    logger.setLevel(getattr(logging, level_name, logging.INFO))
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        handler.setFormatter(
-            logging.Formatter("ts=%(asctime)s level=%(levelname)s logger=%(name)s %(message)s")
-        )
-        logger.addHandler(handler)
-    logger.propagate = False  # don't double-log through the root handler
-    return logger
-
-
-log = _setup_logger()
-
-
-def _kv(**fields: Any) -> str:
-    """Render context fields as a `key=value` suffix. None values are dropped and
-    values with whitespace/`=` are JSON-quoted so each line stays parseable."""
-    parts: list[str] = []
-    for key, value in fields.items():
-        if value is None:
-            continue
-        text = str(value)
-        if text == "" or any(ch in text for ch in (" ", "=", '"')):
-            text = json.dumps(text, ensure_ascii=False)
-        parts.append(f"{key}={text}")
-    return " ".join(parts)
+log = setup_logger("agent.bridge")
 
 
 def _elapsed_ms(start: float) -> int:
@@ -205,10 +175,19 @@ def _run_domain_control_check() -> None:
 @asynccontextmanager
 async def _lifespan(_app: FastAPI):
     """Startup hook: kick the name.com control-check off-thread so boot is never
-    blocked, then yield (no shutdown work)."""
+    blocked, start the /jobs worker pool (re-queueing jobs the last process died
+    on), then yield (no shutdown work)."""
     threading.Thread(
         target=_run_domain_control_check, name="domain-control-check", daemon=True
     ).start()
+    job_queue.start(
+        _run_job,
+        slots=_PIPELINE_SLOTS,
+        on_recovered=lambda job: jobs_store.start(
+            job["tracking_id"], job["idea"], build_landing=bool(job["build_landing"]), queued=True
+        ),
+        on_expired=lambda tid: jobs_store.fail(tid, "delivery timed out"),
+    )
     yield
 
 
@@ -231,6 +210,10 @@ class DeliverRequest(BaseModel):
     buildLanding: bool = False
 
 
+class JobRequest(DeliverRequest):
+    priority: int = Field(default=0, ge=-10, le=10)  # higher is claimed first
+
+
 class RefineRequest(BaseModel):
     idea: str = Field(min_length=1, max_length=300)
     gap: str = Field(default="", max_length=2000)
@@ -507,8 +490,15 @@ def debug() -> dict:
     glance (e.g. from the browser via the SvelteKit /api/debug proxy). NEVER returns
     a secret value — only names/presence, the active model, and the name.com base
     (so you can tell dev vs prod), the boot control-check verdict (domainSource),
-    persist flag, concurrency, free slots, and the deliveries-log path + line
-    count + writable bool."""
+    persist flag, concurrency, free slots, the paid-API cache counters (memory /
+    disk hits, coalesced waits, evictions), the LLM response cache (hits + the
+    latency/tokens they saved), the name.com per-domain availability cache,
+    Nimble connection reuse, the Nimble
+    rate governor (queue depth, waits, 429 throttles), SSE fan-out (live
+    channels, subscribers, dropped events), the span buffer behind
+    /debug/trace (spans recorded, traces buffered/evicted), the /jobs queue
+    (depth, running, oldest + p50/p95 wait, recovered/expired), and the
+    deliveries-log path + line count + writable bool."""
     log_path, writable = _log_dir_writable()
     try:
         line_count = deliveries_store.count_all()
@@ -524,12 +514,128 @@ def debug() -> dict:
         "agentLoop": os.getenv("AGENT_LOOP", "0").strip() == "1",
         "envPresent": _env_presence(),
         "domainSource": namecom.domain_source_status(),
+        "cache": _cache.stats(),
+        "llmCache": _openrouter.cache_stats(),
+        "namecomCache": namecom.availability_cache_stats(),
+        "nimbleHttp": nimble.http_stats(),
+        "nimbleLimiter": nimble.limiter_stats(),
+        "sse": event_bus.stats(),
+        "tracing": telemetry.stats(),
+        "jobQueue": job_queue.stats(),
         "deliveriesLogPath": log_path,
         "deliveriesLogLineCount": line_count,
         "deliveriesLogWritable": writable,
     }
 
 
+@app.get("/debug/trace/{tracking_id}", dependencies=[Depends(require_secret)])
+def debug_trace(tracking_id: str):
+    """Where one delivery's time went: its spans (recon, each extract, every LLM
+    call site, name.com batches, verification, landing, agent-loop tools) with
+    parent ids, durations and offsets from the run's first span. Served from the
+    bounded in-process ring (TRACE_BUFFER_TRACES most recent runs), so an old or
+    other-instance run is a 404 — this is a live debugging aid, not an archive."""
+    if not _valid_tracking_id(tracking_id):
+        return JSONResponse({"error": "not found"}, status_code=404)
+    tid = tracking_id.strip().upper()
+    spans = telemetry.trace_spans(tid)
+    if spans is None:
+        return JSONResponse({"error": "not found"}, status_code=404)
+    root = next((s for s in spans if s["parentId"] is None), None)
+    return {
+        "trackingId": tid,
+        "durationMs": root["durationMs"] if root else None,
+        "spans": sorted(spans, key=lambda s: s["offsetMs"]),
+    }
+
+
+def _labelled(stats: dict[str, Any], keys: tuple[str, ...], label: str) -> dict:
+    return {((label, key),): stats.get(key) for key in keys}
+
+
+def _seconds(ms: Any) -> float | None:
+    return ms / 1000 if ms is not None else None
+
+
+@app.get("/metrics")
+def metrics() -> PlainTextResponse:
+    """Prometheus text exposition, scrapeable with no collector in between:
+    span + live-provider latency histograms, provider calls by outcome and their
+    error ratio, pipeline slots in flight, /jobs queue depth + wait, and the
+    paid-API / LLM / name.com cache counters + hit ratios. Not secret-gated (like /health): counts and latencies
+    only — no ids, ideas, or domains ever become labels. Pure in-memory reads."""
+    cache = _cache.stats()
+    llm_cache = _openrouter.cache_stats()
+    namecom_cache = namecom.availability_cache_stats()
+    queue = job_queue.stats()
+    gauges: list[telemetry.Gauge] = [
+        ("pipeline_slots_max", "gauge", "Concurrent pipeline runs allowed.", MAX_CONCURRENCY),
+        (
+            "pipeline_slots_in_flight",
+            "gauge",
+            "Pipeline runs currently holding a slot.",
+            MAX_CONCURRENCY - _free_slots(),
+        ),
+        ("jobs_queued", "gauge", "Jobs waiting in the /jobs queue.", queue.get("queued")),
+        ("jobs_running", "gauge", "Jobs claimed by a queue worker.", queue.get("running")),
+        (
+            "jobs_oldest_queued_seconds",
+            "gauge",
+            "Age of the oldest waiting job.",
+            (queue.get("oldestQueuedMs") or 0) / 1000,
+        ),
+        (
+            "jobs_wait_seconds",
+            "gauge",
+            "Queue wait of recent claims by quantile.",
+            {
+                (("quantile", "0.5"),): _seconds(queue.get("waitP50Ms")),
+                (("quantile", "0.95"),): _seconds(queue.get("waitP95Ms")),
+            },
+        ),
+        (
+            "jobs_total",
+            "counter",
+            "/jobs queue transitions by result.",
+            _labelled(
+                queue,
+                ("enqueued", "rejected", "recovered", "expired", "completed", "failed"),
+                "result",
+            ),
+        ),
+        (
+            "cache_lookups_total",
+            "counter",
+            "Paid-API cache lookups by result.",
+            _labelled(cache, ("memoryHits", "hits", "misses", "coalesced"), "result"),
+        ),
+        ("cache_evictions_total", "counter", "Paid-API cache disk evictions.", cache.get("evictions")),
+        ("cache_hit_ratio", "gauge", "Paid-API cache hit ratio since start.", cache.get("hitRatio")),
+        ("cache_entries", "gauge", "Paid-API cache entries on disk.", cache.get("entries")),
+        ("cache_bytes", "gauge", "Paid-API cache bytes on disk.", cache.get("bytes")),
+        (
+            "llm_cache_lookups_total",
+            "counter",
+            "LLM response cache lookups by result.",
+            _labelled(llm_cache, ("hits", "semanticHits", "misses", "bypassed"), "result"),
+        ),
+        ("llm_cache_hit_ratio", "gauge", "LLM response cache hit ratio since start.", llm_cache.get("hitRatio")),
+        (
+            "llm_cache_saved_seconds_total",
+            "counter",
+            "Model latency the LLM cache saved.",
+            (llm_cache.get("savedMs") or 0) / 1000,
+        ),
+        (
+            "namecom_cache_lookups_total",
+            "counter",
+            "name.com availability cache lookups by result.",
+            _labelled(namecom_cache, ("takenHits", "availableHits", "misses"), "result"),
+        ),
+    ]
+    return PlainTextResponse(telemetry.render_metrics(gauges), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/remix", dependencies=[Depends(require_secret)])
 def remix(req: RemixRequest) -> dict:
     """Three adjacent idea variants to branch this delivery into (one LLM call)."""
@@ -739,18 +845,44 @@ def build_landing(req: BuildLandingRequest):
         _PIPELINE_SLOTS.release()
 
 
+# Idle SSE streams send a comment line this often so proxies don't time them out.
+_SSE_HEARTBEAT_S = 1.0
+
+
+async def _sse(request: Request, sub: event_bus.Subscription):
+    """Drain one event_bus subscription as SSE `event:`/`data:` frames until the
+    run ends or the client disconnects (heartbeating while idle)."""
+    try:
+        while True:
+            if await request.is_disconnected():
+                break  # client is gone; the worker finishes + releases on its own
+            item = await sub.get(_SSE_HEARTBEAT_S)
+            if item is None:
+                yield ": keep-alive\n\n"  # heartbeat so proxies don't time us out
+                continue
+            kind, data = item
+            if kind == event_bus.END:
+                break
+            yield f"event: {kind}\ndata: {json.dumps(data)}\n\n"
+    finally:
+        sub.close()
+
+
 @app.get("/deliver/stream", dependencies=[Depends(require_secret)])
 async def deliver_stream(
     request: Request,
     idea: str = Query(..., min_length=1, max_length=300),  # 300 == MAX_IDEA_CHARS
     buildLanding: bool = False,
 ):
-    """Stream the 4 steps as SSE. The blocking pipeline runs in a worker thread;
-    its events are pushed onto a queue the async generator drains as `data:` lines.
-    The async consumer heartbeats while idle and bails if the client disconnects.
+    """Stream the 4 steps as SSE. The blocking pipeline runs in a worker thread
+    and publishes each event to the run's event_bus channel, which hands it to
+    this request's loop via call_soon_threadsafe — no queue polling, no extra
+    threadpool worker per open stream. The async consumer heartbeats while idle
+    and bails if the client disconnects.
 
     The run is also recorded in jobs_store so the client can resume polling via
-    GET /jobs/{trackingId} even after disconnecting from this stream."""
+    GET /jobs/{trackingId} (or re-attach via GET /jobs/{trackingId}/events) even
+    after disconnecting from this stream."""
     if not _PIPELINE_SLOTS.acquire(blocking=False):
         log.info("deliver.stream rejected " + _kv(reason="busy", freeSlots=_free_slots()))
         return JSONResponse({"error": "busy"}, status_code=429)
@@ -760,8 +892,9 @@ async def deliver_stream(
     tid = new_tracking_id()
     jobs_store.start(tid, idea, build_landing=buildLanding)
 
-    events: "queue.Queue[tuple[str, Any]]" = queue.Queue()
-    _DONE = object()
+    # Subscribe BEFORE the worker starts so this client can't miss early events.
+    channel = event_bus.open_channel(tid)
+    sub = channel.subscribe(asyncio.get_running_loop())
     # Request-scoped context shared with the worker so each step/lifecycle line can
     # carry the trackingId (pre-minted above; also surfaced on `start` event).
     ctx: dict[str, Any] = {"trackingId": tid, "start": time.monotonic()}
@@ -770,7 +903,7 @@ async def deliver_stream(
         if kind == "start" and isinstance(data, dict) and data.get("trackingId"):
             ctx["trackingId"] = data["trackingId"]
         payload = _jsonable(data)
-        events.put((kind, payload))
+        channel.publish(kind, payload)
         jobs_store.apply_event(ctx["trackingId"], kind, payload)
         # Step boundary at DEBUG so INFO stays a clean lifecycle view.
         log.debug(
@@ -784,8 +917,8 @@ async def deliver_stream(
             pkg = deliver_startup(idea, build_landing=buildLanding, on_event=on_event, tracking_id=tid)
             _persist(pkg)
             pkg_payload = _package(pkg)
-            events.put(("package", pkg_payload))
             jobs_store.finish(tid, pkg_payload)
+            channel.publish("package", pkg_payload)
             verdict = pkg.verdict.call if pkg.verdict else None
             log.info(
                 "deliver.stream done "
@@ -805,89 +938,132 @@ async def deliver_stream(
                     elapsedMs=_elapsed_ms(ctx["start"]),
                 )
             )
-            events.put(("error", {"message": "delivery failed"}))
             jobs_store.fail(tid, "delivery failed")
+            channel.publish("error", {"message": "delivery failed"})
         finally:
-            events.put((_DONE, None))  # type: ignore[arg-type]
+            channel.close()
             _PIPELINE_SLOTS.release()  # free the slot even if the client vanished
 
     threading.Thread(target=worker, daemon=True).start()
 
-    async def gen():
-        while True:
-            if await request.is_disconnected():
-                break  # client is gone; stop draining (worker finishes + releases)
-            try:
-                kind, data = await run_in_threadpool(events.get, True, 1.0)
-            except queue.Empty:
-                yield ": keep-alive\n\n"  # heartbeat so proxies don't time us out
-                continue
-            if kind is _DONE:
-                break
-            yield f"event: {kind}\ndata: {json.dumps(data)}\n\n"
-
-    return StreamingResponse(gen(), media_type="text/event-stream", headers={"x-tracking-id": tid})
+    return StreamingResponse(_sse(request, sub), media_type="text/event-stream", headers={"x-tracking-id": tid})
 
 
-@app.post("/jobs", dependencies=[Depends(require_secret)])
-def create_job(req: DeliverRequest) -> JSONResponse:
-    """Start a durable background delivery job and return immediately.
+def _run_job(job: dict) -> None:
+    """Run one claimed queue job (on a job_queue worker, which already holds a
+    pipeline slot). Mirrors the old per-job thread: progress folds into
+    jobs_store and fans out to GET /jobs/{id}/events, the package lands in both
+    stores. Re-raises so the queue records the job as failed.
 
-    Unlike ``POST /deliver`` (which blocks until done) or ``GET /deliver/stream``
-    (which ties progress to the browser connection), this endpoint spawns a daemon
-    thread and returns a ``trackingId`` the client can poll via ``GET /jobs/{id}``.
-    The job runs to completion server-side regardless of whether the client stays
-    connected, and the final package is stored in both ``jobs_store`` and
-    ``deliveries_store``."""
-    if not _PIPELINE_SLOTS.acquire(blocking=False):
-        log.info("jobs.create rejected " + _kv(reason="busy", freeSlots=_free_slots()))
-        return JSONResponse({"error": "busy"}, status_code=429)
-
-    tid = new_tracking_id()
-    jobs_store.start(tid, req.idea, build_landing=req.buildLanding)
+    Each progress event renews the claim's lease. Once the claim has lost the
+    job (its lease lapsed and another worker re-ran it, or it expired), this
+    run stops touching jobs_store, deliveries_store and the channel: those now
+    belong to the owner."""
+    tid = job["tracking_id"]
+    build = bool(job["build_landing"])
+    # Reuses the channel opened at enqueue (or opens one for a recovered job).
+    channel = event_bus.open_channel(tid)
+    jobs_store.start(tid, job["idea"], build_landing=build)
     start_time = time.monotonic()
 
-    def worker() -> None:
-        log.info(
-            "jobs.worker start "
-            + _kv(trackingId=tid, buildLanding=req.buildLanding, freeSlots=_free_slots())
+    def on_event(kind: str, data: dict) -> None:
+        if not job_queue.heartbeat(tid, job["attempts"]):
+            return
+        payload = _jsonable(data)
+        channel.publish(kind, payload)
+        jobs_store.apply_event(tid, kind, payload)
+
+    log.info(
+        "jobs.worker start "
+        + _kv(trackingId=tid, buildLanding=build, attempt=job["attempts"], freeSlots=_free_slots())
+    )
+    try:
+        pkg = deliver_startup(
+            job["idea"],
+            build_landing=build,
+            on_event=on_event,
+            tracking_id=tid,
         )
-        try:
-            pkg = deliver_startup(
-                req.idea,
-                build_landing=req.buildLanding,
-                on_event=lambda k, d: jobs_store.apply_event(tid, k, _jsonable(d)),
-                tracking_id=tid,
-            )
-            _persist(pkg)
-            jobs_store.finish(tid, _package(pkg))
-            verdict = pkg.verdict.call if pkg.verdict else None
-            log.info(
-                "jobs.worker done "
-                + _kv(
-                    trackingId=tid,
-                    domain=pkg.domain,
-                    verdict=verdict,
-                    elapsedMs=_elapsed_ms(start_time),
-                )
-            )
-        except ValueError as exc:
+        if not job_queue.owns(job):
             log.warning(
-                "jobs.worker invalid input "
-                + _kv(trackingId=tid, error=str(exc), elapsedMs=_elapsed_ms(start_time))
+                "jobs.worker superseded "
+                + _kv(trackingId=tid, attempt=job["attempts"], elapsedMs=_elapsed_ms(start_time))
             )
-            jobs_store.fail(tid, "invalid input")
-        except Exception as exc:
-            log.error(
-                "jobs.worker failed "
-                + _kv(trackingId=tid, error=repr(exc), elapsedMs=_elapsed_ms(start_time))
+            return
+        _persist(pkg)
+        pkg_payload = _package(pkg)
+        jobs_store.finish(tid, pkg_payload)
+        channel.publish("package", pkg_payload)
+        verdict = pkg.verdict.call if pkg.verdict else None
+        log.info(
+            "jobs.worker done "
+            + _kv(
+                trackingId=tid,
+                domain=pkg.domain,
+                verdict=verdict,
+                elapsedMs=_elapsed_ms(start_time),
             )
+        )
+    except ValueError as exc:
+        log.warning(
+            "jobs.worker invalid input "
+            + _kv(trackingId=tid, error=str(exc), elapsedMs=_elapsed_ms(start_time))
+        )
+        if job_queue.owns(job):
+            jobs_store.fail(tid, "invalid input")
+            channel.publish("error", {"message": "invalid input"})
+            channel.close()
+        raise
+    except Exception as exc:
+        log.error(
+            "jobs.worker failed "
+            + _kv(trackingId=tid, error=repr(exc), elapsedMs=_elapsed_ms(start_time))
+        )
+        if job_queue.owns(job):
             jobs_store.fail(tid, "delivery failed")
-        finally:
-            _PIPELINE_SLOTS.release()
+            channel.publish("error", {"message": "delivery failed"})
+            channel.close()
+        raise
+    else:
+        channel.close()
 
-    threading.Thread(target=worker, daemon=True).start()
-    return JSONResponse({"trackingId": tid, "status": "running"}, status_code=202)
+
+@app.post("/jobs", dependencies=[Depends(require_secret)])
+def create_job(req: JobRequest, request: Request, x_client_id: str = Header(default="")) -> JSONResponse:
+    """Queue a durable background delivery job and return immediately.
+
+    Unlike ``POST /deliver`` (which blocks until done) or ``GET /deliver/stream``
+    (which ties progress to the browser connection), this endpoint enqueues the
+    job in ``job_queue`` (SQLite, survives a restart) and returns a
+    ``trackingId`` the client can poll via ``GET /jobs/{id}``. A fixed worker
+    pool runs it to completion server-side regardless of whether the client
+    stays connected, and the final package is stored in both ``jobs_store`` and
+    ``deliveries_store``.
+
+    A burst no longer 429s at MAX_CONCURRENCY: the job waits (``queued: true``
+    plus ``queuePosition`` on the envelope, ``status`` stays ``"running"`` for
+    the web client). 429 only when the queue, or this client's share of it, is
+    full. The client is ``X-Client-Id`` when the proxy sends one, else the peer
+    address; ``priority`` (-10..10, default 0) orders the queue."""
+    client = (x_client_id.strip() or (request.client.host if request.client else "") or "anon")[:64]
+    tid = new_tracking_id()
+    jobs_store.start(tid, req.idea, build_landing=req.buildLanding, queued=True)
+    # Live watchers can attach via GET /jobs/{id}/events while it waits and runs.
+    channel = event_bus.open_channel(tid)
+    try:
+        ahead = job_queue.enqueue(
+            tid, req.idea, build_landing=req.buildLanding, client=client, priority=req.priority
+        )
+    except job_queue.QueueFull as exc:
+        jobs_store.fail(tid, "queue full")
+        channel.close()
+        log.info("jobs.create rejected " + _kv(reason=str(exc), client=client))
+        return JSONResponse({"error": "busy"}, status_code=429)
+    log.info("jobs.create queued " + _kv(trackingId=tid, client=client, priority=req.priority, ahead=ahead))
+    return JSONResponse(
+        {"trackingId": tid, "status": "running", "queued": True, "queuePosition": ahead},
+        status_code=202,
+    )
 
 
 @app.get("/jobs/{tracking_id}")
@@ -903,10 +1079,21 @@ def get_job(tracking_id: str):
     before the jobs_store existed or whose job file has been pruned."""
     if not _valid_tracking_id(tracking_id):
         return JSONResponse({"error": "not found"}, status_code=404)
-    tracking_id = tracking_id.strip().upper()
+    job = _job_envelope(tracking_id.strip().upper())
+    if job is None:
+        return JSONResponse({"error": "not found"}, status_code=404)
+    return job
+
 
+def _job_envelope(tracking_id: str) -> dict | None:
+    """The job envelope GET /jobs/{id} and its SSE snapshot serve, or None.
+
+    Live jobs come from jobs_store (plus ``queuePosition`` while waiting);
+    otherwise a done envelope is synthesised from deliveries_store."""
     job = jobs_store.get(tracking_id)
     if job is not None:
+        if job.get("queued") and job.get("status") == "running":
+            job = {**job, "queuePosition": job_queue.position(tracking_id)}
         return job
 
     # Cold fallback: delivery completed but no job file (pre-existing delivery
@@ -931,4 +1118,36 @@ def get_job(tracking_id: str):
         except Exception:
             pass
 
-    return JSONResponse({"error": "not found"}, status_code=404)
+    return None
+
+
+@app.get("/jobs/{tracking_id}/events", dependencies=[Depends(require_secret)])
+async def job_events(request: Request, tracking_id: str):
+    """Attach to a job as SSE instead of polling GET /jobs/{id}.
+
+    Sends the current job envelope first as a `snapshot` event, then — while the
+    run is live in this process — every further pipeline event as it happens
+    (the same frames /deliver/stream emits, ending with `package` or `error`).
+    A finished/unknown-here job just gets its snapshot and the stream ends. Any
+    number of watchers may attach to the same run."""
+    if not _valid_tracking_id(tracking_id):
+        return JSONResponse({"error": "not found"}, status_code=404)
+    tid = tracking_id.strip().upper()
+
+    # Subscribe BEFORE reading the snapshot so nothing falls in between (an event
+    # may then appear in both; the client folds idempotently, as on resume).
+    live = event_bus.channel(tid)
+    sub = live.subscribe(asyncio.get_running_loop()) if live is not None else None
+    job = await asyncio.to_thread(_job_envelope, tid)
+    if job is None:
+        if sub is not None:
+            sub.close()
+        return JSONResponse({"error": "not found"}, status_code=404)
+
+    async def gen():
+        yield f"event: snapshot\ndata: {json.dumps(job)}\n\n"
+        if sub is not None:
+            async for frame in _sse(request, sub):
+                yield frame
+
+    return StreamingResponse(gen(), media_type="text/event-stream", headers={"x-tracking-id": tid})
@@ -0,0 +1,369 @@
+"""In-process spans + Prometheus-style metrics for the delivery pipeline.
+
+The `_kv` log lines say WHEN a delivery started and finished; this says where
+the time went in between, without an external collector:
+
+  - `trace(tracking_id)` scopes a run: every `span(...)` opened under it (in
+    this thread, in asyncio tasks, and in worker threads started through
+    `bind`) carries the trackingId as its trace id and nests under the span
+    that was current when it opened;
+  - finished spans land in a bounded in-memory ring of recent traces
+    (TRACE_BUFFER_TRACES runs x TRACE_MAX_SPANS spans) served by
+    GET /debug/trace/{trackingId}, and are logged at DEBUG on `agent.trace`;
+  - every span also feeds a latency histogram keyed by span name + outcome,
+    and `record_call` counts live provider calls (ok / error, latency), so
+    GET /metrics can render per-stage p-quantiles and provider error rates in
+    the Prometheus text format for any scraper — or a human with curl.
+
+Span names are a fixed, low-cardinality vocabulary (stage / call-site / tool
+names); ids and URLs go in span attributes, never in metric labels.
+
+stdlib-only; one Lock guards the registry. Recording NEVER raises into the
+pipeline: instrumentation is observability, not a dependency.
+"""
+from __future__ import annotations
+
+import contextvars
+import functools
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from ._env import env_int
+from ._log import kv as _kv, setup_logger
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+TRACE_BUFFER_TRACES = env_int("TRACE_BUFFER_TRACES", 100)
+TRACE_MAX_SPANS = env_int("TRACE_MAX_SPANS", 512)
+
+METRIC_PREFIX = "startup_delivery_"
+
+# Seconds. Spans range from sub-ms cache hits to multi-second LLM calls and a
+# whole delivery (tens of seconds), so the ladder is wide.
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+log = setup_logger("agent.trace")
+
+
+_TRACE_ID: contextvars.ContextVar[str | None] = contextvars.ContextVar("trace_id", default=None)
+_PARENT: contextvars.ContextVar[int | None] = contextvars.ContextVar("parent_span", default=None)
+_SPAN_IDS = itertools.count(1)
+
+_LOCK = threading.Lock()
+_TRACES: OrderedDict[str, deque[dict[str, Any]]] = OrderedDict()
+_SPAN_HIST: dict[tuple[str, str], "_Histogram"] = {}
+_PROVIDER_HIST: dict[str, "_Histogram"] = {}
+_PROVIDER_CALLS: dict[tuple[str, str], int] = {}
+_COUNTERS = {"spans": 0, "droppedSpans": 0, "evictedTraces": 0}
+
+
+class _Histogram:
+    """Cumulative-bucket latency histogram (caller holds _LOCK)."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(_BUCKETS)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        for i, bound in enumerate(_BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        self.total += seconds
+        self.count += 1
+
+
+# --------------------------------------------------------------------------- #
+# Spans                                                                       #
+# --------------------------------------------------------------------------- #
+def current_trace_id() -> str | None:
+    return _TRACE_ID.get()
+
+
+@contextmanager
+def trace(trace_id: str | None) -> Iterator[None]:
+    """Scope a pipeline run: spans opened inside carry `trace_id` (the trackingId).
+
+    Re-entering with the SAME id (deliver_startup -> run_agent_loop) keeps the
+    current parent, so the agent loop's spans nest under the delivery's."""
+    if not trace_id or trace_id == _TRACE_ID.get():
+        yield
+        return
+    trace_token = _TRACE_ID.set(trace_id)
+    parent_token = _PARENT.set(None)
+    try:
+        yield
+    finally:
+        _PARENT.reset(parent_token)
+        _TRACE_ID.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[dict[str, Any]]:
+    """Time a block as span `name`. Yields the attribute dict so the block can
+    annotate its outcome (e.g. `attrs["cached"] = True`). An exception marks the
+    span "error" (its type is recorded) and propagates unchanged."""
+    span_id = next(_SPAN_IDS)
+    parent = _PARENT.get()
+    token = _PARENT.set(span_id)
+    started_wall = time.time()
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield attrs
+    except BaseException as exc:
+        status = "error"
+        attrs.setdefault("error", type(exc).__name__)
+        raise
+    finally:
+        _PARENT.reset(token)
+        _finish(name, span_id, parent, started_wall, time.perf_counter() - started, status, attrs)
+
+
+def traced(name: str) -> Callable[[_F], _F]:
+    """Decorator form of `span(name)` for whole functions."""
+
+    def decorate(fn: _F) -> _F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def bind(fn: _F) -> _F:
+    """Carry the caller's trace context into `fn` when it runs on another thread.
+
+    ThreadPoolExecutor.submit / Thread(target=) don't copy contextvars (asyncio
+    tasks and asyncio.to_thread do), so spans opened in the worker would lose
+    their trace. Each call runs in its own copy, so one bound callable can be
+    mapped across a pool concurrently."""
+    captured = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return captured.copy().run(fn, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _finish(
+    name: str,
+    span_id: int,
+    parent: int | None,
+    started_wall: float,
+    seconds: float,
+    status: str,
+    attrs: dict[str, Any],
+) -> None:
+    trace_id = _TRACE_ID.get()
+    try:
+        with _LOCK:
+            _COUNTERS["spans"] += 1
+            hist = _SPAN_HIST.get((name, status))
+            if hist is None:
+                hist = _SPAN_HIST[(name, status)] = _Histogram()
+            hist.observe(seconds)
+            if trace_id:
+                spans = _TRACES.get(trace_id)
+                if spans is None:
+                    spans = _TRACES[trace_id] = deque()
+                    while len(_TRACES) > max(1, TRACE_BUFFER_TRACES):
+                        _TRACES.popitem(last=False)
+                        _COUNTERS["evictedTraces"] += 1
+                else:
+                    _TRACES.move_to_end(trace_id)
+                if len(spans) < TRACE_MAX_SPANS:
+                    spans.append(
+                        {
+                            "span": name,
+                            "spanId": span_id,
+                            "parentId": parent,
+                            "startedAt": round(started_wall, 3),
+                            "durationMs": round(seconds * 1000, 1),
+                            "status": status,
+                            "attrs": {k: v for k, v in attrs.items() if v is not None},
+                        }
+                    )
+                else:
+                    _COUNTERS["droppedSpans"] += 1
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "span "
+                + _kv(
+                    traceId=trace_id,
+                    span=name,
+                    spanId=span_id,
+                    parentId=parent,
+                    durationMs=round(seconds * 1000, 1),
+                    status=status,
+                    **attrs,
+                )
+            )
+    except Exception:
+        pass  # never let bookkeeping break the pipeline
+
+
+def trace_spans(trace_id: str) -> list[dict[str, Any]] | None:
+    """The buffered spans of one trace in finish order, or None if not (or no
+    longer) buffered. Offsets are relative to the trace's first span start."""
+    with _LOCK:
+        spans = _TRACES.get(trace_id)
+        rows = [dict(s) for s in spans] if spans is not None else None
+    if rows is None:
+        return None
+    origin = min((r["startedAt"] for r in rows), default=0.0)
+    for row in rows:
+        row["offsetMs"] = round((row["startedAt"] - origin) * 1000, 1)
+    return rows
+
+
+def stats() -> dict[str, Any]:
+    """Span/trace buffer counters for /debug."""
+    with _LOCK:
+        return {
+            **_COUNTERS,
+            "bufferedTraces": len(_TRACES),
+            "maxTraces": TRACE_BUFFER_TRACES,
+            "maxSpansPerTrace": TRACE_MAX_SPANS,
+        }
+
+
+# --------------------------------------------------------------------------- #
+# Provider calls                                                              #
+# --------------------------------------------------------------------------- #
+def record_call(provider: str, seconds: float, *, ok: bool) -> None:
+    """Count one LIVE provider call (cache hits never get here) and its latency."""
+    try:
+        with _LOCK:
+            key = (provider, "ok" if ok else "error")
+            _PROVIDER_CALLS[key] = _PROVIDER_CALLS.get(key, 0) + 1
+            hist = _PROVIDER_HIST.get(provider)
+            if hist is None:
+                hist = _PROVIDER_HIST[provider] = _Histogram()
+            hist.observe(seconds)
+    except Exception:
+        pass
+
+
+@contextmanager
+def provider_call(provider: str) -> Iterator[None]:
+    """Time a live provider call; an exception counts as an error and propagates."""
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        record_call(provider, time.perf_counter() - started, ok=ok)
+
+
+# --------------------------------------------------------------------------- #
+# Prometheus text exposition                                                  #
+# --------------------------------------------------------------------------- #
+Labels = tuple[tuple[str, str], ...]
+# (name without prefix, type, help, value or {labels: value})
+Gauge = tuple[str, str, str, "float | int | None | dict[Labels, float | int | None]"]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{k}="{_escape(str(v))}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+_LE_INF = 'le="+Inf"'
+
+
+def _render_histograms(lines: list[str], name: str, help_text: str, series: dict[Labels, _Histogram]) -> None:
+    full = METRIC_PREFIX + name
+    lines.append(f"# HELP {full} {help_text}")
+    lines.append(f"# TYPE {full} histogram")
+    for labels, hist in sorted(series.items()):
+        running = 0
+        for bound, count in zip(_BUCKETS, hist.counts):
+            running += count
+            le = 'le="' + _num(bound) + '"'
+            lines.append(f"{full}_bucket{_labels(labels, le)} {running}")
+        lines.append(f"{full}_bucket{_labels(labels, _LE_INF)} {hist.count}")
+        lines.append(f"{full}_sum{_labels(labels)} {round(hist.total, 6)}")
+        lines.append(f"{full}_count{_labels(labels)} {hist.count}")
+
+
+def render_metrics(gauges: list[Gauge] | None = None) -> str:
+    """Every metric as Prometheus text format 0.0.4: span and provider latency
+    histograms, provider call counters + lifetime error ratio, plus the caller's
+    point-in-time `gauges` (the bridge passes pipeline slots + cache counters)."""
+    with _LOCK:
+        span_series = {
+            (("span", name), ("outcome", status)): _copy(h) for (name, status), h in _SPAN_HIST.items()
+        }
+        provider_series = {(("provider", p),): _copy(h) for p, h in _PROVIDER_HIST.items()}
+        calls = dict(_PROVIDER_CALLS)
+
+    lines: list[str] = []
+    _render_histograms(
+        lines, "span_duration_seconds", "Pipeline span latency by span name and outcome.", span_series
+    )
+    _render_histograms(
+        lines,
+        "provider_request_duration_seconds",
+        "Live provider call latency (cache hits excluded).",
+        provider_series,
+    )
+    providers = sorted({p for p, _ in calls})
+    errors: dict[Labels, float | int | None] = {}
+    for p in providers:
+        total = calls.get((p, "ok"), 0) + calls.get((p, "error"), 0)
+        errors[(("provider", p),)] = round(calls.get((p, "error"), 0) / total, 6) if total else None
+    builtin: list[Gauge] = [
+        (
+            "provider_requests_total",
+            "counter",
+            "Live provider calls by outcome.",
+            {(("provider", p), ("outcome", o)): n for (p, o), n in sorted(calls.items())},
+        ),
+        ("provider_error_ratio", "gauge", "Lifetime share of live provider calls that failed.", errors),
+    ]
+    for name, kind, help_text, value in builtin + list(gauges or []):
+        series = value if isinstance(value, dict) else {(): value}
+        series = {k: v for k, v in series.items() if v is not None}
+        if not series:
+            continue
+        full = METRIC_PREFIX + name
+        lines.append(f"# HELP {full} {help_text}")
+        lines.append(f"# TYPE {full} {kind}")
+        for labels, v in series.items():
+            lines.append(f"{full}{_labels(labels)} {_num(float(v))}")
+    return "\n".join(lines) + "\n"
+
+
+def _copy(hist: _Histogram) -> _Histogram:
+    out = _Histogram()
+    out.counts = list(hist.counts)
+    out.total = hist.total
+    out.count = hist.count
+    return out
@@ -0,0 +1,88 @@
+"""Inverted token index for niche-overlap recall.
+
+Both niche matchers — deliveries_store._for_niche_tokens (past deliveries) and
+saturated_niches._best_niche_match (the Tower table) — used to re-tokenize every
+candidate on every query and intersect token sets one row at a time, so their
+cost grew linearly with history. This index keeps stemmed token -> doc ids
+postings, built once and updated as docs come and go; a query only touches the
+postings of its own tokens.
+
+Callers tokenize (saturated_niches._tokens), so this module stays tokenizer-
+agnostic and import-cycle free. Doc ids are ints whose order is the tie-break
+the callers already used (log sequence / table row order), so the default
+overlap scoring returns exactly the rows the linear scans did. BM25 is
+available as an opt-in ranking. Not thread-safe by itself; callers hold a lock.
+"""
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Iterable
+
+# Standard BM25 constants; doc length = distinct stemmed tokens.
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+class TokenIndex:
+    """token -> {doc ids} postings, plus each doc's token set."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, set[int]] = {}
+        self._docs: dict[int, frozenset[str]] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def tokens(self, doc: int) -> frozenset[str]:
+        return self._docs.get(doc, frozenset())
+
+    def docs(self, token: str) -> frozenset[int]:
+        return frozenset(self._postings.get(token, ()))
+
+    def add(self, doc: int, tokens: Iterable[str]) -> None:
+        self.remove(doc)
+        toks = frozenset(tokens)
+        self._docs[doc] = toks
+        self._total_len += len(toks)
+        for tok in toks:
+            self._postings.setdefault(tok, set()).add(doc)
+
+    def remove(self, doc: int) -> None:
+        toks = self._docs.pop(doc, None)
+        if toks is None:
+            return
+        self._total_len -= len(toks)
+        for tok in toks:
+            posting = self._postings.get(tok)
+            if posting is not None:
+                posting.discard(doc)
+                if not posting:
+                    del self._postings[tok]
+
+    def query(self, tokens: Iterable[str], *, limit: int | None = None, bm25: bool = False) -> list[tuple[int, float]]:
+        """(doc, score) for every doc sharing at least one token, best first.
+
+        Default score = overlap count (|query ∩ doc|), ties broken by ascending
+        doc id — the same order as a stable sort over a scan in doc-id order.
+        `bm25=True` weights each shared token by its IDF and normalizes by doc
+        length instead (rarer shared tokens count more).
+        """
+        scores: Counter[int] = Counter()
+        n = len(self._docs)
+        avg_len = (self._total_len / n) if n else 0.0
+        for tok in set(tokens):
+            posting = self._postings.get(tok)
+            if not posting:
+                continue
+            if not bm25:
+                for doc in posting:
+                    scores[doc] += 1
+                continue
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc in posting:
+                norm = 1 - _BM25_B + _BM25_B * (len(self._docs[doc]) / avg_len if avg_len else 1.0)
+                scores[doc] += idf * (_BM25_K1 + 1) / (1 + _BM25_K1 * norm)
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return ranked[:limit] if limit is not None else ranked
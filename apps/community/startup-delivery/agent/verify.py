@@ -22,6 +22,7 @@ import re
 from typing import Any
 from urllib.parse import urlparse
 
+from . import telemetry
 from .schemas import NameCandidate, ReconResult, Verdict
 
 # Corporate suffixes we ignore when normalizing a name ("Acme Inc" == "Acme").
@@ -221,6 +222,7 @@ def _candidate_mentions(text: str) -> list[str]:
 # --------------------------------------------------------------------------- #
 # Public checks                                                               #
 # --------------------------------------------------------------------------- #
+@telemetry.traced("verify.citations")
 def competitors_cited_exist(text: str, recon: ReconResult) -> list[str]:
     """Cited brand names in `text` that do NOT appear in recon.competitors.
 
@@ -236,6 +238,7 @@ def competitors_cited_exist(text: str, recon: ReconResult) -> list[str]:
     return missing
 
 
+@telemetry.traced("verify.collisions")
 def names_collide_with_incumbents(
     candidates: list[NameCandidate], recon: ReconResult
 ) -> list[NameCandidate]:
@@ -327,6 +330,7 @@ _SEGMENT_TOKENS = frozenset({
 })
 
 
+@telemetry.traced("verify.gap_strength")
 def gap_strength(gap: str, recon: ReconResult) -> int:
     """How strong is the positioning gap, on a 0/1/2 ladder. Pure + offline.
 
@@ -355,6 +359,7 @@ def gap_strength(gap: str, recon: ReconResult) -> int:
     return 1
 
 
+@telemetry.traced("verify.outputs")
 def verify_outputs(
     recon: ReconResult,
     gap: str,
@@ -2,10 +2,13 @@ import re
 import json
 import requests
 from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Annotated
 import operator
+import threading
+import time
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
@@ -14,6 +17,8 @@ from langgraph.graph import StateGraph, START, END
 from langgraph.types import Send
 from typing_extensions import TypedDict
 
+import state_store
+
 # ─── Load config ──────────────────────────────────────────────────────────────
 
 CONFIG_FILE = Path(__file__).parent / "config.json"
@@ -60,8 +65,7 @@ WEEK_START = (NOW - timedelta(days=NOW.weekday())).strftime("%Y-%m-%d")  # Monda
 IS_MONDAY = NOW.weekday() == 0
 IS_MWF    = NOW.weekday() in (0, 2, 4)
 
-SEEN_URLS_FILE = Path(__file__).parent / "seen_urls.json"
-SEEN_CONTEXT_FILE = Path(__file__).parent / "seen_context.json"
+STATE_RETENTION_DAYS = 30   # seen URLs, daily context and idle cursors (state_store.py)
 
 # ─── Graph state ─────────────────────────────────────────────────────────────
 
@@ -70,29 +74,115 @@ class AgentState(TypedDict, total=False):
     raw_results: Annotated[list, operator.add]
     fresh_results: list
     synthesis: dict
-    seen_urls: dict        # {url: date_str} — rolling 30-day URL history
-    seen_context: dict     # {date_str: [topic_str, ...]} — rolling 7-day story history
+    seen_context: dict     # {date_str: {"topics", "overview"}} — rolling story history (URLs stay in state_store)
     # Set per-competitor via Send
     current_competitor: str
     current_aliases: list
 
 
-# ─── Persistence helpers ─────────────────────────────────────────────────────
-
-def _load_json(path: Path) -> dict:
+# ─── HTTP scheduler ──────────────────────────────────────────────────────────
+# One scheduler for the whole run instead of a thread pool per competitor node.
+# Every (competitor, source, alias) fetch is a task on the lane of the API it
+# calls; a lane is a fixed worker pool (the host's concurrency cap) with its own
+# pooled keep-alive session. A limiter spaces request starts where the API
+# documents a rate limit (HN Algolia, GitHub search); Nimble has no published
+# per-second limit, so its lane is bounded by the concurrency cap alone.
+# Competitors, sources and aliases all run in parallel, so the collect phase
+# takes about as long as the busiest host, not competitors × sources × aliases.
+
+HOSTS = {
+    # lane: max concurrent requests, min seconds between request starts (0 = none)
+    "nimble": {"workers": 8, "interval": 0.0},
+    "hn":     {"workers": 4, "interval": 0.4},   # Algolia: 10,000 requests/hour per IP
+    "github": {"workers": 3, "interval": 0.0},   # search is limited per endpoint: LIMITS
+}
+# GitHub's search endpoints allow 30 requests/min (the core API is 5000/h).
+LIMITS = {"github_search": 2.1}
+
+
+class _Limiter:
+    """Spaces request starts at least `interval` seconds apart (thread-safe)."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class _Lane:
+    def __init__(self, name: str, workers: int, interval: float):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"collect-{name}")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.limiter = _Limiter(interval)
+
+
+_LANES = {name: _Lane(name, cfg["workers"], cfg["interval"]) for name, cfg in HOSTS.items()}
+_LIMITERS = {name: _Limiter(interval) for name, interval in LIMITS.items()}
+
+
+def _request(lane: str, method: str, url: str, limit: str = "", **kwargs) -> requests.Response:
+    """HTTP call on a lane's pooled session, after the lane's (and `limit`'s) rate limiter."""
+    _LANES[lane].limiter.wait()
+    if limit:
+        _LIMITERS[limit].wait()
+    return _LANES[lane].session.request(method, url, **kwargs)
+
+
+# Per-source timing for the run: {source: {"tasks", "seconds", "max", "items", "errors"}}.
+_TIMINGS: dict = {}
+_TIMINGS_LOCK = threading.Lock()
+_COLLECT_SPAN = {"start": None, "end": None}
+
+
+def _timed(source: str, fn, *args) -> list:
+    """Run one collector task and fold its wall time / item count into _TIMINGS."""
+    started = time.monotonic()
+    items, failed = [], False
     try:
-        return json.loads(path.read_text()) if path.exists() else {}
+        items = fn(*args)
     except Exception as e:
-        print(f"[State] Failed to load {path.name}: {e} — starting fresh")
-        return {}
-
-
-def _prune_by_date(data: dict, days: int, by_value: bool = False) -> dict:
-    """Prune dict entries older than `days`. Use by_value=True when keys are URLs and values are dates."""
-    cutoff = (NOW - timedelta(days=days)).strftime("%Y-%m-%d")
-    if by_value:
-        return {k: v for k, v in data.items() if isinstance(v, str) and v >= cutoff}
-    return {k: v for k, v in data.items() if k >= cutoff}
+        failed = True
+        print(f"  [Collect error] {source} {args[0]}/{args[1]}: {e}")
+    elapsed = time.monotonic() - started
+    with _TIMINGS_LOCK:
+        t = _TIMINGS.setdefault(source, {"tasks": 0, "seconds": 0.0, "max": 0.0, "items": 0, "errors": 0})
+        t["tasks"] += 1
+        t["seconds"] += elapsed
+        t["max"] = max(t["max"], elapsed)
+        t["items"] += len(items)
+        t["errors"] += failed
+        if _COLLECT_SPAN["start"] is None or started < _COLLECT_SPAN["start"]:
+            _COLLECT_SPAN["start"] = started
+        _COLLECT_SPAN["end"] = max(_COLLECT_SPAN["end"] or 0.0, started + elapsed)
+    return items
+
+
+def _print_timings():
+    with _TIMINGS_LOCK:
+        timings = {k: dict(v) for k, v in _TIMINGS.items()}
+        span = dict(_COLLECT_SPAN)
+    if not timings:
+        return
+    wall = (span["end"] or 0.0) - (span["start"] or 0.0)
+    busy = sum(t["seconds"] for t in timings.values())
+    print(f"Collection: {sum(t['tasks'] for t in timings.values())} tasks, "
+          f"{wall:.1f}s wall ({busy:.1f}s of requests)")
+    for source, t in sorted(timings.items(), key=lambda kv: -kv[1]["seconds"]):
+        print(f"  {source:<16} {t['tasks']:>3} tasks  {t['seconds']:6.1f}s total  "
+              f"{t['max']:5.1f}s max  {t['items']:>4} items  {t['errors']} errors")
 
 
 # ─── Nimble Search API ───────────────────────────────────────────────────────
@@ -102,7 +192,8 @@ TODAY = NOW.strftime("%Y-%m-%d")
 
 
 def nimble_search(query: str, focus: str = "general", max_results: int = 8,
-                  date_filter: bool = True) -> list:
+                  date_filter: bool = True, start_date: str = "", strict: bool = False) -> list:
+    """strict=True re-raises request errors so a cursor isn't advanced past a failed fetch."""
     payload = {
         "query": query,
         "max_results": max_results,
@@ -110,11 +201,11 @@ def nimble_search(query: str, focus: str = "general", max_results: int = 8,
         "focus": focus,
     }
     if date_filter:
-        payload["start_date"] = SEARCH_START
+        payload["start_date"] = start_date or SEARCH_START
         payload["end_date"] = TODAY
     try:
-        resp = requests.post(
-            NIMBLE_SEARCH_URL,
+        resp = _request(
+            "nimble", "POST", NIMBLE_SEARCH_URL,
             headers={"Authorization": f"Bearer {NIMBLE_API_KEY}", "Content-Type": "application/json"},
             json=payload,
             timeout=30,
@@ -122,6 +213,8 @@ def nimble_search(query: str, focus: str = "general", max_results: int = 8,
         resp.raise_for_status()
         return resp.json().get("results", [])
     except Exception as e:
+        if strict:
+            raise  # _timed logs and counts it
         print(f"  [Search error] {query[:60]}: {e}")
         return []
 
@@ -151,228 +244,272 @@ def _to_results(items: list, competitor: str, platform: str) -> list:
     return out
 
 
-# ─── Per-source collectors (called in parallel within each competitor) ───────
+# ─── Per-source cursors ──────────────────────────────────────────────────────
+# One high-water mark per (competitor, source, alias), persisted in
+# state_store: {"Firecrawl|hackernews|firecrawl": {"since": <unix ts>,
+# "empty": <consecutive empty runs>, "skip_until": "YYYY-MM-DD", "updated": ...}}.
+# A collector asks only for items newer than `since` (Nimble start_date, HN
+# numericFilters, GitHub pushed:>/created:>), so HN and GitHub stop re-fetching
+# yesterday's items and a missed run is caught up instead of lost. A source
+# that comes back empty BACKOFF_AFTER_EMPTY runs in a row is skipped for
+# 1, 2, 4... days (capped at MAX_BACKOFF_DAYS); the next fetch still starts
+# at its cursor, so nothing published meanwhile is missed.
+# Updates are staged during collection and only written by save_state when
+# synthesis succeeded — same rule as seen_urls, so a failed run is re-fetched.
+
+CURSOR_LOOKBACK_DAYS = 7     # never ask further back than this (first run / long gaps)
+BACKOFF_AFTER_EMPTY  = 3
+MAX_BACKOFF_DAYS     = 4     # < CURSOR_LOOKBACK_DAYS so a backed-off source can catch up
+DAY_LAG  = 86400             # day-granular filters (Nimble dates): re-ask from yesterday
+HOUR_LAG = 3600              # timestamp filters (HN, GitHub): allow for indexing delay
+
+_CURSORS: dict = {}          # loaded by load_state
+_CURSOR_UPDATES: dict = {}   # staged by collectors, persisted by save_state
+_CURSOR_LOCK = threading.Lock()
+
+
+def _day(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _iso(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _incremental(c: str, source: str, alias: str, fetch, lag: int = DAY_LAG) -> list:
+    """Run fetch(since_ts) from this source's cursor, then stage the advanced cursor.
+
+    fetch must raise on failure (not return []). The error propagates to _timed,
+    which counts it, before the cursor is staged, so the cursor never moves.
+    """
+    key = f"{c}|{source}|{alias}"
+    cur = _CURSORS.get(key, {})
+    if cur.get("skip_until", "") > TODAY:
+        return []
+    floor = int((NOW - timedelta(days=CURSOR_LOOKBACK_DAYS)).timestamp())
+    since = max(int(cur.get("since") or SEARCH_START_TS), floor)
+    items = fetch(since)
+
+    empty = 0 if items else int(cur.get("empty", 0)) + 1
+    update = {"since": max(since, int(NOW.timestamp()) - lag), "empty": empty, "updated": TODAY}
+    if empty >= BACKOFF_AFTER_EMPTY:
+        days = min(2 ** (empty - BACKOFF_AFTER_EMPTY), MAX_BACKOFF_DAYS)
+        update["skip_until"] = (NOW + timedelta(days=days)).strftime("%Y-%m-%d")
+    with _CURSOR_LOCK:
+        _CURSOR_UPDATES[key] = update
+    return items
+
 
-def _reddit(c, aliases):
+# ─── Per-source collectors (one task per competitor × source × alias) ───────
+
+def _reddit(c, a):
     """All Reddit mentions — any subreddit, any thread."""
-    out = []
-    for a in aliases:
-        out += _to_results(
-            nimble_search(f'"{a}" site:reddit.com', focus="social"), c, "Reddit")
-    return out
+    return _incremental(c, "reddit", a, lambda since: _to_results(
+        nimble_search(f'"{a}" site:reddit.com', focus="social",
+                      start_date=_day(since), strict=True), c, "Reddit"))
 
 
-def _twitter(c, aliases):
+def _twitter(c, a):
     """All Twitter/X mentions — not just their own account."""
-    out = []
-    for a in aliases:
-        out += _to_results(
-            nimble_search(f'"{a}" (site:twitter.com OR site:x.com)', focus="social"), c, "Twitter/X")
-    return out
+    return _incremental(c, "twitter", a, lambda since: _to_results(
+        nimble_search(f'"{a}" (site:twitter.com OR site:x.com)', focus="social",
+                      start_date=_day(since), strict=True), c, "Twitter/X"))
 
 
-def _linkedin(c, aliases):
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(
-            nimble_search(f'"{a}" site:linkedin.com', focus="social"), c, "LinkedIn")
-    return out
+def _linkedin(c, a):
+    return _incremental(c, "linkedin", a, lambda since: _to_results(
+        nimble_search(f'"{a}" site:linkedin.com', focus="social",
+                      start_date=_day(since), strict=True), c, "LinkedIn"))
 
 
-def _instagram(c, aliases):
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(
-            nimble_search(f'"{a}" site:instagram.com', focus="social"), c, "Instagram")
-    return out
+def _instagram(c, a):
+    return _incremental(c, "instagram", a, lambda since: _to_results(
+        nimble_search(f'"{a}" site:instagram.com', focus="social",
+                      start_date=_day(since), strict=True), c, "Instagram"))
 
 
-def _youtube(c, aliases):
+def _youtube(c, a):
     if not IS_MWF:
         return []
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(
-            nimble_search(f'"{a}" site:youtube.com', focus="general"), c, "YouTube")
-    return out
+    return _incremental(c, "youtube", a, lambda since: _to_results(
+        nimble_search(f'"{a}" site:youtube.com', focus="general",
+                      start_date=_day(since), strict=True), c, "YouTube"))
 
 
-def _producthunt(c, aliases):
+def _producthunt(c, a):
     if not IS_MONDAY:
         return []
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(
-            nimble_search(f'"{a}" site:producthunt.com', focus="general", date_filter=False), c, "Product Hunt")
-    return out
+    return _to_results(
+        nimble_search(f'"{a}" site:producthunt.com', focus="general", date_filter=False), c, "Product Hunt")
 
 
-def _blogs(c, aliases):
+def _blogs(c, a):
     """Official blog + general blog/announcement coverage."""
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(
-            nimble_search(f'"{a}" (blog OR announcement OR launch OR "new feature" OR release)',
-                          focus="general"), c, "Blog")
-    return out
+    return _incremental(c, "blogs", a, lambda since: _to_results(
+        nimble_search(f'"{a}" (blog OR announcement OR launch OR "new feature" OR release)',
+                      focus="general", start_date=_day(since), strict=True), c, "Blog"))
 
 
-def _news(c, aliases):
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(nimble_search(f'"{a}"', focus="news"), c, "News")
-    return out
+def _news(c, a):
+    return _incremental(c, "news", a, lambda since: _to_results(
+        nimble_search(f'"{a}"', focus="news", start_date=_day(since), strict=True), c, "News"))
 
 
-def _medium_devto(c, aliases):
+def _medium_devto(c, a):
     """Medium, Dev.to, Substack, and other developer writing."""
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(
-            nimble_search(f'"{a}" (site:medium.com OR site:dev.to OR site:substack.com)',
-                          focus="coding"), c, "Dev Writing")
-    return out
+    return _incremental(c, "dev_writing", a, lambda since: _to_results(
+        nimble_search(f'"{a}" (site:medium.com OR site:dev.to OR site:substack.com)',
+                      focus="coding", start_date=_day(since), strict=True), c, "Dev Writing"))
 
 
-def _coding(c, aliases):
+def _coding(c, a):
     """GitHub discussions, Stack Overflow, coding forums."""
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(nimble_search(f'"{a}"', focus="coding"), c, "Dev")
-    return out
+    return _incremental(c, "coding", a, lambda since: _to_results(
+        nimble_search(f'"{a}"', focus="coding", start_date=_day(since), strict=True), c, "Dev"))
 
 
-def _hackernews(c, aliases):
-    out = []
-    for a in aliases:
-        try:
-            resp = requests.get(
-                "https://hn.algolia.com/api/v1/search",
-                params={"query": a, "tags": "(story,comment)",
-                        "numericFilters": f"created_at_i>{SEARCH_START_TS}", "hitsPerPage": 8},
-                timeout=15,
-            )
-            resp.raise_for_status()
-            for h in resp.json().get("hits", []):
-                title = h.get("title") or (h.get("comment_text") or "")[:150]
-                ts = h.get("created_at_i")
-                hn_date = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d") if ts else ""
-                out.append({"competitor": c, "platform": "Hacker News",
-                            "url": f"https://news.ycombinator.com/item?id={h.get('objectID', '')}",
-                            "title": title,
-                            "snippet": f"Points: {h.get('points', 0)}, Comments: {h.get('num_comments', 0)}",
-                            "event_date": hn_date})
-        except Exception as e:
-            print(f"  [HN error] {a}: {e}")
-    return out
+def _hackernews(c, a):
+    def fetch(since):
+        resp = _request(
+            "hn", "GET", "https://hn.algolia.com/api/v1/search",
+            params={"query": a, "tags": "(story,comment)",
+                    "numericFilters": f"created_at_i>{since}", "hitsPerPage": 8},
+            timeout=15,
+        )
+        resp.raise_for_status()
+        out = []
+        for h in resp.json().get("hits", []):
+            title = h.get("title") or (h.get("comment_text") or "")[:150]
+            ts = h.get("created_at_i")
+            hn_date = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d") if ts else ""
+            out.append({"competitor": c, "platform": "Hacker News",
+                        "url": f"https://news.ycombinator.com/item?id={h.get('objectID', '')}",
+                        "title": title,
+                        "snippet": f"Points: {h.get('points', 0)}, Comments: {h.get('num_comments', 0)}",
+                        "event_date": hn_date})
+        return out
+
+    return _incremental(c, "hackernews", a, fetch, lag=HOUR_LAG)
+
+
+def _github_headers() -> dict:
+    return {"Authorization": f"Bearer {GITHUB_TOKEN}", "Accept": "application/vnd.github.v3+json"}
 
 
-def _github(c, aliases):
+def _github(c, a):
     if not GITHUB_TOKEN:
         return []
-    out = []
-    headers = {"Authorization": f"Bearer {GITHUB_TOKEN}", "Accept": "application/vnd.github.v3+json"}
-    for a in aliases[:1]:
-        try:
-            r = requests.get("https://api.github.com/search/repositories",
-                             params={"q": f'"{a}" pushed:>{SEARCH_START}', "sort": "updated", "per_page": 5},
-                             headers=headers, timeout=15)
-            if r.ok:
-                for item in r.json().get("items", []):
-                    out.append({"competitor": c, "platform": "GitHub", "url": item["html_url"],
-                                "title": item["full_name"], "snippet": (item.get("description") or "")[:200],
-                                "event_date": _parse_date(item.get("pushed_at", ""))})
-            r = requests.get("https://api.github.com/search/issues",
-                             params={"q": f'"{a}" created:>{SEARCH_START}', "sort": "created", "per_page": 5},
-                             headers=headers, timeout=15)
-            if r.ok:
-                for item in r.json().get("items", []):
-                    out.append({"competitor": c, "platform": "GitHub", "url": item["html_url"],
-                                "title": item["title"], "snippet": (item.get("body") or "")[:200],
-                                "event_date": _parse_date(item.get("created_at", ""))})
-        except Exception as e:
-            print(f"  [GitHub error] {a}: {e}")
-    return out
+
+    def fetch(since):
+        r = _request("github", "GET", "https://api.github.com/search/repositories", limit="github_search",
+                     params={"q": f'"{a}" pushed:>{_iso(since)}', "sort": "updated", "per_page": 5},
+                     headers=_github_headers(), timeout=15)
+        r.raise_for_status()
+        return [{"competitor": c, "platform": "GitHub", "url": item["html_url"],
+                 "title": item["full_name"], "snippet": (item.get("description") or "")[:200],
+                 "event_date": _parse_date(item.get("pushed_at", ""))}
+                for item in r.json().get("items", [])]
+
+    return _incremental(c, "github", a, fetch, lag=HOUR_LAG)
+
+
+def _github_issues(c, a):
+    """Issues and PRs mentioning the competitor — its own task and cursor, so a
+    failure here doesn't drop the repository results."""
+    if not GITHUB_TOKEN:
+        return []
+
+    def fetch(since):
+        r = _request("github", "GET", "https://api.github.com/search/issues", limit="github_search",
+                     params={"q": f'"{a}" created:>{_iso(since)}', "sort": "created", "per_page": 5},
+                     headers=_github_headers(), timeout=15)
+        r.raise_for_status()
+        return [{"competitor": c, "platform": "GitHub", "url": item["html_url"],
+                 "title": item["title"], "snippet": (item.get("body") or "")[:200],
+                 "event_date": _parse_date(item.get("created_at", ""))}
+                for item in r.json().get("items", [])]
+
+    return _incremental(c, "github_issues", a, fetch, lag=HOUR_LAG)
 
 
-def _github_releases(c, aliases):
+def _github_releases(c, a):
     """Official repo release notes — high-signal product launch indicator."""
     if not GITHUB_TOKEN:
         return []
-    out = []
-    headers = {"Authorization": f"Bearer {GITHUB_TOKEN}", "Accept": "application/vnd.github.v3+json"}
-    for a in aliases[:1]:
-        try:
-            r = requests.get("https://api.github.com/search/repositories",
-                             params={"q": f'"{a}" in:name,description', "sort": "stars", "per_page": 3},
-                             headers=headers, timeout=15)
-            if not r.ok:
+
+    def fetch(since):
+        out = []
+        r = _request("github", "GET", "https://api.github.com/search/repositories", limit="github_search",
+                     params={"q": f'"{a}" in:name,description', "sort": "stars", "per_page": 3},
+                     headers=_github_headers(), timeout=15)
+        r.raise_for_status()
+        for repo in r.json().get("items", []):
+            full_name = repo["full_name"]
+            rel = _request("github", "GET", f"https://api.github.com/repos/{full_name}/releases",
+                           params={"per_page": 3}, headers=_github_headers(), timeout=15)
+            if not rel.ok:
                 continue
-            for repo in r.json().get("items", []):
-                full_name = repo["full_name"]
-                rel = requests.get(f"https://api.github.com/repos/{full_name}/releases",
-                                   params={"per_page": 3}, headers=headers, timeout=15)
-                if not rel.ok:
-                    continue
-                for release in rel.json():
-                    published = release.get("published_at", "")[:10]
-                    if published >= SEARCH_START:
-                        body = (release.get("body") or "")[:300]
-                        out.append({"competitor": c, "platform": "GitHub Releases",
-                                    "url": release["html_url"],
-                                    "title": f"{full_name} — {release.get('name') or release.get('tag_name', '')}",
-                                    "snippet": body, "event_date": published})
-        except Exception as e:
-            print(f"  [GitHub releases error] {a}: {e}")
-    return out
+            for release in rel.json():
+                published_at = release.get("published_at") or ""
+                if published_at > _iso(since):
+                    body = (release.get("body") or "")[:300]
+                    out.append({"competitor": c, "platform": "GitHub Releases",
+                                "url": release["html_url"],
+                                "title": f"{full_name} — {release.get('name') or release.get('tag_name', '')}",
+                                "snippet": body, "event_date": published_at[:10]})
+        return out
+
+    return _incremental(c, "github_releases", a, fetch, lag=HOUR_LAG)
 
 
-def _g2_capterra(c, aliases):
+def _g2_capterra(c, a):
     """G2 and Capterra reviews — direct customer sentiment signal."""
     if not IS_MONDAY:
         return []
-    out = []
-    for a in aliases[:1]:
-        out += _to_results(
-            nimble_search(f'"{a}" (site:g2.com OR site:capterra.com OR site:trustpilot.com)',
-                          focus="general", date_filter=False), c, "Reviews")
-    return out
+    return _to_results(
+        nimble_search(f'"{a}" (site:g2.com OR site:capterra.com OR site:trustpilot.com)',
+                      focus="general", date_filter=False), c, "Reviews")
 
 
-def _positioning(c, aliases):
-    """Competitor messaging changes and direct comparisons."""
-    out = []
-    for a in aliases[:1]:
-        # Direct comparisons to your company — no date filter, these persist on the web
-        out += _to_results(
-            nimble_search(
-                f'"{a}" ("vs {YOUR_COMPANY}" OR "vs {YOUR_COMPANY_ALIASES[0] if YOUR_COMPANY_ALIASES else YOUR_COMPANY}" OR "{YOUR_COMPANY} alternative" OR "compared to {YOUR_COMPANY}")',
-                focus="general", date_filter=False), c, "Positioning")
-        # Pitch/messaging changes this week
-        out += _to_results(
-            nimble_search(
-                f'"{a}" (rebrand OR "new positioning" OR "value proposition" OR "use case" OR "how it works")',
-                focus="general"), c, "Positioning")
-    return out
+def _comparisons(c, a):
+    """Direct comparisons to your company — no date filter, these persist on the web."""
+    return _to_results(
+        nimble_search(
+            f'"{a}" ("vs {YOUR_COMPANY}" OR "vs {YOUR_COMPANY_ALIASES[0] if YOUR_COMPANY_ALIASES else YOUR_COMPANY}" OR "{YOUR_COMPANY} alternative" OR "compared to {YOUR_COMPANY}")',
+            focus="general", date_filter=False), c, "Positioning")
+
+
+def _positioning(c, a):
+    """Competitor pitch/messaging changes since the last run."""
+    return _incremental(c, "positioning", a, lambda since: _to_results(
+        nimble_search(
+            f'"{a}" (rebrand OR "new positioning" OR "value proposition" OR "use case" OR "how it works")',
+            focus="general", start_date=_day(since), strict=True), c, "Positioning"))
 
 
+# (collector, lane it calls, how many aliases it searches — None = all of them)
 SOURCE_FNS = [
-    _reddit, _twitter, _linkedin,
-    _youtube, _producthunt, _blogs, _news,
-    _medium_devto, _coding, _hackernews, _github,
-    _github_releases, _g2_capterra, _positioning,
+    (_reddit, "nimble", None), (_twitter, "nimble", None), (_linkedin, "nimble", 1),
+    (_youtube, "nimble", 1), (_producthunt, "nimble", 1), (_blogs, "nimble", 1), (_news, "nimble", 1),
+    (_medium_devto, "nimble", 1), (_coding, "nimble", 1), (_hackernews, "hn", None), (_github, "github", 1),
+    (_github_issues, "github", 1), (_github_releases, "github", 1), (_g2_capterra, "nimble", 1),
+    (_comparisons, "nimble", 1), (_positioning, "nimble", 1),
 ]
 
 
 # ─── LangGraph nodes ─────────────────────────────────────────────────────────
 
 def load_state(state: AgentState) -> dict:
-    urls_raw = _load_json(SEEN_URLS_FILE)
-    ctx_raw = _load_json(SEEN_CONTEXT_FILE)
-    seen_urls = _prune_by_date(urls_raw.get("entries", urls_raw), 30, by_value=True)
-    seen_context = _prune_by_date(ctx_raw, 30)
-    print(f"State loaded: {len(seen_urls)} known URLs, {len(seen_context)} days of context")
-    return {"seen_urls": seen_urls, "seen_context": seen_context}
+    cutoff = (NOW - timedelta(days=STATE_RETENTION_DAYS)).strftime("%Y-%m-%d")
+    n_urls, seen_context, cursors = state_store.load()
+    seen_context = {d: v for d, v in seen_context.items() if d >= cutoff}
+    _CURSORS.clear()
+    _CURSORS.update(cursors)
+    _CURSOR_UPDATES.clear()
+    backed_off = sum(1 for cur in _CURSORS.values() if cur.get("skip_until", "") > TODAY)
+    print(f"State loaded: {n_urls} known URLs, {len(seen_context)} days of context, "
+          f"{len(_CURSORS)} source cursors ({backed_off} backed off)")
+    return {"seen_context": seen_context}
 
 
 def route_collectors(state: AgentState):
@@ -384,37 +521,160 @@ def route_collectors(state: AgentState):
 
 
 def collect_competitor(state: AgentState) -> dict:
-    """Collect all sources for one competitor. Sources run in parallel via ThreadPoolExecutor."""
+    """Collect all sources for one competitor. Each source × alias is a task on the
+    shared per-host lanes, so every competitor node's tasks interleave fairly."""
     competitor = state["current_competitor"]
     aliases = state["current_aliases"]
     print(f"  Collecting: {competitor}...")
     results = []
-    with ThreadPoolExecutor(max_workers=4) as pool:
-        futures = [pool.submit(fn, competitor, aliases) for fn in SOURCE_FNS]
-        for future in futures:
-            try:
-                results += future.result()
-            except Exception as e:
-                print(f"  [Collect error] {competitor}: {e}")
+    futures = [
+        _LANES[lane].pool.submit(_timed, fn.__name__.lstrip("_"), fn, competitor, a)
+        for fn, lane, n in SOURCE_FNS
+        for a in aliases[:n]
+    ]
+    for future in futures:
+        results += future.result()
     print(f"  {competitor}: {len(results)} raw results")
     return {"raw_results": results}
 
 
+# ─── Near-duplicate story clustering ─────────────────────────────────────────
+# The same story syndicated across Reddit, HN, news and blogs arrives as several
+# items with different URLs. Items of one competitor are clustered on the word
+# sets of title + snippet (stopwords, alias words and HN point counts removed):
+# exact Jaccard at this size — a few hundred items per competitor — is what
+# MinHash would only estimate. Each cluster is sent to synthesis once, as its
+# best representative with a `mentions` count and the platforms it was seen on.
+
+NEAR_DUP_JACCARD = 0.5       # title + snippet word sets
+NEAR_DUP_TITLE_OVERLAP = 0.8 # |A∩B| / min(|A|,|B|) of title words (≥ 4 words each)
+TOPIC_MATCH = 0.6            # share of a reported topic's slug words found in a cluster
+
+_STOPWORDS = set("""a an and are as at be by for from has have how in into is it its new of on or
+our that the their this to was we what when why will with you your vs via about after over
+just now more than out up points comments""".split())
+# Representative preference: primary sources over reshares.
+_PLATFORM_RANK = {"News": 3, "Blog": 3, "GitHub Releases": 3, "Product Hunt": 2, "GitHub": 2,
+                  "Hacker News": 2, "Dev Writing": 2}
+
+
+def _words(text: str, drop: set) -> set:
+    out = set()
+    for w in re.findall(r"[a-z0-9$][a-z0-9$.+-]*", text.lower()):
+        w = w.strip(".-")
+        if w and not w.isdigit() and w not in _STOPWORDS and w not in drop:
+            out.add(w)
+    return out
+
+
+def _alias_words(competitor: str) -> set:
+    return {w for a in COMPETITOR_ALIASES.get(competitor, [competitor]) for w in re.findall(r"[a-z0-9]+", a.lower())}
+
+
+def _near_duplicate(a: dict, b: dict) -> bool:
+    union = a["words"] | b["words"]
+    if union and len(a["words"] & b["words"]) / len(union) >= NEAR_DUP_JACCARD:
+        return True
+    ta, tb = a["title_words"], b["title_words"]
+    if len(ta) >= 4 and len(tb) >= 4:
+        return len(ta & tb) / min(len(ta), len(tb)) >= NEAR_DUP_TITLE_OVERLAP
+    return False
+
+
+def _reported_topics(seen_context: dict) -> list:
+    """[(competitor or "", slug words, topic)] for the last 7 days of reported topics."""
+    out = []
+    for date in sorted(seen_context.keys(), reverse=True)[:7]:
+        day = seen_context[date]
+        for topic in (day["topics"] if isinstance(day, dict) else day):
+            parts = str(topic).split(":")
+            if len(parts) >= 3:  # "{Competitor}:{Category}:{slug}"
+                comp, slug = parts[0].strip(), " ".join(parts[2:])
+            else:  # older free-text topics: find the competitor by its alias words
+                slug = str(topic)
+                raw = _words(slug, set())
+                comp = next((c for c in COMPETITOR_ALIASES if _alias_words(c) & raw), "")
+            words = _words(slug.replace("-", " "), _alias_words(comp) if comp else set())
+            if len(words) >= 2:
+                out.append((comp, words, topic))
+    return out
+
+
+def cluster_stories(items: list, seen_context: dict) -> list:
+    """Collapse near-duplicate items per competitor into one representative each.
+
+    The representative gets `mentions` (cluster size), `platforms`, and
+    `duplicate_urls` (kept out of the prompt; save_state marks them seen), and
+    `previously_reported` when the cluster matches a topic from seen_context.
+    New stories come first, then by mentions, so the per-competitor synthesis
+    cap is spent on distinct, unreported stories.
+    """
+    topics = _reported_topics(seen_context)
+    by_comp: dict = {}
+    for r in items:
+        by_comp.setdefault(r.get("competitor", ""), []).append(r)
+
+    out = []
+    for comp, group in by_comp.items():
+        drop = _alias_words(comp)
+        feats = []
+        for r in group:
+            snippet = "" if r.get("platform") == "Hacker News" else r.get("snippet", "")
+            title_words = _words(r.get("title", ""), drop)
+            feats.append({"title_words": title_words, "words": title_words | _words(snippet, drop)})
+
+        parent = list(range(len(group)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i in range(len(group)):
+            for j in range(i + 1, len(group)):
+                if find(i) != find(j) and _near_duplicate(feats[i], feats[j]):
+                    parent[find(j)] = find(i)
+
+        clusters: dict = {}
+        for i in range(len(group)):
+            clusters.setdefault(find(i), []).append(i)
+        for members in clusters.values():
+            best = max(members, key=lambda i: (_PLATFORM_RANK.get(group[i].get("platform"), 1),
+                                               bool(group[i].get("event_date")),
+                                               len(group[i].get("title", "")) + len(group[i].get("snippet", ""))))
+            rep = dict(group[best])
+            rep["mentions"] = len(members)
+            rep["platforms"] = sorted({group[i].get("platform", "") for i in members})
+            rep["duplicate_urls"] = [group[i]["url"] for i in members if i != best]
+            words = set().union(*(feats[i]["words"] for i in members))
+            for t_comp, t_words, topic in topics:
+                if (not t_comp or t_comp.lower() == comp.lower()) and \
+                        len(t_words & words) / len(t_words) >= TOPIC_MATCH:
+                    rep["previously_reported"] = topic
+                    break
+            out.append(rep)
+
+    out.sort(key=lambda r: ("previously_reported" in r, -r["mentions"]))
+    return out
+
+
 def deduplicate(state: AgentState) -> dict:
-    """Remove exact URL duplicates (within-run and against history).
+    """Remove exact URL duplicates (within-run and against history), then
+    collapse near-duplicate stories (see cluster_stories).
 
     Only filters URLs seen more than 2 days ago. URLs within the search window
     pass through to Claude, which uses seen_context topic slugs to avoid
     re-reporting already-covered stories. This prevents the search window
     overlapping with the dedup window and producing zero fresh results.
     """
-    seen_urls = state.get("seen_urls", {})
+    _print_timings()
     raw = state.get("raw_results", [])
 
     # URLs seen before the search window are stale — filter them out.
     # URLs seen in the last 2 days pass through to Claude's semantic dedup.
     cutoff = (NOW - timedelta(days=2)).strftime("%Y-%m-%d")
-    old_seen = {url for url, d in seen_urls.items() if d < cutoff}
+    old_seen = state_store.seen_before([r.get("url", "") for r in raw], cutoff)
 
     seen_in_run: set = set()
     unique = []
@@ -425,8 +685,11 @@ def deduplicate(state: AgentState) -> dict:
             unique.append(r)
 
     fresh = [r for r in unique if r.get("url", "") not in old_seen]
-    print(f"Dedup: {len(raw)} raw → {len(unique)} unique → {len(fresh)} passed to synthesis")
-    return {"fresh_results": fresh}
+    stories = cluster_stories(fresh, state.get("seen_context", {}))
+    reported = sum(1 for r in stories if "previously_reported" in r)
+    print(f"Dedup: {len(raw)} raw → {len(unique)} unique → {len(fresh)} fresh → "
+          f"{len(stories)} stories ({reported} match reported topics) passed to synthesis")
+    return {"fresh_results": stories}
 
 
 def synthesize(state: AgentState) -> dict:
@@ -465,8 +728,8 @@ def synthesize(state: AgentState) -> dict:
             for p in exhausted:
                 del iterators[p]
         capped.extend(selected)
-    fresh = capped
-    print(f"Synthesis input: {len(fresh)} items (40/competitor, platform-diverse)")
+    fresh = [{k: v for k, v in r.items() if k != "duplicate_urls"} for r in capped]
+    print(f"Synthesis input: {len(fresh)} stories (40/competitor, platform-diverse)")
 
     history_lines = []
     overview_lines = []
@@ -509,7 +772,7 @@ These do NOT count as meaningfully updated — skip them:
 When in doubt, skip it. It is better to under-report than to repeat the same story.
 
 INSTRUCTIONS:
-1. Skip noise, duplicate stories, and anything not from the past 2 days.
+1. Skip noise, duplicate stories, and anything not from the past 2 days. Near-duplicate items are already merged: "mentions" is how many items (on the listed "platforms") carried the story — a rough reach signal — and "previously_reported" names a topic from the list above it appears to repeat (skip it unless meaningfully updated).
 2. For each finding, write a summary in 2 parts separated by a period: (a) 1 sentence on what happened — factual, under 120 characters; (b) 1-2 sentences explaining why this is good or bad for {YOUR_COMPANY} specifically — what competitive advantage or threat does it create, what does it mean for {YOUR_COMPANY}'s market position. Keep part (b) under 220 characters. Be direct and specific, no padding.
 3. Sentiment reflects how the news reflects on the company being reported on (not Nimble's perspective):
    - "positive": good news for that company — funding, launches, growth, praise, partnerships
@@ -885,7 +1148,46 @@ def _prev_delivery_date(selected_days: list, reference_date: datetime) -> str:
     return (reference_date - timedelta(days=7)).strftime("%Y-%m-%d")
 
 
+DM_WORKERS = 8         # concurrent chat.postMessage calls
+DM_MAX_RETRIES = 3     # per DM, on Slack 429s (each waits the Retry-After it was given)
+
+# When Slack returns 429, every DM worker holds off until this monotonic time:
+# the limit is per workspace + method, so retrying other users early only earns more 429s.
+_SLACK_PAUSE = {"until": 0.0}
+_SLACK_PAUSE_LOCK = threading.Lock()
+
+
+def _post_dm(user_id: str, blocks: list, text: str) -> float:
+    """chat.postMessage to one user, honouring Retry-After. Returns seconds taken; raises on failure."""
+    started = time.monotonic()
+    for attempt in range(DM_MAX_RETRIES + 1):
+        with _SLACK_PAUSE_LOCK:
+            wait = _SLACK_PAUSE["until"] - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            slack_client.chat_postMessage(channel=user_id, blocks=blocks, text=text,
+                                          unfurl_links=False, unfurl_media=False)
+            return time.monotonic() - started
+        except SlackApiError as e:
+            if e.response.status_code != 429 or attempt == DM_MAX_RETRIES:
+                raise
+            retry_after = float(e.response.headers.get("Retry-After", 1))
+            with _SLACK_PAUSE_LOCK:
+                _SLACK_PAUSE["until"] = max(_SLACK_PAUSE["until"], time.monotonic() + retry_after)
+            print(f"[DMs] Slack rate-limited — pausing sends {retry_after:.0f}s")
+    raise RuntimeError("unreachable")
+
+
 def send_personalized_dms(state: AgentState) -> dict:
+    """DM each subscriber their filtered digest.
+
+    Findings are indexed by category once; the digest body is rendered once per
+    distinct (team, format, categories, include_nimble) and shared by every user
+    with those preferences (only the greeting differs); DMs go out through a
+    bounded pool that pauses on Slack's Retry-After. Reports delivered /
+    no-activity / skipped / failed counts and p50/p95 send latency.
+    """
     if not SLACK_TOKEN:
         return {}
     try:
@@ -906,112 +1208,133 @@ def send_personalized_dms(state: AgentState) -> dict:
     signal      = synthesis.get("signal_of_week")
     overview    = synthesis.get("overview", "")
     today_name  = NOW.strftime("%A").lower()
+    date_range  = TODAY
 
-    sent = 0
     TRACKED = set(COMPETITOR_ALIASES.keys()) - {YOUR_COMPANY}
 
+    # ── Category index, built once ───────────────────────────────────────────
+    tracked_fnd = [f for f in todays_fnd if f.get("competitor") in TRACKED]
+    by_category: dict = {}
+    for i, f in enumerate(tracked_fnd):
+        by_category.setdefault(f.get("category"), []).append(i)
+
+    bodies: dict = {}   # preference key -> (blocks without greeting, n findings) or None (no activity)
+
+    def body_for(team: str, brief: bool, cats: frozenset, include_nimble: bool):
+        key = (team, brief, cats, include_nimble)
+        if key not in bodies:
+            if cats:
+                filtered = [tracked_fnd[i] for i in sorted(j for c in cats for j in by_category.get(c, []))]
+            else:
+                filtered = tracked_fnd
+            filtered_nim = todays_nim if include_nimble else []
+            filtered_pos = todays_pos if not cats or "Positioning" in cats else []
+            if not filtered and not filtered_nim and not filtered_pos:
+                bodies[key] = None
+            else:
+                blocks = _build_dm_blocks(
+                    name="", team=team, overview=overview, signal=signal,
+                    findings=filtered, nimble_findings=filtered_nim,
+                    positioning_alerts=filtered_pos, brief=brief,
+                    date_range=date_range,
+                )
+                bodies[key] = (blocks, len(filtered))
+        return bodies[key]
+
+    no_activity_blocks = [
+        {"type": "section", "text": {"type": "mrkdwn",
+            "text": f"*Competitor Digest — {date_range}*\n\nNo significant competitor activity found in your categories for this period."}},
+    ]
+
+    # ── Plan every DM up front (cheap), then send concurrently ───────────────
+    jobs = []       # (user_id, blocks, text, is_digest, label)
+    skipped = 0
     for user_id, prefs in all_prefs.items():
         selected_days = prefs.get("days", [])
         if selected_days and today_name not in selected_days:
+            skipped += 1
             continue
-
-        name           = prefs.get("name", "")
-        team           = prefs.get("team", "")
-        selected_cats  = set(prefs.get("categories", []))
-        include_nimble = prefs.get("include_nimble", True)
-        brief          = prefs.get("format", "detailed") == "brief"
-
-        # Use today's synthesis directly
-        combined_fnd = todays_fnd
-        combined_nim = todays_nim
-        combined_pos = todays_pos
-        date_range   = TODAY
-
-        # ── Filter to user's preferences ─────────────────────────────────────
-        filtered = [f for f in combined_fnd
-                    if f.get("competitor") in TRACKED
-                    and (not selected_cats or f.get("category") in selected_cats)]
-        filtered_nim = combined_nim if include_nimble else []
-        filtered_pos = (combined_pos
-                        if not selected_cats or "Positioning" in selected_cats
-                        else [])
-
-        if not filtered and not filtered_nim and not filtered_pos:
-            print(f"[DMs] No relevant findings for {user_id} ({team}) — sending no-activity notice")
-            no_activity_blocks = [
-                {"type": "section", "text": {"type": "mrkdwn",
-                    "text": f"*Competitor Digest — {date_range}*\n\nNo significant competitor activity found in your categories for this period."}},
-            ]
+        name  = prefs.get("name", "")
+        team  = prefs.get("team", "")
+        body  = body_for(team, prefs.get("format", "detailed") == "brief",
+                         frozenset(prefs.get("categories", [])), prefs.get("include_nimble", True))
+        if body is None:
+            jobs.append((user_id, no_activity_blocks,
+                         f"Competitor Digest — {date_range}: No significant activity found.",
+                         False, f"{team}, no activity"))
+            continue
+        blocks, n_findings = body
+        if name:
+            blocks = (blocks[:1] + [{"type": "section", "text": {"type": "mrkdwn", "text": f"Hi {name} 👋"}}]
+                      + blocks[1:])[:49]
+        jobs.append((user_id, blocks, f"Your competitor digest — {date_range}",
+                     True, f"{team}, {date_range}, {n_findings} findings"))
+
+    delivered, notices, failed, latencies = [], 0, 0, []
+
+    def send(job):
+        user_id, blocks, text, _, _ = job
+        return _post_dm(user_id, blocks, text)
+
+    with ThreadPoolExecutor(max_workers=DM_WORKERS, thread_name_prefix="slack-dm") as pool:
+        futures = [(job, pool.submit(send, job)) for job in jobs]
+        for (user_id, _, _, is_digest, label), future in futures:
             try:
-                slack_client.chat_postMessage(
-                    channel=user_id, blocks=no_activity_blocks,
-                    text=f"Competitor Digest — {date_range}: No significant activity found.",
-                    unfurl_links=False, unfurl_media=False,
-                )
+                latencies.append(future.result())
+            except SlackApiError as e:
+                failed += 1
+                print(f"[DMs] Slack error for {user_id}: {e.response['error']}")
+                continue
             except Exception as e:
-                print(f"[DMs] No-activity notice error for {user_id}: {e}")
-            continue
-
-        blocks = _build_dm_blocks(
-            name=name, team=team, overview=overview, signal=signal,
-            findings=filtered, nimble_findings=filtered_nim,
-            positioning_alerts=filtered_pos, brief=brief,
-            date_range=date_range,
-        )
-
-        delivery_ok = False
-
-        # ── Slack DM ─────────────────────────────────────────────────────────
-        try:
-            slack_client.chat_postMessage(
-                channel=user_id, blocks=blocks,
-                text=f"Your competitor digest — {date_range}",
-                unfurl_links=False, unfurl_media=False,
-            )
-            delivery_ok = True
-            print(f"[DMs] Slack → {user_id} ({team}, {date_range}, {len(filtered)} findings)")
-        except SlackApiError as e:
-            print(f"[DMs] Slack error for {user_id}: {e.response['error']}")
-        except Exception as e:
-            print(f"[DMs] Slack error for {user_id}: {type(e).__name__}: {e}")
-
-        if delivery_ok:
-            sent += 1
-            prefs["last_sent"] = TODAY
-            save_prefs(user_id, prefs)
-
-    print(f"[DMs] Sent {sent}/{len(all_prefs)} personalized digests")
+                failed += 1
+                print(f"[DMs] Slack error for {user_id}: {type(e).__name__}: {e}")
+                continue
+            if is_digest:
+                delivered.append(user_id)
+                print(f"[DMs] Slack → {user_id} ({label})")
+            else:
+                notices += 1
+
+    # Prefs file writes stay on this thread (save_prefs rewrites the whole file).
+    for user_id in delivered:
+        prefs = all_prefs[user_id]
+        prefs["last_sent"] = TODAY
+        save_prefs(user_id, prefs)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] if latencies else 0.0
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] if latencies else 0.0
+    print(f"[DMs] Sent {len(delivered)}/{len(all_prefs)} personalized digests — "
+          f"{notices} no-activity, {skipped} skipped (not their day), {failed} failed; "
+          f"{len(bodies)} distinct bodies; send p50 {p50:.2f}s p95 {p95:.2f}s")
     return {}
 
 
 def save_state(state: AgentState) -> dict:
     fresh = state.get("fresh_results", [])
-    seen_urls = dict(state.get("seen_urls", {}))
-    seen_context = dict(state.get("seen_context", {}))
     synthesis = state.get("synthesis", {})
     synthesis_ok = synthesis.get("synthesis_ok", True)
 
+    urls, context, cursors = [], None, {}
     if synthesis_ok:
         for r in fresh:
-            url = r.get("url", "")
-            if url:
-                seen_urls[url] = TODAY
-        for r in synthesis.get("nimble_findings", []):
-            url = r.get("url", "")
-            if url:
-                seen_urls[url] = TODAY
+            urls += [r.get("url", "")] + r.get("duplicate_urls", [])
+        urls += [r.get("url", "") for r in synthesis.get("nimble_findings", [])]
+        new_topics = synthesis.get("topics", [])
+        new_overview = synthesis.get("overview", "")
+        if new_topics or new_overview:
+            context = {"topics": new_topics, "overview": new_overview}
+        # Cursors only advance once the items they skip past have been synthesized.
+        with _CURSOR_LOCK:
+            cursors = dict(_CURSOR_UPDATES)
     else:
         print("State: synthesis failed — skipping URL dedup update so items can be retried tomorrow")
 
-    SEEN_URLS_FILE.write_text(json.dumps({"entries": seen_urls}, indent=2))
-
-    new_topics = synthesis.get("topics", [])
-    new_overview = synthesis.get("overview", "")
-    if synthesis_ok and (new_topics or new_overview):
-        seen_context[TODAY] = {"topics": new_topics, "overview": new_overview}
-    SEEN_CONTEXT_FILE.write_text(json.dumps(seen_context, indent=2))
+    # One transaction; rows (and cursors) untouched for STATE_RETENTION_DAYS are pruned.
+    cutoff = (NOW - timedelta(days=STATE_RETENTION_DAYS)).strftime("%Y-%m-%d")
+    n_urls, n_days, n_cursors = state_store.save_run(TODAY, urls, context, cursors, cutoff)
 
-    print(f"State saved: {len(seen_urls)} URLs, {len(seen_context)} days of context")
+    print(f"State saved: {n_urls} URLs, {n_days} days of context, {n_cursors} source cursors")
     return {}
 
 
@@ -1122,7 +1445,6 @@ def main():
         "raw_results": [],
         "fresh_results": [],
         "synthesis": {},
-        "seen_urls": {},
         "seen_context": {},
         "current_competitor": "",
         "current_aliases": [],
@@ -0,0 +1,131 @@
+"""Run-to-run state for agent.py in one SQLite file (state.sqlite3).
+
+Replaces seen_urls.json / seen_context.json / source_cursors.json, which were
+parsed in full and rewritten with indent=2 every run (and left half-written
+by a crash mid-write). Rows are keyed by day, so pruning deletes whole days
+through the index, URL membership is a primary-key lookup, and everything a
+run saves lands in one transaction — a crash leaves the previous run intact.
+The JSON files are imported once, the first time the database is opened.
+"""
+import json
+import sqlite3
+from pathlib import Path
+
+STATE_DB = Path(__file__).parent / "state.sqlite3"
+_LEGACY_URLS = Path(__file__).parent / "seen_urls.json"
+_LEGACY_CONTEXT = Path(__file__).parent / "seen_context.json"
+_LEGACY_CURSORS = Path(__file__).parent / "source_cursors.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_urls (
+    url TEXT PRIMARY KEY,
+    day TEXT NOT NULL            -- YYYY-MM-DD last reported
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS seen_urls_by_day ON seen_urls (day);
+CREATE TABLE IF NOT EXISTS seen_context (
+    day      TEXT PRIMARY KEY,
+    topics   TEXT NOT NULL,      -- JSON list
+    overview TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS source_cursors (
+    key     TEXT PRIMARY KEY,    -- competitor|source|alias
+    data    TEXT NOT NULL,       -- JSON cursor
+    updated TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS source_cursors_by_updated ON source_cursors (updated);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(STATE_DB)
+    conn.executescript(_SCHEMA)
+    if conn.execute("SELECT 1 FROM meta WHERE key = 'imported_json'").fetchone() is None:
+        _import_json(conn)
+    return conn
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text()) if path.exists() else {}
+    except Exception as e:
+        print(f"[State] Failed to import {path.name}: {e} — skipping it")
+        return {}
+
+
+def _import_json(conn: sqlite3.Connection) -> None:
+    """One-time import of the pre-SQLite JSON state files (left in place)."""
+    urls = _read_json(_LEGACY_URLS)
+    urls = urls.get("entries", urls)
+    context = _read_json(_LEGACY_CONTEXT)
+    cursors = _read_json(_LEGACY_CURSORS)
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO seen_urls (url, day) VALUES (?, ?)",
+                         [(u, d) for u, d in urls.items() if isinstance(d, str)])
+        for day, entry in context.items():
+            topics = entry["topics"] if isinstance(entry, dict) else entry
+            overview = entry.get("overview", "") if isinstance(entry, dict) else ""
+            conn.execute("INSERT OR REPLACE INTO seen_context (day, topics, overview) VALUES (?, ?, ?)",
+                         (day, json.dumps(topics), overview))
+        conn.executemany("INSERT OR REPLACE INTO source_cursors (key, data, updated) VALUES (?, ?, ?)",
+                         [(k, json.dumps(v), v.get("updated", "")) for k, v in cursors.items()])
+        conn.execute("INSERT INTO meta (key, value) VALUES ('imported_json', datetime('now'))")
+    if urls or context or cursors:
+        print(f"[State] Imported {len(urls)} URLs, {len(context)} days of context, "
+              f"{len(cursors)} cursors from JSON into {STATE_DB.name}")
+
+
+def load() -> tuple:
+    """(url count, seen_context {day: {"topics", "overview"}}, cursors {key: cursor})."""
+    conn = _connect()
+    try:
+        n_urls = conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+        context = {day: {"topics": json.loads(topics), "overview": overview}
+                   for day, topics, overview in conn.execute("SELECT day, topics, overview FROM seen_context")}
+        cursors = {key: json.loads(data) for key, data in conn.execute("SELECT key, data FROM source_cursors")}
+    finally:
+        conn.close()
+    return n_urls, context, cursors
+
+
+def seen_before(urls: list, cutoff: str) -> set:
+    """The subset of `urls` last reported on a day before `cutoff` (YYYY-MM-DD)."""
+    urls = list(dict.fromkeys(u for u in urls if u))
+    found = set()
+    conn = _connect()
+    try:
+        for i in range(0, len(urls), 500):  # stay under SQLite's bound-parameter limit
+            chunk = urls[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            found.update(url for (url,) in conn.execute(
+                f"SELECT url FROM seen_urls WHERE url IN ({marks}) AND day < ?", (*chunk, cutoff)))
+    finally:
+        conn.close()
+    return found
+
+
+def save_run(today: str, urls: list, context: dict, cursors: dict, cutoff: str) -> tuple:
+    """Atomically record one run and prune everything last touched before `cutoff`.
+
+    urls are marked seen on `today`; context (None to skip) is today's
+    {"topics", "overview"}; cursors are upserted. Returns (urls, days, cursors) kept.
+    """
+    conn = _connect()
+    try:
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO seen_urls (url, day) VALUES (?, ?)",
+                             [(u, today) for u in dict.fromkeys(urls) if u])
+            if context:
+                conn.execute("INSERT OR REPLACE INTO seen_context (day, topics, overview) VALUES (?, ?, ?)",
+                             (today, json.dumps(context.get("topics", [])), context.get("overview", "")))
+            conn.executemany("INSERT OR REPLACE INTO source_cursors (key, data, updated) VALUES (?, ?, ?)",
+                             [(k, json.dumps(v), v.get("updated", today)) for k, v in cursors.items()])
+            pruned = conn.execute("DELETE FROM seen_urls WHERE day < ?", (cutoff,)).rowcount
+            pruned += conn.execute("DELETE FROM seen_context WHERE day < ?", (cutoff,)).rowcount
+            pruned += conn.execute("DELETE FROM source_cursors WHERE updated < ?", (cutoff,)).rowcount
+        if pruned:
+            conn.execute("VACUUM")  # keep the committed file small
+        return tuple(conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                     for t in ("seen_urls", "seen_context", "source_cursors"))
+    finally:
+        conn.close()
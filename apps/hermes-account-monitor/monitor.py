@@ -20,9 +20,11 @@ Usage
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
 import pathlib
+import queue
 import re
 import shutil
 import sqlite3
@@ -30,6 +32,7 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import requests
@@ -50,7 +53,16 @@ PH = {**H, "Content-Type": "application/json-patch+json"}
 USE_LIVE = os.getenv("USE_LIVE", "false").lower() == "true"
 
 EFFORT = "high"
+# Status polling. Every run in a cycle is supervised from one asyncio loop: a run's poll interval
+# starts at POLL_MIN and doubles to POLL, because a fresh run is minutes from done and polling it
+# every few seconds buys nothing. Once the first run of the cycle finishes, its duration is the
+# best guess for the rest — a run approaching it drops back to POLL_MIN, so a finished batch is
+# noticed within seconds instead of up to a full POLL later. STATUS_PER_SEC caps the status calls
+# of all runs together, so dozens of batches cannot turn tight polling into a burst.
 POLL = 20
+POLL_MIN = 4
+STATUS_PER_SEC = 2.0
+RUN_TIMEOUT = 2400
 
 # Batch size is set by COVERAGE, not speed. Measured rows returned vs the full grid:
 #   3 entities -> 100%   |   8 entities -> 62%   |   12 entities -> 10% (and claimed `high` confidence)
@@ -149,6 +161,9 @@ def log(m: str) -> None:
     print(m, flush=True)
 
 
+_SCHEMA_READY = False
+
+
 def db() -> sqlite3.Connection:
     """Confidence is stored PER SIGNAL, not per row.
 
@@ -156,8 +171,15 @@ def db() -> sqlite3.Connection:
     claims alongside 4-6 low ones on fields the agent could not cite. Collapsing that to one
     row-level value (weakest wins) discarded every good signal because an unrelated field was
     unverified. Per-field is the only honest granularity.
+
+    Schema setup runs once per process. WAL lets the digest queries read while the ledger
+    writer commits.
     """
+    global _SCHEMA_READY
     c = sqlite3.connect(DB)
+    if _SCHEMA_READY:
+        return c
+    c.execute("PRAGMA journal_mode=WAL")
     cols = ", ".join(f"{s} TEXT, {s}_key TEXT, {s}_conf TEXT, {s}_cite TEXT" for s in SIGNALS)
     c.execute(f"""CREATE TABLE IF NOT EXISTS signals(
         cycle_at TEXT, business TEXT, {cols},
@@ -172,11 +194,25 @@ def db() -> sqlite3.Connection:
     # Key on MONTH, not full date: the same fact arrives at different precision between runs
     # ("as of 2026-08-03" vs "as of August 2026"), which produced visible duplicates in the digest.
     # event_date keeps full precision for filtering; event_month is only the dedup key.
+    # headcount is the employee count parsed from a headcount_signal description at ingest, so the
+    # digest compares numbers in SQL instead of re-parsing prose for every row.
     c.execute("""CREATE TABLE IF NOT EXISTS ledger(
         business TEXT, signal TEXT, event_month TEXT, event_date TEXT, label TEXT,
         description TEXT, confidence TEXT, citation TEXT,
-        first_seen_cycle TEXT,
+        first_seen_cycle TEXT, headcount INTEGER,
         PRIMARY KEY (business, signal, event_month))""")
+    if "headcount" not in {r[1] for r in c.execute("PRAGMA table_info(ledger)")}:
+        c.execute("ALTER TABLE ledger ADD COLUMN headcount INTEGER")
+        c.executemany(
+            "UPDATE ledger SET headcount=? WHERE business=? AND signal=? AND event_month=?",
+            [(headcount_of(d), b, s, m) for b, s, m, d in c.execute(
+                "SELECT business, signal, event_month, description FROM ledger "
+                "WHERE signal='headcount_signal'").fetchall()])
+    # The primary key already indexes (business, signal, event_month) for the prior-reading window;
+    # new_since filters on event_date.
+    c.execute("CREATE INDEX IF NOT EXISTS ledger_event_date ON ledger(event_date)")
+    c.commit()
+    _SCHEMA_READY = True
     return c
 
 
@@ -269,13 +305,16 @@ def is_real_change(before: str | None, after: str | None) -> bool:
     return (inter / union if union else 1.0) < 0.6
 
 
-def ingest(res: dict, batch: list[str], cycle_at: str, rid: str) -> int:
-    """Store one run's rows. Shared by the live path and --reingest, so replays cost nothing."""
+_SIGNAL_MARKS = ",".join("?" * (2 + len(SIGNALS) * 4 + 2))
+
+
+def parse_run(res: dict, batch: list[str], cycle_at: str, rid: str) -> tuple[list[tuple], list[tuple]]:
+    """One run's (signals rows, ledger rows), ready for LedgerWriter. Pure — no database, so the
+    live path and --reingest parse off the writer thread."""
     rows, trust = _extract(res)
     ftrust = field_trust(trust)
-    conn = db()
-    n = 0
-    placeholders = ",".join("?" * (2 + len(SIGNALS) * 4 + 2))
+    signal_rows: list[tuple] = []
+    ledger_rows: list[tuple] = []
     for oi, r in enumerate(rows):
         if not isinstance(r, dict):
             continue
@@ -287,7 +326,7 @@ def ingest(res: dict, batch: list[str], cycle_at: str, rid: str) -> int:
             c, cite = ftrust.get((oi, s), (None, None))
             vals += [r.get(s), norm_key(r.get(f"{s}_key")), c, cite]
         vals += [r.get("source_url"), rid]
-        conn.execute(f"INSERT OR REPLACE INTO signals VALUES ({placeholders})", vals)
+        signal_rows.append(tuple(vals))
         for s in SIGNALS:
             desc = (r.get(s) or "").strip()
             label = norm_key(r.get(f"{s}_key"))
@@ -301,13 +340,99 @@ def ingest(res: dict, batch: list[str], cycle_at: str, rid: str) -> int:
             # is the only stable identity such an event has. Undated events stay out of the digest
             # and out of memory either way; this just keeps the ledger from losing them.
             month = date[:7] if date != "unknown" else f"unknown:{label}"
+            hc = headcount_of(desc) if s == "headcount_signal" else None
+            ledger_rows.append((key, s, month, date, label, desc, c, cite, cycle_at, hc))
+    return signal_rows, ledger_rows
+
+
+class LedgerWriter:
+    """The process's single SQLite writer. Producers `put` parsed rows; one thread owns one
+    connection and commits whatever has queued up as a single transaction of `executemany`
+    inserts, so neither live batches nor a --reingest replay ever wait on each other's commits.
+    Queue order is insert order, and the ledger is INSERT OR IGNORE: first sighting still wins."""
+
+    def __init__(self) -> None:
+        self.stored = 0
+        self._q: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="ledger-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, signal_rows: list[tuple], ledger_rows: list[tuple]) -> None:
+        self._q.put((signal_rows, ledger_rows))
+
+    def close(self) -> int:
+        """Flush, stop, and return how many business rows were stored."""
+        self._q.put(None)
+        self._thread.join()
+        return self.stored
+
+    def _write(self, conn: sqlite3.Connection, items: list) -> None:
+        with conn:
+            conn.executemany(f"INSERT OR REPLACE INTO signals VALUES ({_SIGNAL_MARKS})",
+                             [row for sig, _ in items for row in sig])
             # INSERT OR IGNORE: first sighting wins, so re-finding an event never re-reports it.
-            conn.execute("INSERT OR IGNORE INTO ledger VALUES (?,?,?,?,?,?,?,?,?)",
-                         (key, s, month, date, label, desc, c, cite, cycle_at))
-        n += 1
-    conn.commit()
+            conn.executemany("INSERT OR IGNORE INTO ledger VALUES (?,?,?,?,?,?,?,?,?,?)",
+                             [row for _, led in items for row in led])
+        self.stored += sum(len(sig) for sig, _ in items)
+
+    def _loop(self) -> None:
+        conn = db()
+        try:
+            while True:
+                items = [self._q.get()]
+                while True:                  # group-commit everything already waiting
+                    try:
+                        items.append(self._q.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in items
+                items = [i for i in items if i is not None]
+                try:
+                    self._write(conn, items)
+                except sqlite3.Error as e:
+                    # One bad group must not lose the rest: retry run by run.
+                    log(f"  ledger write failed ({e}) — retrying {len(items)} run(s) singly")
+                    for item in items:
+                        try:
+                            self._write(conn, [item])
+                        except sqlite3.Error as e2:
+                            log(f"  ledger write dropped a run: {e2}")
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+
+def reingest(which: str, businesses: list[str]) -> int:
+    """Replay saved raw runs into the database (no API calls).
+
+    `which` is a cycle_at to rebuild that cycle, or "all" for the whole RUNS directory. A run
+    goes back into the cycle recorded for its run_id, else the cycle stamped by its file time.
+    The raw file does not keep its batch, so rows are matched against the whole watchlist.
+    """
+    conn = db()
+    recorded = dict(conn.execute(
+        "SELECT run_id, MIN(cycle_at) FROM signals WHERE run_id IS NOT NULL GROUP BY run_id"))
     conn.close()
-    return n
+    t0 = time.time()
+    writer = LedgerWriter()
+    runs = 0
+    for f in sorted(RUNS.glob("*.json"), key=lambda p: p.stat().st_mtime):
+        rid = f.stem
+        cycle_at = recorded.get(rid) or datetime.fromtimestamp(
+            f.stat().st_mtime, timezone.utc).isoformat()
+        if which != "all" and cycle_at != which:
+            continue
+        try:
+            res = json.loads(f.read_text())
+        except ValueError as e:
+            log(f"  {f.name}: unreadable ({e}) — skipped")
+            continue
+        writer.put(*parse_run(res, businesses, cycle_at, rid))
+        runs += 1
+    n = writer.close()
+    log(f"reingested {runs} run(s) -> {n} business rows in {time.time() - t0:.1f}s")
+    return runs
 
 
 def match_key(name: str, keys: list[str]) -> str | None:
@@ -378,8 +503,9 @@ def _extract(res: dict) -> tuple[list, dict]:
 def _tool_json(fn, payload: dict, what: str) -> dict | None:
     """Call a plugin tool and parse its JSON string, or return None and say why.
 
-    Each batch polls for minutes inside its own thread. An error body or a transport failure must
-    cost that batch, not the cycle — and it has to be visible in the log, not a dead thread.
+    Each batch is polled for minutes by the cycle's supervisor. An error body or a transport
+    failure must cost that batch, not the cycle — and it has to be visible in the log, not a
+    silently dead task.
     """
     try:
         return json.loads(fn(payload))
@@ -390,20 +516,58 @@ def _tool_json(fn, payload: dict, what: str) -> dict | None:
     return None
 
 
-def run_cycle(aid: str, businesses: list[str], cycle_at: str) -> int:
+class _PollBudget:
+    """Token bucket shared by every run's status polls (single event loop, so no lock)."""
+
+    def __init__(self, per_sec: float) -> None:
+        self.gap = 1.0 / per_sec
+        self.next = 0.0
+
+    async def take(self) -> None:
+        now = asyncio.get_running_loop().time()
+        at = max(now, self.next)
+        self.next = at + self.gap
+        if at > now:
+            await asyncio.sleep(at - now)
+
+
+def _store_run(idx: int, batch: list[str], rid: str, res: dict, cycle_at: str, secs: int,
+               writer: LedgerWriter) -> None:
+    (RUNS / f"{rid}.json").write_text(json.dumps(res, indent=1))   # raw BEFORE transform
+    rows, _ = _extract(res)
+    log(f"  batch{idx}: {len(rows)}/{len(batch)} rows in {secs}s")
+    writer.put(*parse_run(res, batch, cycle_at, rid))
+
+
+async def _supervise(aid: str, batches: list[list[str]], cycle_at: str) -> int:
+    """Start every batch, poll them all from this loop, and ingest each result as it lands.
+
+    Tool calls are blocking HTTP, so each one runs in a worker thread; the loop itself only
+    schedules. Results go through a queue to a single ingest task that parses them and hands the
+    rows to the LedgerWriter, so batch A is written to SQLite while batch B is still being polled.
+    """
     from hermes_nimble_agent import tools
 
-    batches = [businesses[i:i + BATCH_SIZE] for i in range(0, len(businesses), BATCH_SIZE)]
-    log(f"cycle {cycle_at[:19]}: {len(businesses)} businesses in {len(batches)} concurrent batches")
-    stored = [0]
-    lock = threading.Lock()
+    # One thread per batch (each has at most one call in flight) plus the ingester. The default
+    # executor is min(32, cpus + 4) — 6 on a 2-vCPU runner — so with dozens of batches, starts and
+    # status polls would queue behind slow result fetches. asyncio.run shuts this one down.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=len(batches) + 1, thread_name_prefix="hermes"))
+
+    budget = _PollBudget(STATUS_PER_SEC)
+    finished: list[float] = []          # seconds-to-inactive of runs done this cycle
+    results: asyncio.Queue = asyncio.Queue()
+    writer = LedgerWriter()
 
-    def work(idx: int, batch: list[str]) -> None:
+    async def call(fn, payload: dict, what: str) -> dict | None:
+        return await asyncio.to_thread(_tool_json, fn, payload, what)
+
+    async def run(idx: int, batch: list[str]) -> None:
         task = ("For each business below, report what has changed recently that a go-to-market team "
                 "should act on — leadership changes, funding, headcount movement, product launches, "
                 "pricing changes. One factual sentence per signal, null if unconfirmed.\n- "
                 + "\n- ".join(batch))
-        started = _tool_json(tools.nimble_agent_run_start,
+        started = await call(tools.nimble_agent_run_start,
                              {"agent_id": aid, "task": task, "effort": EFFORT},
                              f"batch{idx} start") or {}
         rid = started.get("run_id") or (started.get("run") or {}).get("run_id")
@@ -414,9 +578,16 @@ def run_cycle(aid: str, businesses: list[str], cycle_at: str) -> int:
 
         t0 = time.time()
         misses = 0
+        interval = POLL_MIN
+        polls = 0
         while True:
-            time.sleep(POLL)
-            st = _tool_json(tools.nimble_agent_run_status, {"agent_id": aid, "run_id": rid},
+            # Near the shortest finish seen this cycle: poll tight. Otherwise keep backing off.
+            if finished and time.time() - t0 + interval >= 0.8 * min(finished):
+                interval = POLL_MIN
+            await asyncio.sleep(interval)
+            await budget.take()
+            polls += 1
+            st = await call(tools.nimble_agent_run_status, {"agent_id": aid, "run_id": rid},
                             f"batch{idx} status")
             if st is None:
                 misses += 1
@@ -427,27 +598,43 @@ def run_cycle(aid: str, businesses: list[str], cycle_at: str) -> int:
             misses = 0
             if st.get("is_active", st.get("run", {}).get("is_active")) is False:
                 break
-            if time.time() - t0 > 2400:
+            if time.time() - t0 > RUN_TIMEOUT:
                 log(f"  batch{idx}: timeout")
                 return
+            interval = min(interval * 2, POLL)
 
-        res = _tool_json(tools.nimble_agent_run_result, {"agent_id": aid, "run_id": rid},
+        finished.append(time.time() - t0)
+        # Fetch the result the moment the run is seen inactive; ingest happens off this task.
+        res = await call(tools.nimble_agent_run_result, {"agent_id": aid, "run_id": rid},
                          f"batch{idx} result")
         if res is None:
             return
-        (RUNS / f"{rid}.json").write_text(json.dumps(res, indent=1))   # raw BEFORE transform
-        rows, trust = _extract(res)
-        log(f"  batch{idx}: {len(rows)}/{len(batch)} rows in {int(time.time()-t0)}s")
+        log(f"  batch{idx}: inactive after {int(finished[-1])}s, {polls} status polls")
+        await results.put((idx, batch, rid, res, int(time.time() - t0)))
+
+    async def ingester() -> None:
+        while (item := await results.get()) is not None:
+            idx, batch, rid, res, secs = item
+            try:
+                await asyncio.to_thread(_store_run, idx, batch, rid, res, cycle_at, secs, writer)
+            except Exception as e:           # one bad payload must not drop the other batches
+                log(f"  batch{idx}: ingest failed {type(e).__name__} {str(e)[:120]}")
+
+    ingest_task = asyncio.create_task(ingester())
+    outcomes = await asyncio.gather(*(run(i, b) for i, b in enumerate(batches)),
+                                    return_exceptions=True)
+    for idx, o in enumerate(outcomes):
+        if isinstance(o, Exception):
+            log(f"  batch{idx}: {type(o).__name__} {str(o)[:120]}")
+    await results.put(None)
+    await ingest_task
+    return await asyncio.to_thread(writer.close)
 
-        with lock:
-            stored[0] += ingest(res, batch, cycle_at, rid)
 
-    ths = [threading.Thread(target=work, args=(i, b)) for i, b in enumerate(batches)]
-    for t in ths:
-        t.start()
-    for t in ths:
-        t.join()
-    return stored[0]
+def run_cycle(aid: str, businesses: list[str], cycle_at: str) -> int:
+    batches = [businesses[i:i + BATCH_SIZE] for i in range(0, len(businesses), BATCH_SIZE)]
+    log(f"cycle {cycle_at[:19]}: {len(businesses)} businesses in {len(batches)} concurrent batches")
+    return asyncio.run(_supervise(aid, batches, cycle_at))
 
 
 # Must not match a RANGE: "lists 1,001-5,000 employees" would otherwise yield 5,000 as the count
@@ -465,25 +652,51 @@ def headcount_of(text: str) -> int | None:
     return int(m.group(1).replace(",", "")) if m else None
 
 
-def headcount_moved(business: str, description: str, event_month: str,
-                    conn: sqlite3.Connection) -> bool:
+def headcount_moved(now: int | None, old: int | None) -> bool:
     """`headcount_signal` reports current state ("1,965 employees today"), not a dated event, so it
     would otherwise surface every single month. Only report a MATERIAL move (>5%) against the most
-    recent earlier reading for that business."""
-    now = headcount_of(description)
-    if now is None:
+    recent earlier reading for that business. No prior reading -> a first observation is not a
+    change."""
+    if now is None or not old:
         return False
-    prev_rows = conn.execute(
-        "SELECT description FROM ledger WHERE business=? AND signal='headcount_signal' "
-        "AND event_month < ? ORDER BY event_month DESC LIMIT 3", (business, event_month)).fetchall()
-    for (d,) in prev_rows:
-        old = headcount_of(d)
-        if old is None:
-            continue
-        if old and abs(now - old) / old > 0.05:
-            return True
-        return False        # a prior reading exists and barely moved -> not news
-    return False            # no prior reading -> a first observation is not a change
+    return abs(now - old) / old > 0.05
+
+
+# Each headcount reading next to the most recent parsed reading among the business's three
+# previous ones — one pass of LAG instead of two lookups per row. The window only reads what it
+# needs: for each business with a new reportable reading, from the third reading before its
+# earliest one onwards, walking the primary key in event_month order. Undated rows are keyed
+# "unknown:<label>" and are never an earlier month, so they stay out of it.
+_NEW_SINCE = """
+WITH fresh AS (
+    SELECT business, MIN(event_month) AS first_new FROM ledger INDEXED BY ledger_event_date
+    WHERE signal = 'headcount_signal' AND event_date != 'unknown' AND event_date > ?1
+      AND COALESCE(confidence, 'low') != 'low'
+    GROUP BY business),
+span AS (
+    SELECT business, COALESCE((
+        SELECT event_month FROM ledger p
+        WHERE p.business = f.business AND p.signal = 'headcount_signal'
+          AND p.event_month < f.first_new
+        ORDER BY p.event_month DESC LIMIT 1 OFFSET 2), '') AS start
+    FROM fresh f),
+hc AS (
+    SELECT l.rowid AS rid, l.business, l.signal, l.event_date, l.description, l.confidence,
+           l.citation, l.first_seen_cycle, l.headcount,
+           COALESCE(LAG(l.headcount, 1) OVER w, LAG(l.headcount, 2) OVER w,
+                    LAG(l.headcount, 3) OVER w) AS prior
+    FROM span JOIN ledger l
+      ON l.business = span.business AND l.signal = 'headcount_signal'
+     AND l.event_month >= span.start AND l.event_date != 'unknown'
+    WINDOW w AS (PARTITION BY l.business ORDER BY l.event_month))
+SELECT business, signal, event_date, description, confidence, citation, first_seen_cycle,
+       headcount, prior
+FROM (SELECT * FROM hc WHERE event_date > ?1
+      UNION ALL
+      SELECT rowid, business, signal, event_date, description, confidence, citation,
+             first_seen_cycle, headcount, NULL FROM ledger
+      WHERE signal != 'headcount_signal' AND event_date != 'unknown' AND event_date > ?1)
+ORDER BY event_date DESC, rid"""
 
 
 def new_since(cutoff: str, cycle_at: str) -> list[dict]:
@@ -495,10 +708,8 @@ def new_since(cutoff: str, cycle_at: str) -> list[dict]:
     cries wolf is worse than one that stays quiet.
     """
     conn = db()
-    rows = conn.execute(
-        "SELECT business, signal, event_date, description, confidence, citation, first_seen_cycle, "
-        "event_month FROM ledger WHERE event_date != 'unknown' AND event_date > ? "
-        "ORDER BY event_date DESC", (cutoff[:10],)).fetchall()
+    rows = conn.execute(_NEW_SINCE, (cutoff[:10],)).fetchall()
+    conn.close()
     out = []
     for r in rows:
         # A `low` claim means unverified, not false. It stays in the ledger and in memory, but it
@@ -509,18 +720,10 @@ def new_since(cutoff: str, cycle_at: str) -> list[dict]:
         item = {"business": r[0], "kind": r[1], "event_date": r[2], "after": r[3],
                 "confidence": r[4], "source": r[5], "first_seen": r[6]}
         if r[1] == "headcount_signal":
-            if not headcount_moved(r[0], r[3], r[7], conn):
+            if not headcount_moved(r[7], r[8]):
                 continue
-            prior = conn.execute(
-                "SELECT description FROM ledger WHERE business=? AND signal='headcount_signal' "
-                "AND event_month < ? ORDER BY event_month DESC LIMIT 3", (r[0], r[7])).fetchall()
-            for (d,) in prior:
-                old = headcount_of(d)
-                if old is not None:
-                    item["moved_from"], item["moved_to"] = old, headcount_of(r[3])
-                    break
+            item["moved_from"], item["moved_to"] = r[8], r[7]
         out.append(item)
-    conn.close()
     return out
 
 
@@ -623,7 +826,7 @@ def main() -> int:
                     help="send the digest via `hermes send` (e.g. slack, telegram)")
     ap.add_argument("--limit", type=int, default=0, help="run only the first N businesses")
     ap.add_argument("--reingest", metavar="CYCLE_AT",
-                    help="rebuild a cycle from saved raw runs (no API calls)")
+                    help="rebuild a cycle from saved raw runs, or 'all' for every run (no API calls)")
     args = ap.parse_args()
 
     cfg_path = DATA / "monitor_config.json"
@@ -644,6 +847,10 @@ def main() -> int:
         cfg_path.write_text(json.dumps(cfg, indent=1))
         return 0
 
+    if args.reingest:
+        reingest(args.reingest, cfg.get("businesses", WATCHLIST))
+        return 0
+
     if not USE_LIVE:
         f = DATA / "sample_digest.txt"
         if not f.exists():